@@ -20,7 +20,7 @@ import argparse
 # Try to import cryptography
 try:
     from cryptography.hazmat.primitives import hashes, serialization
-    from cryptography.hazmat.primitives.asymmetric import padding
+    from cryptography.hazmat.primitives.asymmetric import ed25519, padding
     from cryptography.hazmat.backends import default_backend
 except ImportError:
     print("ERROR: cryptography package required. Install with: pip install cryptography")
@@ -62,11 +62,15 @@ def sign_challenge(challenge: str) -> str:
     """
     private_key = load_private_key()
     
-    signature = private_key.sign(
-        challenge.encode(),
-        padding.PKCS1v15(),
-        hashes.SHA256()
-    )
+    if isinstance(private_key, ed25519.Ed25519PrivateKey):
+        signature = private_key.sign(challenge.encode())
+    else:
+        # Legacy RSA keys
+        signature = private_key.sign(
+            challenge.encode(),
+            padding.PKCS1v15(),
+            hashes.SHA256()
+        )
     
     return base64.urlsafe_b64encode(signature).decode()
 
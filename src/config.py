@@ -44,10 +44,13 @@ except ImportError:
     print("[WARNING] SecureKeyManager not available. API keys will be stored in plain text.")
 
 
+_TRUE_VALUES = frozenset(("true", "1", "yes", "on"))
+
+
 def get_bool_env(key, default=False):
     """Helper to parse boolean env vars case-insensitively."""
-    val = os.getenv(key, str(default)).lower()
-    return val in ("true", "1", "yes", "on")
+    val = os.environ.get(key)
+    return bool(default) if val is None else val.lower() in _TRUE_VALUES
 
 
 def get_float_env(key, default=0.0):
@@ -263,6 +266,7 @@ INITIAL_WAIT = get_int_env("INITIAL_WAIT", 10)
 POST_ACTION_WAIT = get_int_env("POST_ACTION_WAIT", 10)
 SWITCH_QUESTION_WAIT = get_int_env("SWITCH_QUESTION_WAIT", 5)
 POLL_INTERVAL = get_int_env("POLL_INTERVAL", 3)
+POLL_INTERVAL_MAX = get_int_env("POLL_INTERVAL_MAX", 30)
 
 # =============================================================================
 # RETRY CONFIGURATION
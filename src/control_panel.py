@@ -23,6 +23,7 @@ CONFIG_VARS = [
     {"key": "POST_ACTION_WAIT", "type": "int", "desc": "Seconds to wait after an action"},
     {"key": "SWITCH_QUESTION_WAIT", "type": "int", "desc": "Seconds to wait when switching questions"},
     {"key": "POLL_INTERVAL", "type": "int", "desc": "Seconds between screen checks in Auto Mode"},
+    {"key": "POLL_INTERVAL_MAX", "type": "int", "desc": "Max seconds between checks while idle (backoff cap)"},
     {"key": "MAX_RETRIES", "type": "int", "desc": "Max retries for API calls"},
     {"key": "MOUSE_MOVE_DURATION", "type": "float", "desc": "Duration of mouse movement animation"},
     {"key": "HANDLE_DESCRIPTIVE_ANSWERS", "type": "bool", "desc": "Whether to handle descriptive questions"},
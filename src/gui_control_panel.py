@@ -75,6 +75,15 @@ CONFIG_SCHEMA = {
             "desc": "Poll Interval",
             "tooltip": "Seconds between screen checks in Auto Mode",
         },
+        {
+            "key": "POLL_INTERVAL_MAX",
+            "type": "int",
+            "default": 30,
+            "min": 1,
+            "max": 300,
+            "desc": "Max Poll Interval",
+            "tooltip": "Idle polling backs off up to this many seconds",
+        },
     ],
     "API & Retry": [
         {
@@ -296,6 +305,10 @@ class Theme:
     TOGGLE_THUMB = "#ffffff"
 
 
+# Tracks whether the main window is mapped; animations are skipped while hidden
+_app_visible = True
+
+
 # =============================================================================
 # CUSTOM WIDGETS
 # =============================================================================
@@ -312,6 +325,9 @@ class ToggleSwitch(tk.Canvas):
         self.command = command
         self.thumb_pos = self.width - 23 if variable.get() else 3
         
+        # Track geometry never changes after construction, so build it once
+        self._track_pts = self._build_rounded_rect_points(0, 0, self.width, self.height, 13)
+        
         self.bind("<Button-1>", self.toggle)
         self.variable.trace_add("write", self._on_variable_change)
         
@@ -323,15 +339,16 @@ class ToggleSwitch(tk.Canvas):
         
         # Background track
         bg_color = Theme.TOGGLE_ON if self.variable.get() else Theme.TOGGLE_OFF
-        self.create_rounded_rect(0, 0, self.width, self.height, 13, fill=bg_color, outline="")
+        self.create_polygon(self._track_pts, smooth=True, fill=bg_color, outline="", tags="track")
         
         # Thumb
         thumb_x = self.thumb_pos
         self.create_oval(thumb_x, 3, thumb_x + 20, 23, fill=Theme.TOGGLE_THUMB, outline="")
     
-    def create_rounded_rect(self, x1, y1, x2, y2, radius, **kwargs):
-        """Create a rounded rectangle"""
-        points = [
+    @staticmethod
+    def _build_rounded_rect_points(x1, y1, x2, y2, radius):
+        """Build the smoothed polygon points for a rounded rectangle"""
+        return (
             x1+radius, y1,
             x2-radius, y1,
             x2, y1,
@@ -344,8 +361,7 @@ class ToggleSwitch(tk.Canvas):
             x1, y2-radius,
             x1, y1+radius,
             x1, y1,
-        ]
-        return self.create_polygon(points, smooth=True, **kwargs)
+        )
     
     def toggle(self, event=None):
         """Toggle the switch state"""
@@ -360,6 +376,12 @@ class ToggleSwitch(tk.Canvas):
     
     def _animate_to(self, target):
         """Animate the thumb to target position"""
+        if not _app_visible or not self.winfo_viewable():
+            # Nobody can see the animation, so jump straight to the end state
+            self.thumb_pos = target
+            self._draw()
+            return
+        
         diff = target - self.thumb_pos
         if abs(diff) < 2:
             self.thumb_pos = target
@@ -407,7 +429,6 @@ class ModernEntry(tk.Frame):
         # Bind events
         self.entry.bind("<FocusIn>", self._on_focus_in)
         self.entry.bind("<FocusOut>", self._on_focus_out)
-        self.entry.bind("<KeyRelease>", self._on_key)
     
     def _on_focus_in(self, event):
         self.entry_frame.configure(bg=Theme.BORDER_FOCUS)
@@ -418,10 +439,6 @@ class ModernEntry(tk.Frame):
         self.label.configure(fg=Theme.TEXT_SECONDARY)
         if self.command:
             self.command()
-    
-    def _on_key(self, event):
-        # Auto-save on typing (debounced by focus out)
-        pass
 
 
 class ModernSpinbox(tk.Frame):
@@ -629,6 +646,10 @@ class StatusBar(tk.Frame):
     
     def flash_save(self):
         """Flash the save indicator"""
+        if not _app_visible or not self.winfo_viewable():
+            # No point scheduling the reset flash while the window is hidden
+            self._reset_save_indicator()
+            return
         self.save_indicator.configure(fg=Theme.ACCENT)
         self.save_text.configure(text="Saved!", fg=Theme.ACCENT)
         self.after(1000, self._reset_save_indicator)
@@ -662,9 +683,24 @@ class ControlPanelApp:
         self.env_path = PROJECT_ROOT / ".env"
         self.variables: Dict[str, tk.Variable] = {}
         self.save_pending = False
+        self._scroll_pending = False
         
         self._create_widgets()
         self._load_values()
+        
+        # Track window visibility so hidden widgets skip animation work
+        self.root.bind("<Map>", self._on_root_map, add="+")
+        self.root.bind("<Unmap>", self._on_root_unmap, add="+")
+    
+    def _on_root_map(self, event):
+        global _app_visible
+        if event.widget is self.root:
+            _app_visible = True
+    
+    def _on_root_unmap(self, event):
+        global _app_visible
+        if event.widget is self.root:
+            _app_visible = False
     
     def _create_widgets(self):
         """Create all UI widgets"""
@@ -793,12 +829,14 @@ class ControlPanelApp:
     
     def _create_section(self, section_name: str, variables: list):
         """Create a section with controls for each variable"""
+        BG_CARD = Theme.BG_CARD
+        BORDER = Theme.BORDER
         
         header = SectionHeader(self.content_frame, section_name)
         header.pack(fill="x")
         
         # Card container for this section
-        card = tk.Frame(self.content_frame, bg=Theme.BG_CARD, padx=16, pady=12)
+        card = tk.Frame(self.content_frame, bg=BG_CARD, padx=16, pady=12)
         card.pack(fill="x", padx=16, pady=(0, 8))
         
         # Special handling for the informational section
@@ -809,7 +847,7 @@ class ControlPanelApp:
         for i, var_config in enumerate(variables):
             if i > 0:
                 # Separator between items
-                sep = tk.Frame(card, bg=Theme.BORDER, height=1)
+                sep = tk.Frame(card, bg=BORDER, height=1)
                 sep.pack(fill="x", pady=12)
             
             self._create_control(card, var_config)
@@ -883,6 +921,10 @@ class ControlPanelApp:
     
     def _create_control(self, parent: tk.Frame, config: dict):
         """Create appropriate control widget based on variable type"""
+        # Bind theme colors locally; this runs once per config variable
+        BG_CARD = Theme.BG_CARD
+        TEXT_PRIMARY = Theme.TEXT_PRIMARY
+        TEXT_MUTED = Theme.TEXT_MUTED
         
         key = config["key"]
         var_type = config["type"]
@@ -891,21 +933,21 @@ class ControlPanelApp:
         tooltip = config.get("tooltip", "")
         
         # Create control row
-        row = tk.Frame(parent, bg=Theme.BG_CARD)
+        row = tk.Frame(parent, bg=BG_CARD)
         row.pack(fill="x", pady=4)
         
         if var_type == "bool":
             # Toggle switch layout
-            label_frame = tk.Frame(row, bg=Theme.BG_CARD)
+            label_frame = tk.Frame(row, bg=BG_CARD)
             label_frame.pack(side="left", fill="x", expand=True)
             
-            label = tk.Label(label_frame, text=desc, bg=Theme.BG_CARD,
-                           fg=Theme.TEXT_PRIMARY, font=("Segoe UI", 11))
+            label = tk.Label(label_frame, text=desc, bg=BG_CARD,
+                           fg=TEXT_PRIMARY, font=("Segoe UI", 11))
             label.pack(anchor="w")
             
             if tooltip:
-                hint = tk.Label(label_frame, text=tooltip, bg=Theme.BG_CARD,
-                              fg=Theme.TEXT_MUTED, font=("Segoe UI", 9))
+                hint = tk.Label(label_frame, text=tooltip, bg=BG_CARD,
+                              fg=TEXT_MUTED, font=("Segoe UI", 9))
                 hint.pack(anchor="w")
             
             var = tk.BooleanVar(value=default)
@@ -934,8 +976,8 @@ class ControlPanelApp:
                 slider.pack(fill="x")
                 
                 if tooltip:
-                    hint = tk.Label(row, text=tooltip, bg=Theme.BG_CARD,
-                                  fg=Theme.TEXT_MUTED, font=("Segoe UI", 9))
+                    hint = tk.Label(row, text=tooltip, bg=BG_CARD,
+                                  fg=TEXT_MUTED, font=("Segoe UI", 9))
                     hint.pack(anchor="w")
             else:
                 spinbox = ModernSpinbox(
@@ -945,8 +987,8 @@ class ControlPanelApp:
                 spinbox.pack(fill="x")
                 
                 if tooltip:
-                    hint = tk.Label(row, text=tooltip, bg=Theme.BG_CARD,
-                                  fg=Theme.TEXT_MUTED, font=("Segoe UI", 9))
+                    hint = tk.Label(row, text=tooltip, bg=BG_CARD,
+                                  fg=TEXT_MUTED, font=("Segoe UI", 9))
                     hint.pack(anchor="w", pady=(4, 0))
         
         elif var_type == "password":
@@ -958,8 +1000,8 @@ class ControlPanelApp:
             entry.pack(fill="x")
             
             if tooltip:
-                hint = tk.Label(row, text=tooltip, bg=Theme.BG_CARD,
-                              fg=Theme.TEXT_MUTED, font=("Segoe UI", 9))
+                hint = tk.Label(row, text=tooltip, bg=BG_CARD,
+                              fg=TEXT_MUTED, font=("Segoe UI", 9))
                 hint.pack(anchor="w", pady=(4, 0))
         
         else:  # str
@@ -971,12 +1013,20 @@ class ControlPanelApp:
             entry.pack(fill="x")
             
             if tooltip:
-                hint = tk.Label(row, text=tooltip, bg=Theme.BG_CARD,
-                              fg=Theme.TEXT_MUTED, font=("Segoe UI", 9))
+                hint = tk.Label(row, text=tooltip, bg=BG_CARD,
+                              fg=TEXT_MUTED, font=("Segoe UI", 9))
                 hint.pack(anchor="w", pady=(4, 0))
     
     def _on_frame_configure(self, event):
-        """Update scroll region when content changes"""
+        """Schedule a scroll region update when content changes"""
+        # Configure events arrive in bursts; coalesce them into one bbox pass
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.canvas.after_idle(self._update_scrollregion)
+    
+    def _update_scrollregion(self):
+        """Recompute the scroll region from the canvas contents"""
+        self._scroll_pending = False
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
     
     def _on_canvas_configure(self, event):
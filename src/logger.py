@@ -1,6 +1,11 @@
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
 from datetime import datetime
 
 try:
@@ -11,6 +16,14 @@ except ImportError:
     # Fallback log dir if config fails
     LOGS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "_runtime", "logs")
 
+# Create logs directory if it doesn't exist (handled in config but safe to ensure)
+os.makedirs(LOGS_DIR, exist_ok=True)
+
+# One log file per process, shared by every named logger
+_SESSION_LOG_FILE = os.path.join(
+    LOGS_DIR, f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+)
+
 
 class SafeStreamHandler(logging.StreamHandler):
     """
@@ -38,30 +51,78 @@ class SafeStreamHandler(logging.StreamHandler):
             self.handleError(record)
 
 
-def get_logger(name):
-    # Create logs directory if it doesn't exist (handled in config but safe to ensure)
-    os.makedirs(LOGS_DIR, exist_ok=True)
+class BufferedFileHandler(logging.FileHandler):
+    """
+    A FileHandler that writes through a large buffer instead of flushing
+    after every record. Meant to be driven by a FlushingQueueListener, which
+    flushes it whenever the log queue runs dry, so bursts of records turn
+    into a single write syscall.
+    """
+    def __init__(self, filename, buffer_size=65536, **kwargs):
+        self.buffer_size = buffer_size
+        super().__init__(filename, **kwargs)
 
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding,
+                    errors=self.errors, buffering=self.buffer_size)
 
-    # Generate log filename with timestamp
-    log_file = os.path.join(
-        LOGS_DIR, f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-    )
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
+
+class FlushingQueueListener(logging.handlers.QueueListener):
+    """A QueueListener that flushes its handlers each time the queue drains."""
+    def dequeue(self, block):
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.queue.get(block)
+
+
+# A single background listener writes the session log; loggers only enqueue records.
+_queue_handler = None
+_queue_handler_lock = threading.Lock()
+
+
+def _get_file_queue_handler():
+    """Return the QueueHandler feeding the background session log writer."""
+    global _queue_handler
+    with _queue_handler_lock:
+        if _queue_handler is None:
+            file_handler = BufferedFileHandler(_SESSION_LOG_FILE, encoding="utf-8", delay=True)
+            file_handler.setLevel(logging.DEBUG)
+            file_formatter = logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            )
+            file_handler.setFormatter(file_formatter)
+
+            log_queue = queue.SimpleQueue()
+            listener = FlushingQueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            listener.start()
+            # Drain the queue before logging.shutdown() flushes and closes handlers
+            atexit.register(listener.stop)
+
+            _queue_handler = logging.handlers.QueueHandler(log_queue)
+        return _queue_handler
+
+
+@functools.lru_cache(maxsize=None)
+def get_logger(name):
+    # Cached per name: handlers are attached exactly once
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
 
-    # Clean existing handlers to avoid duplicates
-    if logger.hasHandlers():
-        logger.handlers.clear()
-
-    # File Handler
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
-    file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    file_handler.setFormatter(file_formatter)
+    # File Handler - records are queued and written by a background thread
+    file_handler = _get_file_queue_handler()
 
     # Console Handler - Use SafeStreamHandler to handle Unicode gracefully
     console_handler = SafeStreamHandler(sys.stdout)
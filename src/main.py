@@ -2,8 +2,15 @@ import sys
 import time
 import traceback
 import random
+import threading
+import contextlib
+import collections
+import functools
+import queue
+import zlib
 
 import mss
+import numpy as np
 import pyautogui
 from PIL import Image
 
@@ -35,20 +42,32 @@ from .runtime_config import (
     get_config,
     reload_config,
     check_config_changes,
+    register_config_callback,
+    watch_config_changes,
 )
 
 from .gemini import get_gemini_response, get_gemini_response_multi_image
 from .logger import get_logger
+from .utils import clipboard_watcher
 from .utils.desktop_manager import switch_to_input_desktop, type_text_human_like
 from .utils.mouse import click_at, move_away_from_options, simulate_reading_pause, reset_fatigue
-from .utils.screen import find_text_coordinates
+from .utils.screen import find_text_coordinates, find_text_coordinates_many
 from .updater import check_and_update
 
 logger = get_logger("Main")
 
+# Log level below DEBUG for per-keystroke chatter; filtered out by default
+TRACE = 5
+
 
 # State Variables
 last_processed_question = None
+# Fingerprint of the frame that produced last_processed_question
+_last_frame_hash = None
+
+# Grayscale size hashed by _frame_fingerprint; fine enough that changed
+# question text always alters some pixels
+FRAME_FINGERPRINT_SIZE = (160, 90)
 
 # =============================================================================
 # RUNTIME MODE STATE (can be toggled at runtime)
@@ -67,15 +86,17 @@ def toggle_mode():
     is_manual_mode = not is_manual_mode
     
     mode_name = "MANUAL (Hotkeys Only)" if is_manual_mode else "AUTO (Loop)"
-    logger.info(f"MODE SWITCHED to: {mode_name}")
     
+    # One record per banner: a single formatter pass and handler round-trip
+    lines = [f"MODE SWITCHED to: {mode_name}"]
     if is_manual_mode:
-        logger.info("Now in MANUAL MODE - Only hotkey triggers will work.")
-        logger.info("Multi-Select MCQ is available in MANUAL mode only.")
+        lines.append("Now in MANUAL MODE - Only hotkey triggers will work.")
+        lines.append("Multi-Select MCQ is available in MANUAL mode only.")
     else:
-        logger.info("Now in AUTO MODE - Screen polling active.")
-        logger.info("MCQ and Descriptive questions will be auto-detected.")
-        logger.info("Note: Multi-Select MCQ is NOT available in AUTO mode.")
+        lines.append("Now in AUTO MODE - Screen polling active.")
+        lines.append("MCQ and Descriptive questions will be auto-detected.")
+        lines.append("Note: Multi-Select MCQ is NOT available in AUTO mode.")
+    logger.info("\n".join(lines))
 
 
 def log_current_mode_info():
@@ -87,14 +108,17 @@ def log_current_mode_info():
     hotkey_clipboard = get_config("HOTKEY_CLIPBOARD", "c")
     hotkey_toggle = get_config("HOTKEY_TOGGLE_MODE", "t")
     
-    logger.info(f"Press '{hotkey_mcq}' THREE TIMES for MCQ search.")
-    logger.info(f"Press '{hotkey_long_mcq}' THREE TIMES for Long/Scrolling MCQ.")
+    lines = [
+        f"Press '{hotkey_mcq}' THREE TIMES for MCQ search.",
+        f"Press '{hotkey_long_mcq}' THREE TIMES for Long/Scrolling MCQ.",
+    ]
     if is_manual_mode:
-        logger.info(f"Press '{hotkey_multi_mcq}' THREE TIMES for Multi-Select MCQ search.")
-    logger.info(f"Press '{hotkey_descriptive}' THREE TIMES for Descriptive search.")
-    logger.info(f"Press '{hotkey_clipboard}' THREE TIMES for Clipboard Stream.")
-    logger.info(f"Press '{hotkey_toggle}' THREE TIMES to toggle MANUAL/AUTO mode.")
-    logger.info("Note: Any other key press between the 3 presses will reset the count.")
+        lines.append(f"Press '{hotkey_multi_mcq}' THREE TIMES for Multi-Select MCQ search.")
+    lines.append(f"Press '{hotkey_descriptive}' THREE TIMES for Descriptive search.")
+    lines.append(f"Press '{hotkey_clipboard}' THREE TIMES for Clipboard Stream.")
+    lines.append(f"Press '{hotkey_toggle}' THREE TIMES to toggle MANUAL/AUTO mode.")
+    lines.append("Note: Any other key press between the 3 presses will reset the count.")
+    logger.info("\n".join(lines))
 
 
 # =============================================================================
@@ -118,7 +142,9 @@ class TriplePressTracker:
         self.last_key = None
         self.press_count = 0
         self.hotkey_actions = {}  # Maps key -> action function
-        self.registered_keys = set()  # Keys we're tracking
+        self.registered_keys = frozenset()  # Keys we're tracking
+        # Maps raw key names as emitted by `keyboard` -> lower-cased hotkey
+        self._canonical = {}
     
     def register_hotkey(self, key: str, action):
         """
@@ -127,7 +153,9 @@ class TriplePressTracker:
         """
         key_lower = key.lower()
         self.hotkey_actions[key_lower] = action
-        self.registered_keys.add(key_lower)
+        self.registered_keys = self.registered_keys | {key_lower}
+        for variant in (key, key_lower, key.upper()):
+            self._canonical[variant] = key_lower
         logger.debug(f"Registered triple-press hotkey: '{key}' (press 3x to trigger)")
     
     def unregister_hotkey(self, key: str):
@@ -135,77 +163,286 @@ class TriplePressTracker:
         key_lower = key.lower()
         if key_lower in self.hotkey_actions:
             del self.hotkey_actions[key_lower]
-        self.registered_keys.discard(key_lower)
+        self.registered_keys = self.registered_keys - {key_lower}
+        self._canonical = {
+            raw: canon for raw, canon in self._canonical.items() if canon != key_lower
+        }
         logger.debug(f"Unregistered hotkey: '{key}'")
     
     def clear_all(self):
         """Clear all registered hotkeys for reconfiguration."""
         self.hotkey_actions.clear()
-        self.registered_keys.clear()
+        self.registered_keys = frozenset()
+        self._canonical = {}
         self.last_key = None
         self.press_count = 0
         logger.debug("Cleared all registered hotkeys")
     
+    def drain(self, events):
+        """
+        Process every key event currently queued in `events` in one pass.
+        Called from the hotkey worker thread, not the keyboard hook.
+        """
+        popleft = events.popleft
+        while True:
+            try:
+                event = popleft()
+            except IndexError:
+                return
+            self.on_key_press(event)
+    
     def on_key_press(self, event):
         """
         Called on every key press. Tracks consecutive presses
         and triggers action when count reaches 3.
         """
-        key_name = event.name.lower() if hasattr(event, 'name') else str(event).lower()
+        key_name = self._canonical.get(event.name)
         
-        # Check if this is a registered hotkey
-        if key_name in self.registered_keys:
-            if key_name == self.last_key:
-                # Same key pressed again - increment count
-                self.press_count += 1
-                logger.debug(f"Hotkey '{key_name}' pressed {self.press_count}/3")
-                
-                if self.press_count >= 3:
-                    # Triple press achieved! Trigger the action
-                    logger.info(f"Triple-press detected for '{key_name}' - triggering action!")
-                    self.press_count = 0
-                    self.last_key = None
-                    
-                    # Execute the action
-                    action = self.hotkey_actions.get(key_name)
-                    if action:
-                        try:
-                            action()
-                        except Exception as e:
-                            logger.error(f"Error executing hotkey action: {e}")
-            else:
-                # Different registered key - start new count
-                self.last_key = key_name
-                self.press_count = 1
-                logger.debug(f"Hotkey '{key_name}' pressed 1/3")
-        else:
+        if key_name is None:
             # Non-registered key pressed - reset tracking
             if self.press_count > 0:
-                logger.debug(f"Non-hotkey '{key_name}' pressed - resetting count")
+                logger.log(TRACE, "Non-hotkey '%s' pressed - resetting count", event.name)
             self.last_key = None
             self.press_count = 0
+            return
+        
+        if key_name == self.last_key:
+            # Same key pressed again - increment count
+            self.press_count += 1
+            logger.log(TRACE, "Hotkey '%s' pressed %d/3", key_name, self.press_count)
+            
+            if self.press_count >= 3:
+                # Triple press achieved! Trigger the action
+                logger.info(f"Triple-press detected for '{key_name}' - triggering action!")
+                self.press_count = 0
+                self.last_key = None
+                
+                # Execute the action
+                action = self.hotkey_actions.get(key_name)
+                if action:
+                    try:
+                        action()
+                    except Exception as e:
+                        logger.error(f"Error executing hotkey action: {e}")
+        else:
+            # Different registered key - start new count
+            self.last_key = key_name
+            self.press_count = 1
+            logger.log(TRACE, "Hotkey '%s' pressed 1/3", key_name)
 
 
 # Global tracker instance
 triple_press_tracker = TriplePressTracker()
 
+# Key-down events queued by the keyboard hook and drained in batches by
+# the hotkey worker, so the hook callback itself does almost no work.
+_key_events = collections.deque(maxlen=256)
+_key_events_ready = threading.Event()
+# Set when a HOTKEY_* value changes outside the GUI reload path; the hotkey
+# worker re-registers before its next drain so only it mutates the tracker
+_hotkeys_stale = threading.Event()
+
+HOTKEY_CONFIG_KEYS = (
+    "HOTKEY_MCQ",
+    "HOTKEY_MULTI_MCQ",
+    "HOTKEY_LONG_MCQ",
+    "HOTKEY_DESCRIPTIVE",
+    "HOTKEY_CLIPBOARD",
+    "HOTKEY_TOGGLE_MODE",
+)
+
+
+def _enqueue_key_event(event):
+    """keyboard hook callback: queue key-down events and return immediately."""
+    if event.event_type == keyboard.KEY_DOWN:
+        _key_events.append(event)
+        _key_events_ready.set()
+
+
+def _mark_hotkeys_stale(*_):
+    """Config callback: ask the hotkey worker to re-register the hotkeys."""
+    _hotkeys_stale.set()
+    _key_events_ready.set()
+
+
+def _drain_key_events():
+    """Re-register hotkeys if their config changed, then process queued key events."""
+    if _hotkeys_stale.is_set():
+        _hotkeys_stale.clear()
+        register_all_hotkeys()
+    triple_press_tracker.drain(_key_events)
+
+
+def _hotkey_worker():
+    """Wait for queued key events and feed them to the triple-press tracker."""
+    while True:
+        _key_events_ready.wait()
+        _key_events_ready.clear()
+        _drain_key_events()
+
+
+# =============================================================================
+# SCREEN CAPTURE
+# =============================================================================
+# mss instances hold OS display handles and are not safe to share across
+# threads, so each thread (main loop, hotkey callbacks) keeps its own one open.
+_sct_local = threading.local()
+
+
+def _get_sct():
+    """
+    Return this thread's persistent mss instance and primary monitor.
+    The instance is opened once and reused for every capture.
+    """
+    sct = getattr(_sct_local, "sct", None)
+    if sct is None:
+        stack = contextlib.ExitStack()
+        sct = stack.enter_context(mss.mss())
+        _sct_local.stack = stack
+        _sct_local.sct = sct
+        _sct_local.monitor = sct.monitors[1]
+        atexit.register(stack.close)
+    return sct, _sct_local.monitor
+
+
+def _grab_screenshot(sct, monitor):
+    """
+    Grab the given monitor and return it as an RGB PIL image.
+    Decodes straight from mss's raw BGRA buffer; the ``bgra`` property
+    would first copy the whole frame into a new bytes object.
+    """
+    sct_img = sct.grab(monitor)
+    return Image.frombuffer("RGB", sct_img.size, sct_img.raw, "raw", "BGRX", 0, 1)
+
+
+def _frame_fingerprint(image):
+    """
+    CRC32 of a grayscale box-downsample of a screenshot, used to detect an
+    unchanged screen without a Gemini round-trip. Exact match only: two
+    questions on the same page template differ in few pixels, so any
+    tolerance would treat the next question as the same screen.
+    """
+    small = image.resize(FRAME_FINGERPRINT_SIZE, Image.BOX).convert("L")
+    return zlib.crc32(small.tobytes())
+
+
+def _monitor_geometry(monitor):
+    """
+    Scale and offset that map Gemini's 0-1000 coordinates onto the monitor,
+    as (sx, sy, ox, oy). The half of the (min + max) midpoint is folded into
+    the scale. Memoized per thread for the monitor dict returned by _get_sct().
+    """
+    cached = getattr(_sct_local, "geometry", None)
+    if cached is None or cached[0] is not monitor:
+        cached = (
+            monitor,
+            monitor["width"] / 2000,
+            monitor["height"] / 2000,
+            monitor["left"],
+            monitor["top"],
+        )
+        _sct_local.geometry = cached
+    return cached[1:]
+
+
+def _bbox_centers(bboxes, monitor):
+    """
+    Convert Gemini's normalized [ymin, xmin, ymax, xmax] boxes (0-1000) into
+    absolute screen centers in one vectorized pass.
+    Returns a list aligned with bboxes; entries that are not a 4-value box map to None.
+    """
+    valid = [bool(b) and len(b) == 4 for b in bboxes]
+    if not any(valid):
+        return [None] * len(bboxes)
+
+    sx, sy, ox, oy = _monitor_geometry(monitor)
+    boxes = np.array(
+        [b if ok else (0, 0, 0, 0) for b, ok in zip(bboxes, valid)], dtype=np.float64
+    )
+    cx = ((boxes[:, 1] + boxes[:, 3]) * sx).astype(np.int64) + ox
+    cy = ((boxes[:, 0] + boxes[:, 2]) * sy).astype(np.int64) + oy
+    return [
+        (x, y) if ok else None for x, y, ok in zip(cx.tolist(), cy.tolist(), valid)
+    ]
+
+
+def _close_sct():
+    """Close this thread's cached mss instance, if any."""
+    stack = getattr(_sct_local, "stack", None)
+    _sct_local.__dict__.clear()
+    if stack is not None:
+        stack.close()
+
+
+# =============================================================================
+# DEVELOPER SCREENSHOT DUMPS
+# =============================================================================
+# PNG encoding is slow, so dumps are written off the capture path. The queue is
+# bounded and frames are dropped when it is full rather than stalling capture.
+_screenshot_queue = queue.Queue(maxsize=4)
+_screenshot_writer_thread = None
+
+
+def _screenshot_writer():
+    """Encode and write queued (path, image) pairs until a None sentinel arrives."""
+    while True:
+        item = _screenshot_queue.get()
+        if item is None:
+            break
+        path, image = item
+        try:
+            image.save(path, optimize=False, compress_level=1)
+        except Exception as e:
+            logger.error(f"Failed to save screenshot {path}: {e}")
+
+
+def _save_screenshot_async(image, path):
+    """Queue a screenshot dump; drops the frame if the writer is behind."""
+    global _screenshot_writer_thread
+    if _screenshot_writer_thread is None:
+        _screenshot_writer_thread = threading.Thread(
+            target=_screenshot_writer, name="ScreenshotWriter", daemon=True
+        )
+        _screenshot_writer_thread.start()
+        atexit.register(_stop_screenshot_writer)
+    try:
+        _screenshot_queue.put_nowait((path, image.copy()))
+    except queue.Full:
+        logger.debug("Screenshot queue full, dropping frame.")
+
+
+def _stop_screenshot_writer():
+    """Flush pending dumps, waiting at most one second."""
+    global _screenshot_writer_thread
+    thread = _screenshot_writer_thread
+    if thread is None:
+        return
+    _screenshot_writer_thread = None
+    try:
+        _screenshot_queue.put(None, timeout=1)
+    except queue.Full:
+        return
+    thread.join(timeout=1)
+
+
 def create_pid_file():
     """Creates a PID file for the current process."""
     pid_path = os.path.join(RUNTIME_DIR, "app.pid")
     try:
-        with open(pid_path, "w") as f:
-            f.write(str(os.getpid()))
+        fd = os.open(pid_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, str(os.getpid()).encode())
+        finally:
+            os.close(fd)
     except Exception as e:
         logger.error(f"Failed to create PID file: {e}")
 
 def remove_pid_file():
     """Removes the PID file on exit."""
-    pid_path = os.path.join(RUNTIME_DIR, "app.pid")
-    if os.path.exists(pid_path):
-        try:
-            os.remove(pid_path)
-        except Exception:
-            pass
+    try:
+        os.unlink(os.path.join(RUNTIME_DIR, "app.pid"))
+    except Exception:
+        pass  # Already gone (FileNotFoundError) or not ours to remove
 
 
 
@@ -216,7 +453,7 @@ def process_screen_cycle(mode_hint=None, bypass_idempotency=False):
     bypass_idempotency: If True, ignores whether the question was seen before.
     Returns: (bool action_taken, str question_text)
     """
-    global last_processed_question
+    global last_processed_question, _last_frame_hash
 
     # 0. Ensure we are on the active desktop
     if not switch_to_input_desktop():
@@ -225,15 +462,19 @@ def process_screen_cycle(mode_hint=None, bypass_idempotency=False):
         )
 
     # 1. Capture Screen
-    with mss.mss() as sct:
-        monitor = sct.monitors[1]
-        sct_img = sct.grab(monitor)
-        screenshot = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
+    sct, monitor = _get_sct()
+    screenshot = _grab_screenshot(sct, monitor)
 
     if DEVELOPER_MODE and DEV_SAVE_SCREENSHOTS:
         timestamp = str(int(time.time()))
         path = os.path.join(SCREENSHOTS_DIR, f"screen_{timestamp}.png")
-        screenshot.save(path)
+        _save_screenshot_async(screenshot, path)
+
+    # Skip the API round-trip if the screen still shows the last processed question
+    frame_hash = _frame_fingerprint(screenshot)
+    if not bypass_idempotency and frame_hash == _last_frame_hash:
+        logger.debug("Screen unchanged since last processed question. Skipping.")
+        return False, last_processed_question
 
     # 2. Gemini Analysis
     logger.debug(f"Analyzing screen (Hint: {mode_hint})...")
@@ -258,6 +499,7 @@ def process_screen_cycle(mode_hint=None, bypass_idempotency=False):
         and question_text == last_processed_question
     ):
         logger.info("Same question detected. Skipping.")
+        _last_frame_hash = frame_hash
         return False, last_processed_question
 
     # For MULTI_MCQ, answers are in an array; for others, use answer_text
@@ -302,13 +544,9 @@ def process_screen_cycle(mode_hint=None, bypass_idempotency=False):
             action_taken = True
         else:
             # Failsafe
-            bbox = gemini_result.get("bbox")
-            if bbox and len(bbox) == 4:
-                ymin, xmin, ymax, xmax = bbox
-                monitor_w, monitor_h = monitor["width"], monitor["height"]
-
-                center_x = int(((xmin + xmax) / 2 / 1000) * monitor_w) + monitor["left"]
-                center_y = int(((ymin + ymax) / 2 / 1000) * monitor_h) + monitor["top"]
+            center = _bbox_centers([gemini_result.get("bbox")], monitor)[0]
+            if center:
+                center_x, center_y = center
                 
                 # Simulate human reading/thinking before clicking
                 simulate_reading_pause(0.3, 1.2)
@@ -323,17 +561,22 @@ def process_screen_cycle(mode_hint=None, bypass_idempotency=False):
     # --- MULTI_MCQ LOGIC (Multiple Correct Answers) ---
     elif q_type == "MULTI_MCQ":
         logger.info(f"Processing MULTI_MCQ with {len(answers_list)} answers...")
-        monitor_w, monitor_h = monitor["width"], monitor["height"]
+        
+        # OCR the frame once and match every answer against the same words
+        coords_list = find_text_coordinates_many(
+            screenshot, [a.get("answer_text", "") for a in answers_list]
+        )
+        # Failsafe click targets for every answer, resolved up front
+        bbox_centers = _bbox_centers([a.get("bbox", []) for a in answers_list], monitor)
         
         clicked_count = 0
         for idx, answer_item in enumerate(answers_list):
             ans_text = answer_item.get("answer_text", "")
-            ans_bbox = answer_item.get("bbox", [])
             
             logger.info(f"  [{idx + 1}/{len(answers_list)}] Target: '{ans_text[:40]}...'")
             
             # Try to find text coordinates first
-            coordinates = find_text_coordinates(screenshot, ans_text)
+            coordinates = coords_list[idx]
             
             if coordinates:
                 x, y = coordinates
@@ -350,11 +593,9 @@ def process_screen_cycle(mode_hint=None, bypass_idempotency=False):
                 # Brief pause between clicks (human-like)
                 if idx < len(answers_list) - 1:
                     time.sleep(random.uniform(0.4, 0.8))
-            elif ans_bbox and len(ans_bbox) == 4:
+            elif bbox_centers[idx]:
                 # Failsafe: use bounding box
-                ymin, xmin, ymax, xmax = ans_bbox
-                center_x = int(((xmin + xmax) / 2 / 1000) * monitor_w) + monitor["left"]
-                center_y = int(((ymin + ymax) / 2 / 1000) * monitor_h) + monitor["top"]
+                center_x, center_y = bbox_centers[idx]
                 
                 # Simulate human reading/thinking before clicking
                 simulate_reading_pause(0.3, 1.0)
@@ -380,28 +621,10 @@ def process_screen_cycle(mode_hint=None, bypass_idempotency=False):
     elif q_type == "DESCRIPTIVE" and get_config("ENABLE_DETAILED_MODE", True):
         if "bbox" in gemini_result and gemini_result["bbox"]:
             logger.info("Clicking text area to focus...")
-            bbox = gemini_result["bbox"]
-            if len(bbox) == 4:
-                ymin, xmin, ymax, xmax = bbox
-                monitor = mss.mss().monitors[
-                    1
-                ]  # We need to re-get monitor dims or cache them.
-                # Actually 'monitor' var is local to Capture block. We need to handle this cleaner.
-                # Re-invoking mss here is cheap enough or we should move monitor to outer scope.
-                # Let's just grab valid monitor info again purely for dimension calculation.
-                with mss.mss() as sct_temp:
-                    monitor_temp = sct_temp.monitors[1]
-                    monitor_w, monitor_h = monitor_temp["width"], monitor_temp["height"]
-                    center_x = (
-                        int(((xmin + xmax) / 2 / 1000) * monitor_w)
-                        + monitor_temp["left"]
-                    )
-                    center_y = (
-                        int(((ymin + ymax) / 2 / 1000) * monitor_h)
-                        + monitor_temp["top"]
-                    )
-                    click_at(center_x, center_y)
-                    time.sleep(0.5)
+            center = _bbox_centers([gemini_result["bbox"]], monitor)[0]
+            if center:
+                click_at(*center)
+                time.sleep(0.5)
 
         type_text_human_like(
             answer_text,
@@ -412,6 +635,7 @@ def process_screen_cycle(mode_hint=None, bypass_idempotency=False):
 
     if action_taken and question_text:
         last_processed_question = question_text
+        _last_frame_hash = frame_hash
 
     return action_taken, last_processed_question
 
@@ -435,31 +659,52 @@ def manual_trigger(mode_hint):
     logger.info("Returning to silent background mode...")
 
 
+@functools.lru_cache(maxsize=1)
+def _clipboard_backend():
+    """
+    Resolve the clipboard backend once, on first use.
+    Returns ("win32", module), ("pyperclip", module) or (None, None).
+    """
+    try:
+        import win32clipboard
+        return "win32", win32clipboard
+    except ImportError:
+        pass
+    try:
+        import pyperclip
+        return "pyperclip", pyperclip
+    except ImportError:
+        logger.error("Neither win32clipboard nor pyperclip available. Install pywin32 or pyperclip.")
+        return None, None
+
+
 def get_clipboard_content():
     """
     Get the current clipboard content.
     Returns the text content or None if clipboard is empty or not text.
     """
+    # Served from memory when the WM_CLIPBOARDUPDATE listener is running
+    if clipboard_watcher.is_running():
+        return clipboard_watcher.latest()
+
+    backend, module = _clipboard_backend()
+    if backend is None:
+        return None
+
     try:
-        import win32clipboard
-        win32clipboard.OpenClipboard()
+        if backend == "pyperclip":
+            return module.paste()
+
+        module.OpenClipboard()
         try:
-            if win32clipboard.IsClipboardFormatAvailable(win32clipboard.CF_UNICODETEXT):
-                data = win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
+            if module.IsClipboardFormatAvailable(module.CF_UNICODETEXT):
+                data = module.GetClipboardData(module.CF_UNICODETEXT)
                 return data
-            elif win32clipboard.IsClipboardFormatAvailable(win32clipboard.CF_TEXT):
-                data = win32clipboard.GetClipboardData(win32clipboard.CF_TEXT)
+            elif module.IsClipboardFormatAvailable(module.CF_TEXT):
+                data = module.GetClipboardData(module.CF_TEXT)
                 return data.decode('utf-8', errors='ignore')
         finally:
-            win32clipboard.CloseClipboard()
-    except ImportError:
-        # Fallback to pyperclip if win32clipboard not available
-        try:
-            import pyperclip
-            return pyperclip.paste()
-        except ImportError:
-            logger.error("Neither win32clipboard nor pyperclip available. Install pywin32 or pyperclip.")
-            return None
+            module.CloseClipboard()
     except Exception as e:
         logger.error(f"Failed to read clipboard: {e}")
         return None
@@ -535,45 +780,43 @@ def long_mcq_trigger():
     
     screenshots = []
     
-    with mss.mss() as sct:
-        monitor = sct.monitors[1]
+    sct, monitor = _get_sct()
+    
+    for page_num in range(MAX_PAGES):
+        # Capture current screen
+        screenshot = _grab_screenshot(sct, monitor)
+        screenshots.append(screenshot)
         
-        for page_num in range(MAX_PAGES):
-            # Capture current screen
-            sct_img = sct.grab(monitor)
-            screenshot = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
-            screenshots.append(screenshot)
-            
-            logger.info(f"📸 Captured page {page_num + 1}/{MAX_PAGES}")
-            
-            # Save screenshot in developer mode
-            if DEVELOPER_MODE and DEV_SAVE_SCREENSHOTS:
-                timestamp = str(int(time.time() * 1000))
-                path = os.path.join(SCREENSHOTS_DIR, f"long_mcq_{timestamp}_page{page_num + 1}.png")
-                screenshot.save(path)
-            
-            # Check if this might be the last page (look for options pattern)
-            # We'll send to Gemini after we have at least 2 screenshots
-            # and ask it to check if options are visible
-            if page_num >= 1:
-                # Quick check: Ask Gemini if answer options are visible in the last screenshot
-                logger.debug("Checking if answer options are visible...")
-                try:
-                    quick_check = get_gemini_response(
-                        screenshot,
-                        enable_detailed_mode=False,
-                        question_type_hint="MCQ"
-                    )
-                    if quick_check and quick_check.get("type") == "MCQ" and quick_check.get("answer_text"):
-                        logger.info("✓ Answer options detected! Stopping scroll capture.")
-                        break
-                except Exception as e:
-                    logger.debug(f"Options check failed: {e}")
-            
-            # Scroll down for next page
-            logger.info("⬇️ Scrolling down...")
-            pyautogui.press('pagedown')
-            time.sleep(SCROLL_DELAY)
+        logger.info(f"📸 Captured page {page_num + 1}/{MAX_PAGES}")
+        
+        # Save screenshot in developer mode
+        if DEVELOPER_MODE and DEV_SAVE_SCREENSHOTS:
+            timestamp = str(int(time.time() * 1000))
+            path = os.path.join(SCREENSHOTS_DIR, f"long_mcq_{timestamp}_page{page_num + 1}.png")
+            _save_screenshot_async(screenshot, path)
+        
+        # Check if this might be the last page (look for options pattern)
+        # We'll send to Gemini after we have at least 2 screenshots
+        # and ask it to check if options are visible
+        if page_num >= 1:
+            # Quick check: Ask Gemini if answer options are visible in the last screenshot
+            logger.debug("Checking if answer options are visible...")
+            try:
+                quick_check = get_gemini_response(
+                    screenshot,
+                    enable_detailed_mode=False,
+                    question_type_hint="MCQ"
+                )
+                if quick_check and quick_check.get("type") == "MCQ" and quick_check.get("answer_text"):
+                    logger.info("✓ Answer options detected! Stopping scroll capture.")
+                    break
+            except Exception as e:
+                logger.debug(f"Options check failed: {e}")
+        
+        # Scroll down for next page
+        logger.info("⬇️ Scrolling down...")
+        pyautogui.press('pagedown')
+        time.sleep(SCROLL_DELAY)
     
     if not screenshots:
         logger.error("No screenshots captured!")
@@ -603,40 +846,35 @@ def long_mcq_trigger():
     # Try to find the answer using text coordinates
     coordinates = find_text_coordinates(last_screenshot, answer_text)
     
-    with mss.mss() as sct:
-        monitor = sct.monitors[1]
+    _, monitor = _get_sct()
+    
+    if coordinates:
+        x, y = coordinates
+        final_x = x + monitor["left"]
+        final_y = y + monitor["top"]
         
-        if coordinates:
-            x, y = coordinates
-            final_x = x + monitor["left"]
-            final_y = y + monitor["top"]
+        # Simulate human reading/thinking before clicking
+        simulate_reading_pause(0.5, 1.5)
+        
+        logger.info(f"🖱️ Clicking at ({final_x}, {final_y})")
+        click_at(final_x, final_y)
+        move_away_from_options()
+        logger.info("✓ Long MCQ completed successfully!")
+    else:
+        # Failsafe: use bounding box
+        center = _bbox_centers([gemini_result.get("bbox")], monitor)[0]
+        if center:
+            center_x, center_y = center
             
             # Simulate human reading/thinking before clicking
             simulate_reading_pause(0.5, 1.5)
             
-            logger.info(f"🖱️ Clicking at ({final_x}, {final_y})")
-            click_at(final_x, final_y)
+            logger.info(f"🖱️ FAILSAFE Click: ({center_x}, {center_y})")
+            click_at(center_x, center_y)
             move_away_from_options()
-            logger.info("✓ Long MCQ completed successfully!")
+            logger.info("✓ Long MCQ completed (failsafe)!")
         else:
-            # Failsafe: use bounding box
-            bbox = gemini_result.get("bbox")
-            if bbox and len(bbox) == 4:
-                ymin, xmin, ymax, xmax = bbox
-                monitor_w, monitor_h = monitor["width"], monitor["height"]
-                
-                center_x = int(((xmin + xmax) / 2 / 1000) * monitor_w) + monitor["left"]
-                center_y = int(((ymin + ymax) / 2 / 1000) * monitor_h) + monitor["top"]
-                
-                # Simulate human reading/thinking before clicking
-                simulate_reading_pause(0.5, 1.5)
-                
-                logger.info(f"🖱️ FAILSAFE Click: ({center_x}, {center_y})")
-                click_at(center_x, center_y)
-                move_away_from_options()
-                logger.info("✓ Long MCQ completed (failsafe)!")
-            else:
-                logger.error("❌ Could not locate answer option on screen.")
+            logger.error("❌ Could not locate answer option on screen.")
     
     logger.info("Returning to silent background mode...")
 
@@ -752,8 +990,10 @@ def main():
     # Reset mouse fatigue counter for fresh session
     reset_fatigue()
 
-    logger.info(f"Starting Mode: {'MANUAL (Hotkeys Only)' if is_manual_mode else 'AUTO (Loop)'}")
-    logger.info(f"Detailed Mode: {get_config('ENABLE_DETAILED_MODE', True)}")
+    logger.info(
+        f"Starting Mode: {'MANUAL (Hotkeys Only)' if is_manual_mode else 'AUTO (Loop)'}\n"
+        f"Detailed Mode: {get_config('ENABLE_DETAILED_MODE', True)}"
+    )
 
     # Startup Wait
     initial_wait = get_config("INITIAL_WAIT", 10)
@@ -766,7 +1006,17 @@ def main():
     register_all_hotkeys()
     
     # Set up global key listener (always active)
-    keyboard.on_press(triple_press_tracker.on_key_press)
+    threading.Thread(target=_hotkey_worker, name="HotkeyWorker", daemon=True).start()
+    # Hand-edited hotkeys in .env are re-registered on the worker thread
+    for key in HOTKEY_CONFIG_KEYS:
+        register_config_callback(key, _mark_hotkeys_stale)
+    keyboard.hook(_enqueue_key_event)
+    
+    # Cache clipboard text as it changes so the clipboard hotkey never blocks on it
+    clipboard_watcher.start()
+    
+    # Pick up direct .env edits without polling the file
+    watch_config_changes()
     
     # Log initial mode info
     mode_name = "MANUAL MODE" if is_manual_mode else "AUTO MODE"
@@ -777,57 +1027,73 @@ def main():
     # UNIFIED MAIN LOOP (supports dynamic mode switching and config reload)
     # ==========================================================================
     iteration_count = 0
-    last_update_check = time.time()
-    last_config_check = time.time()
+    idle_streak = 0  # Consecutive AUTO iterations with no action taken
+    # Monotonic deadlines: immune to wall-clock jumps (NTP steps, DST)
+    next_update_at = time.monotonic() + get_config("UPDATE_CHECK_INTERVAL_SECONDS", 300)
     last_mode = is_manual_mode  # Track mode changes
     
     # Config check interval (check every 2 seconds for config changes)
     CONFIG_CHECK_INTERVAL = 2.0
+    next_config_check_at = time.monotonic() + CONFIG_CHECK_INTERVAL
+    
+    # Bind hot names once so the loop body reads locals instead of globals.
+    # Runtime config values are still re-read each iteration (the GUI can change them).
+    monotonic = time.monotonic
+    sleep = time.sleep
+    config = get_config
+    process_cycle = process_screen_cycle
+    dev_iteration_limit = DEV_MAX_ITERATIONS if DEVELOPER_MODE else None
     
     try:
         while True:
             # Check for mode change and log it
             if last_mode != is_manual_mode:
                 last_mode = is_manual_mode
+                idle_streak = 0
                 # Mode was just switched, info already logged by toggle_mode()
             
+            now = monotonic()
+
             # Check for config reload signal from GUI (every 2 seconds)
-            if time.time() - last_config_check > CONFIG_CHECK_INTERVAL:
+            if now >= next_config_check_at:
                 check_config_reload_signal()
-                last_config_check = time.time()
+                next_config_check_at = now + CONFIG_CHECK_INTERVAL
             
             # Periodic Update Check (in both modes)
-            update_interval = get_config("UPDATE_CHECK_INTERVAL_SECONDS", 300)
-            if time.time() - last_update_check > update_interval:
+            if now >= next_update_at:
                 logger.debug("Running periodic update check...")
                 try:
                     check_and_update()  # Will exit/restart if update occurs
                 except Exception as e:
                     logger.error(f"Periodic update check failed: {e}")
-                last_update_check = time.time()
+                next_update_at = monotonic() + config("UPDATE_CHECK_INTERVAL_SECONDS", 300)
 
             if is_manual_mode:
                 # MANUAL MODE: Just sleep and wait for hotkey triggers
                 # The keyboard listener handles hotkeys in the background
-                time.sleep(0.5)  # Short sleep to prevent CPU spinning
+                sleep(0.5)  # Short sleep to prevent CPU spinning
             else:
                 # AUTO MODE: Poll screen and auto-detect questions
                 iteration_count += 1
                 logger.debug(f"--- Auto Iteration {iteration_count} ---")
 
                 # In AUTO mode, only process MCQ and DESCRIPTIVE (not MULTI_MCQ)
-                action_taken, _ = process_screen_cycle(
+                action_taken, _ = process_cycle(
                     mode_hint=None, bypass_idempotency=False
                 )
 
                 if action_taken:
-                    post_action_wait = get_config("POST_ACTION_WAIT", 10)
-                    time.sleep(post_action_wait)
+                    idle_streak = 0
+                    post_action_wait = config("POST_ACTION_WAIT", 10)
+                    sleep(post_action_wait)
                 else:
-                    poll_interval = get_config("POLL_INTERVAL", 3)
-                    time.sleep(poll_interval)
+                    # Back off exponentially while the screen has nothing to act on
+                    poll_interval = config("POLL_INTERVAL", 3)
+                    poll_interval_max = max(config("POLL_INTERVAL_MAX", 30), poll_interval)
+                    sleep(min(poll_interval * (1 << min(idle_streak, 5)), poll_interval_max))
+                    idle_streak += 1
 
-                if DEVELOPER_MODE and iteration_count >= DEV_MAX_ITERATIONS:
+                if dev_iteration_limit is not None and iteration_count >= dev_iteration_limit:
                     logger.info("Dev limit reached.")
                     break
 
@@ -8,14 +8,110 @@ and applies them immediately.
 The config values are loaded from the .env file and can be refreshed at any time.
 """
 
+import ctypes
 import os
+import sys
 import time
 import threading
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Any, Callable, Optional
+from types import MappingProxyType
+from typing import DefaultDict, Dict, Any, Callable, Mapping, Optional
 
 from dotenv import load_dotenv
 
+# Win32 change-notification constants (FindFirstChangeNotificationW)
+FILE_NOTIFY_CHANGE_FILE_NAME = 0x00000001
+FILE_NOTIFY_CHANGE_LAST_WRITE = 0x00000010
+WAIT_OBJECT_0 = 0x00000000
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+# os.getenv() wraps this same lookup in an extra Python call per key
+_environ = os.environ
+
+# Process invariants, resolved once at import
+_IS_FROZEN = getattr(sys, 'frozen', False)
+if _IS_FROZEN:
+    _BASE_DIR = os.path.dirname(sys.executable)
+else:
+    _BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ENV_PATH = Path(_BASE_DIR) / ".env"
+
+
+# =============================================================================
+# CONFIG SCHEMA
+# =============================================================================
+_TRUE_VALUES = frozenset(("true", "1", "yes", "on"))
+
+def _parse_bool(raw: str, default: bool) -> bool:
+    return raw.lower() in _TRUE_VALUES
+
+def _parse_int(raw: str, default: int) -> int:
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+def _parse_float(raw: str, default: float) -> float:
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+def _parse_hotkey(raw: str, default: str) -> str:
+    # Interned so comparisons against keyboard event names can short-circuit
+    # on identity
+    return sys.intern(raw.lower())
+
+def _parse_str(raw: str, default: str) -> str:
+    return raw
+
+# (key, parser, default); the default is used as-is when the variable is unset
+_SCHEMA = (
+    # TIMING SETTINGS
+    ("INITIAL_WAIT", _parse_int, 10),
+    ("POST_ACTION_WAIT", _parse_int, 10),
+    ("SWITCH_QUESTION_WAIT", _parse_int, 5),
+    ("POLL_INTERVAL", _parse_int, 3),
+    ("POLL_INTERVAL_MAX", _parse_int, 30),
+    # RETRY SETTINGS
+    ("MAX_RETRIES", _parse_int, 2),
+    # MOUSE & TYPING SETTINGS
+    ("MOUSE_MOVE_DURATION", _parse_float, 0.8),
+    ("TYPING_WPM_MIN", _parse_int, 30),
+    ("TYPING_WPM_MAX", _parse_int, 100),
+    # FEATURE FLAGS
+    ("HANDLE_DESCRIPTIVE_ANSWERS", _parse_bool, True),
+    ("ENABLE_DETAILED_MODE", _parse_bool, True),
+    ("URGENT_MODE", _parse_bool, False),
+    # HOTKEY SETTINGS (CONFIGURABLE TRIGGER KEYS)
+    ("HOTKEY_MCQ", _parse_hotkey, "q"),
+    ("HOTKEY_DESCRIPTIVE", _parse_hotkey, "z"),
+    ("HOTKEY_CLIPBOARD", _parse_hotkey, "c"),
+    ("HOTKEY_MULTI_MCQ", _parse_hotkey, "m"),
+    ("HOTKEY_LONG_MCQ", _parse_hotkey, "l"),
+    ("HOTKEY_TOGGLE_MODE", _parse_hotkey, "t"),
+    ("HOTKEY_DELAY", _parse_float, 2.0),
+    # MODE SETTINGS
+    ("MANUAL_MODE", _parse_bool, False),
+    # DEVELOPER OPTIONS
+    ("DEVELOPER_MODE", _parse_bool, False),
+    ("VERBOSE_STARTUP", _parse_bool, False),
+    ("DEV_MAX_ITERATIONS", _parse_int, 2),
+    ("DEV_SAVE_SCREENSHOTS", _parse_bool, True),
+    # UPDATE SETTINGS
+    ("GITHUB_REPO_OWNER", _parse_str, "divyamohan1993"),
+    ("GITHUB_REPO_NAME", _parse_str, "scry"),
+    ("UPDATE_CHECK_INTERVAL_SECONDS", _parse_int, 300),
+)
+
+# Developer options are forced off in the compiled build
+_FROZEN_OVERRIDES = {
+    "DEVELOPER_MODE": False,
+    "VERBOSE_STARTUP": False,
+    "DEV_SAVE_SCREENSHOTS": False,
+}
+
 # =============================================================================
 # RUNTIME CONFIG SINGLETON
 # =============================================================================
@@ -30,186 +126,229 @@ class RuntimeConfig:
     _lock = threading.Lock()
     
     def __new__(cls):
-        if cls._instance is None:
+        # Fast path: lock-free once the instance has been published
+        instance = cls._instance
+        if instance is None:
             with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+                instance = cls._instance
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance._init_once()
+                    # Publish only after initialization completes, so no
+                    # thread can observe a half-loaded config
+                    cls._instance = instance
+        return instance
     
-    def __init__(self):
-        if self._initialized:
-            return
-        
-        self._initialized = True
+    def _init_once(self):
+        """One-time setup, run under the lock by __new__ (there is no __init__)."""
         self._config: Dict[str, Any] = {}
-        self._callbacks: Dict[str, list] = {}  # key -> list of callback functions
-        self._env_path: Optional[Path] = None
+        self._callbacks: DefaultDict[str, list] = defaultdict(list)  # key -> list of callback functions
+        self._env_path: Optional[Path] = _ENV_PATH
         self._last_load_time: float = 0
         self._file_mod_time: float = 0
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+        # Serializes reloads (watcher thread vs. explicit reload) so each diff
+        # and merge is atomic; reentrant so a callback may reload again
+        self._load_lock = threading.RLock()
+        
+        # Hot path: serve reads straight from the dict's C method, skipping a
+        # Python frame per lookup. _config is only ever mutated in place, so
+        # the bound method and the read-only view stay valid across reloads.
+        self.get = self._config.get
+        self._config_view = MappingProxyType(self._config)
         
         # Initialize from config module
-        self._setup_base_dir()
         self._load_all()
     
-    def _setup_base_dir(self):
-        """Setup base directory and .env path."""
-        import sys
-        IS_FROZEN = getattr(sys, 'frozen', False)
-        
-        if IS_FROZEN:
-            BASE_DIR = os.path.dirname(sys.executable)
-        else:
-            BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
-        self._env_path = Path(BASE_DIR) / ".env"
-    
     def _get_bool(self, key: str, default: bool = False) -> bool:
         """Parse boolean from environment."""
-        val = os.getenv(key, str(default)).lower()
-        return val in ("true", "1", "yes", "on")
+        raw = _environ.get(key)
+        return default if raw is None else _parse_bool(raw, default)
     
     def _get_float(self, key: str, default: float = 0.0) -> float:
         """Parse float from environment."""
-        try:
-            return float(os.getenv(key, default))
-        except ValueError:
-            return default
+        raw = _environ.get(key)
+        return default if raw is None else _parse_float(raw, default)
     
     def _get_int(self, key: str, default: int = 0) -> int:
         """Parse int from environment."""
-        try:
-            return int(os.getenv(key, default))
-        except ValueError:
-            return default
+        raw = _environ.get(key)
+        return default if raw is None else _parse_int(raw, default)
+    
+    def _load_all(self) -> bool:
+        """
+        Load all configuration values from .env file.
+        Returns True if any value changed.
+        """
+        with self._load_lock:
+            return self._load_all_locked()
     
-    def _load_all(self):
-        """Load all configuration values from .env file."""
+    def _load_all_locked(self) -> bool:
+        """Body of _load_all; the caller holds _load_lock."""
         # Reload .env file
-        if self._env_path and self._env_path.exists():
+        mod_time = self._env_mod_time()
+        if mod_time is not None:
             load_dotenv(str(self._env_path), override=True)
-            self._file_mod_time = os.path.getmtime(self._env_path)
-        
-        old_config = self._config.copy()
+            self._file_mod_time = mod_time
         
-        # =================================================================
-        # TIMING SETTINGS
-        # =================================================================
-        self._config["INITIAL_WAIT"] = self._get_int("INITIAL_WAIT", 10)
-        self._config["POST_ACTION_WAIT"] = self._get_int("POST_ACTION_WAIT", 10)
-        self._config["SWITCH_QUESTION_WAIT"] = self._get_int("SWITCH_QUESTION_WAIT", 5)
-        self._config["POLL_INTERVAL"] = self._get_int("POLL_INTERVAL", 3)
+        # Build into a fresh dict, then merge into _config in place so the
+        # bound get accessor and get_all view stay valid
+        env_get = _environ.get
+        config: Dict[str, Any] = {}
+        for key, parse, default in _SCHEMA:
+            raw = env_get(key)
+            config[key] = default if raw is None else parse(raw, default)
         
-        # =================================================================
-        # RETRY SETTINGS
-        # =================================================================
-        self._config["MAX_RETRIES"] = self._get_int("MAX_RETRIES", 2)
+        if _IS_FROZEN:
+            config.update(_FROZEN_OVERRIDES)
         
-        # =================================================================
-        # MOUSE & TYPING SETTINGS
-        # =================================================================
-        self._config["MOUSE_MOVE_DURATION"] = self._get_float("MOUSE_MOVE_DURATION", 0.8)
-        self._config["TYPING_WPM_MIN"] = self._get_int("TYPING_WPM_MIN", 30)
-        self._config["TYPING_WPM_MAX"] = self._get_int("TYPING_WPM_MAX", 100)
-        
-        # =================================================================
-        # FEATURE FLAGS
-        # =================================================================
-        self._config["HANDLE_DESCRIPTIVE_ANSWERS"] = self._get_bool("HANDLE_DESCRIPTIVE_ANSWERS", True)
-        self._config["ENABLE_DETAILED_MODE"] = self._get_bool("ENABLE_DETAILED_MODE", True)
-        self._config["URGENT_MODE"] = self._get_bool("URGENT_MODE", False)
-        
-        # =================================================================
-        # HOTKEY SETTINGS (CONFIGURABLE TRIGGER KEYS)
-        # =================================================================
-        self._config["HOTKEY_MCQ"] = os.getenv("HOTKEY_MCQ", "q").lower()
-        self._config["HOTKEY_DESCRIPTIVE"] = os.getenv("HOTKEY_DESCRIPTIVE", "z").lower()
-        self._config["HOTKEY_CLIPBOARD"] = os.getenv("HOTKEY_CLIPBOARD", "c").lower()
-        self._config["HOTKEY_MULTI_MCQ"] = os.getenv("HOTKEY_MULTI_MCQ", "m").lower()
-        self._config["HOTKEY_LONG_MCQ"] = os.getenv("HOTKEY_LONG_MCQ", "l").lower()
-        self._config["HOTKEY_TOGGLE_MODE"] = os.getenv("HOTKEY_TOGGLE_MODE", "t").lower()
-        self._config["HOTKEY_DELAY"] = self._get_float("HOTKEY_DELAY", 2.0)
-        
-        # =================================================================
-        # MODE SETTINGS
-        # =================================================================
-        self._config["MANUAL_MODE"] = self._get_bool("MANUAL_MODE", False)
-        
-        # =================================================================
-        # DEVELOPER OPTIONS
-        # =================================================================
-        import sys
-        IS_FROZEN = getattr(sys, 'frozen', False)
-        if IS_FROZEN:
-            self._config["DEVELOPER_MODE"] = False
-            self._config["VERBOSE_STARTUP"] = False
-        else:
-            self._config["DEVELOPER_MODE"] = self._get_bool("DEVELOPER_MODE", False)
-            self._config["VERBOSE_STARTUP"] = self._get_bool("VERBOSE_STARTUP", False)
+        self._last_load_time = time.time()
         
-        self._config["DEV_MAX_ITERATIONS"] = self._get_int("DEV_MAX_ITERATIONS", 2)
-        self._config["DEV_SAVE_SCREENSHOTS"] = self._get_bool("DEV_SAVE_SCREENSHOTS", True) if not IS_FROZEN else False
+        old_config = self._config
+        changed = config != old_config
         
-        # =================================================================
-        # UPDATE SETTINGS
-        # =================================================================
-        self._config["GITHUB_REPO_OWNER"] = os.getenv("GITHUB_REPO_OWNER", "divyamohan1993")
-        self._config["GITHUB_REPO_NAME"] = os.getenv("GITHUB_REPO_NAME", "scry")
-        self._config["UPDATE_CHECK_INTERVAL_SECONDS"] = self._get_int("UPDATE_CHECK_INTERVAL_SECONDS", 300)
+        # Only keys with registered callbacks need a per-key diff
+        fired = []
+        if changed and self._callbacks:
+            for key, callbacks in self._callbacks.items():
+                old_value = old_config.get(key)
+                new_value = config.get(key)
+                if old_value != new_value and callbacks:
+                    fired.append((key, old_value, new_value, list(callbacks)))
         
-        self._last_load_time = time.time()
+        old_config.update(config)
         
         # Fire callbacks for changed values
-        for key, new_value in self._config.items():
-            old_value = old_config.get(key)
-            if old_value != new_value and key in self._callbacks:
-                for callback in self._callbacks[key]:
-                    try:
-                        callback(key, old_value, new_value)
-                    except Exception as e:
-                        print(f"[RuntimeConfig] Callback error for {key}: {e}")
-    
-    def get(self, key: str, default: Any = None) -> Any:
-        """Get a configuration value."""
-        return self._config.get(key, default)
-    
-    def get_all(self) -> Dict[str, Any]:
-        """Get all configuration values."""
-        return self._config.copy()
+        for key, old_value, new_value, callbacks in fired:
+            for callback in callbacks:
+                try:
+                    callback(key, old_value, new_value)
+                except Exception as e:
+                    print(f"[RuntimeConfig] Callback error for {key}: {e}")
+        
+        return changed
+    
+    # get(key, default=None) is bound per instance in _init_once
+    
+    def get_all(self) -> Mapping[str, Any]:
+        """
+        Get all configuration values as a live, read-only view.
+        Use dict(get_all()) for a snapshot.
+        """
+        return self._config_view
     
     def reload(self) -> bool:
         """
         Reload configuration from .env file.
         Returns True if any values changed.
         """
-        old_config = self._config.copy()
-        self._load_all()
-        return old_config != self._config
+        return self._load_all()
     
     def check_and_reload_if_changed(self) -> bool:
         """
         Check if .env file has been modified and reload if needed.
         Returns True if reloaded.
+        While the change watcher is running it reloads by itself, so this is a no-op.
         """
-        if self._env_path and self._env_path.exists():
-            current_mod_time = os.path.getmtime(self._env_path)
-            if current_mod_time > self._file_mod_time:
-                return self.reload()
+        if self._watch_thread is not None:
+            return False
+        return self._reload_if_modified()
+    
+    def _env_mod_time(self) -> Optional[float]:
+        """mtime of the .env file, or None if it is missing (one stat call)."""
+        if not self._env_path:
+            return None
+        try:
+            return os.stat(self._env_path).st_mtime
+        except OSError:
+            return None
+    
+    def _reload_if_modified(self) -> bool:
+        """Reload if the .env mtime moved past the last load."""
+        mod_time = self._env_mod_time()
+        if mod_time is not None and mod_time > self._file_mod_time:
+            return self.reload()
         return False
     
+    def start_watching(self) -> bool:
+        """
+        Reload automatically when .env changes, driven by OS change notifications
+        instead of polling its mtime. Windows only; returns False (callers keep
+        using check_and_reload_if_changed) when the watch cannot be set up.
+        """
+        if self._watch_thread is not None:
+            return True
+        if os.name != "nt" or not self._env_path:
+            return False
+        
+        try:
+            kernel32 = ctypes.windll.kernel32
+            kernel32.FindFirstChangeNotificationW.restype = ctypes.c_void_p
+            handle = kernel32.FindFirstChangeNotificationW(
+                str(self._env_path.parent),
+                False,
+                FILE_NOTIFY_CHANGE_LAST_WRITE | FILE_NOTIFY_CHANGE_FILE_NAME,
+            )
+        except Exception as e:
+            print(f"[RuntimeConfig] Change watcher unavailable: {e}")
+            return False
+        if not handle or handle == INVALID_HANDLE_VALUE:
+            return False
+        
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop, args=(kernel32, handle),
+            name="ConfigWatcher", daemon=True
+        )
+        self._watch_thread.start()
+        return True
+    
+    def stop_watching(self):
+        """Stop the change watcher; polling via check_and_reload_if_changed resumes."""
+        thread = self._watch_thread
+        if thread is None:
+            return
+        self._watch_stop.set()
+        thread.join(timeout=2)
+        self._watch_thread = None
+    
+    def _watch_loop(self, kernel32, handle):
+        """Block on the directory change handle and reload when .env is touched."""
+        handle = ctypes.c_void_p(handle)
+        try:
+            while not self._watch_stop.is_set():
+                # Short timeout only so stop_watching() is honored promptly
+                if kernel32.WaitForSingleObject(handle, 1000) != WAIT_OBJECT_0:
+                    continue
+                # The handle fires for any file in the directory; the mtime
+                # check filters out everything but .env
+                try:
+                    self._reload_if_modified()
+                except Exception as e:
+                    print(f"[RuntimeConfig] Reload after change failed: {e}")
+                if not kernel32.FindNextChangeNotification(handle):
+                    break
+        finally:
+            kernel32.FindCloseChangeNotification(handle)
+            if self._watch_thread is threading.current_thread():
+                self._watch_thread = None
+    
     def register_callback(self, key: str, callback: Callable[[str, Any, Any], None]):
         """
         Register a callback to be called when a config value changes.
         Callback signature: callback(key, old_value, new_value)
         """
-        if key not in self._callbacks:
-            self._callbacks[key] = []
         self._callbacks[key].append(callback)
     
     def unregister_callback(self, key: str, callback: Callable):
         """Unregister a callback."""
-        if key in self._callbacks and callback in self._callbacks[key]:
-            self._callbacks[key].remove(callback)
+        callbacks = self._callbacks.get(key)
+        if callbacks:
+            try:
+                callbacks.remove(callback)
+            except ValueError:
+                pass
 
 
 # =============================================================================
@@ -233,6 +372,10 @@ def check_config_changes() -> bool:
     """Check for .env file changes and reload if needed."""
     return runtime_config.check_and_reload_if_changed()
 
+def watch_config_changes() -> bool:
+    """Start reloading on .env changes via OS notifications. Returns True if active."""
+    return runtime_config.start_watching()
+
 def register_config_callback(key: str, callback: Callable[[str, Any, Any], None]):
     """Register a callback for config changes."""
     runtime_config.register_callback(key, callback)
@@ -1,39 +1,78 @@
+import hashlib
 import os
+import re
 import sys
 import subprocess
+import time
 import requests
+import requests.adapters
 import logging
 from .config import VERSION_CHECK_URL, LATEST_RELEASE_URL
 from .version import VERSION
 
 logger = logging.getLogger("Updater")
 
+# Read the release body in 1 MiB blocks rather than many small iter_content chunks
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Matches VERSION = "x.y.z" (either quote style) anywhere in version.py
+_VERSION_RE = re.compile(r"""^\s*VERSION\s*=\s*["']([^"']+)["']""", re.MULTILINE)
+# Leading dotted release number of a version string ("v1.10.0-rc1" -> "1.10.0")
+_RELEASE_RE = re.compile(r"v?(\d+(?:\.\d+)*)")
+# Release asset published next to the exe: "<hex digest>  Scry.exe"
+CHECKSUM_URL = LATEST_RELEASE_URL + ".sha256"
+
+# One keep-alive session for every update request, so periodic checks reuse
+# the TCP/TLS connection instead of reconnecting each time
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": f"Scry/{VERSION}"})
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=2))
+
+# Skip "git fetch" when .git/FETCH_HEAD shows a fetch within this window
+GIT_FETCH_MIN_INTERVAL = 60
+
+# Conditional-GET cache for the version file: an unchanged file answers 304
+_version_etag = None
+_cached_remote_version = None
+
+def _version_tuple(version):
+    """Turn a version string into a tuple of ints so 1.10 sorts after 1.9."""
+    match = _RELEASE_RE.match(version.strip())
+    return tuple(map(int, match.group(1).split("."))) if match else ()
+
+_CURRENT_VERSION = _version_tuple(VERSION)
+
 def is_frozen():
     """Check if running as a compiled exe."""
     return getattr(sys, 'frozen', False)
 
 def get_remote_version():
     """Fetch the version string from the remote repo."""
+    global _version_etag, _cached_remote_version
     try:
-        response = requests.get(VERSION_CHECK_URL, timeout=10)
+        headers = {"If-None-Match": _version_etag} if _version_etag else None
+        response = _SESSION.get(VERSION_CHECK_URL, headers=headers, timeout=10)
+        if response.status_code == 304:
+            return _cached_remote_version
         if response.status_code == 200:
-            # Parse the text to find VERSION = "x.y.z"
-            # We assume the file is simple python.
-            for line in response.text.splitlines():
-                if line.strip().startswith("VERSION"):
-                    # Extract string between quotes
-                    parts = line.split('"')
-                    if len(parts) >= 2:
-                        return parts[1]
-                    parts = line.split("'")
-                    if len(parts) >= 2:
-                        return parts[1]
+            match = _VERSION_RE.search(response.text)
+            version = match.group(1) if match else None
+            _version_etag = response.headers.get("ETag")
+            _cached_remote_version = version
+            return version
         else:
             logger.warning(f"Failed to fetch version: Status {response.status_code}")
     except Exception as e:
         logger.error(f"Error checking remote version: {e}")
     return None
 
+def _fetched_recently():
+    """True if git's FETCH_HEAD was written within GIT_FETCH_MIN_INTERVAL."""
+    try:
+        age = time.time() - os.path.getmtime(os.path.join(".git", "FETCH_HEAD"))
+    except OSError:
+        return False
+    return 0 <= age < GIT_FETCH_MIN_INTERVAL
+
 def update_source_code():
     """
     Performs a git pull and restarts the script.
@@ -44,12 +83,18 @@ def update_source_code():
         # Check if git is available
         subprocess.check_call(["git", "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-        # Fetch origin
-        subprocess.check_call(["git", "fetch", "origin"])
+        # Fetch origin, unless we already did so moments ago (e.g. right
+        # before the restart that follows a pull)
+        if _fetched_recently():
+            logger.debug("Skipping git fetch; fetched recently.")
+        else:
+            subprocess.check_call(
+                ["git", "fetch", "origin"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
 
-        # Check if behind
-        status = subprocess.check_output(["git", "status", "-uno"]).decode()
-        if "Your branch is up to date" in status:
+        # Count upstream commits we don't have (locale-independent)
+        behind = subprocess.check_output(["git", "rev-list", "--count", "HEAD..@{u}"]).strip()
+        if int(behind or 0) == 0:
             logger.info("Source code is up to date.")
             return False
 
@@ -71,44 +116,109 @@ def update_source_code():
         logger.warning("Git not found. Skipping source update.")
     return False
 
+def get_expected_sha256():
+    """
+    Fetch the SHA-256 published alongside the release binary.
+    Returns the lowercase hex digest, or None if no checksum is available.
+    """
+    try:
+        response = _SESSION.get(CHECKSUM_URL, timeout=10)
+        if response.status_code == 200:
+            fields = response.text.split()
+            if fields and len(fields[0]) == 64:
+                return fields[0].lower()
+        logger.warning(f"No usable checksum at {CHECKSUM_URL} (Status {response.status_code}).")
+    except Exception as e:
+        logger.warning(f"Could not fetch release checksum: {e}")
+    return None
+
+def _swap_in_binary(new_exe, current_exe):
+    """
+    Replace the running exe with the downloaded one.
+    Windows refuses to overwrite a running image but does allow renaming it,
+    so the current exe is moved aside to <exe>.old and the new one takes its name.
+    """
+    old_exe = current_exe + ".old"
+    try:
+        os.remove(old_exe)
+    except FileNotFoundError:
+        pass
+    os.replace(current_exe, old_exe)
+    try:
+        os.replace(new_exe, current_exe)
+    except OSError:
+        # Put the original back so the install is never left without an exe
+        os.replace(old_exe, current_exe)
+        raise
+
+def _schedule_swap_script(new_exe, current_exe):
+    """
+    Fallback swap: a transient batch script waits for this process to exit,
+    moves the new exe over the current one, relaunches it and deletes itself.
+    """
+    updater_script = "update_swap.bat"
+    with open(updater_script, "w") as bat:
+        bat.write("@echo off\n")
+        bat.write("timeout /t 3 /nobreak >nul\n")
+        bat.write(f'move /y "{new_exe}" "{current_exe}" >nul\n')
+        bat.write(f'start "" "{current_exe}"\n')
+        bat.write(f'del "{updater_script}"\n')
+
+    # Launch the batch script silently
+    subprocess.Popen(updater_script, shell=True, creationflags=subprocess.CREATE_NO_WINDOW)
+
+def _remove_previous_binary():
+    """Delete the <exe>.old left behind by the last in-place swap."""
+    try:
+        os.remove(sys.executable + ".old")
+    except OSError:
+        pass
+
 def update_binary(remote_ver):
     """
     Downloads the new binary and schedules a replacement.
     """
     logger.info(f"Updating binary from {VERSION} to {remote_ver}...")
     try:
-        response = requests.get(LATEST_RELEASE_URL, stream=True, timeout=30)
+        response = _SESSION.get(LATEST_RELEASE_URL, stream=True, timeout=30)
         if response.status_code != 200:
             logger.error("Failed to download release.")
             return False
 
+        expected_sha256 = get_expected_sha256()
+
         new_exe_name = "Scry_new.exe"
+        digest = hashlib.sha256()
+        response.raw.decode_content = True
+        read = response.raw.read
         with open(new_exe_name, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in iter(lambda: read(DOWNLOAD_CHUNK_SIZE), b""):
+                digest.update(chunk)
                 f.write(chunk)
 
-        logger.info("Download complete. Scheduling restart...")
-
-        # Create a transient batch script to handle the swap
-        # We need a delay to allow this process to exit.
-        current_exe = sys.executable
-
-        # The script:
-        # 1. Wait 3 seconds
-        # 2. Move /Y Scry_new.exe -> current_exe
-        # 3. Start current_exe
-        # 4. Delete self
+        actual_sha256 = digest.hexdigest()
+        if expected_sha256 is None:
+            logger.warning("Release has no published checksum; skipping verification.")
+        elif actual_sha256 != expected_sha256:
+            logger.error(
+                f"Checksum mismatch (expected {expected_sha256}, got {actual_sha256}). Aborting update."
+            )
+            os.remove(new_exe_name)
+            return False
+        else:
+            logger.info("Checksum verified.")
 
-        updater_script = "update_swap.bat"
-        with open(updater_script, "w") as bat:
-            bat.write("@echo off\n")
-            bat.write("timeout /t 3 /nobreak >nul\n")
-            bat.write(f'move /y "{new_exe_name}" "{current_exe}" >nul\n')
-            bat.write(f'start "" "{current_exe}"\n')
-            bat.write(f'del "{updater_script}"\n')
+        logger.info("Download complete. Swapping binary and restarting...")
 
-        # Launch the batch script silently
-        subprocess.Popen(updater_script, shell=True, creationflags=subprocess.CREATE_NO_WINDOW)
+        current_exe = sys.executable
+        try:
+            _swap_in_binary(new_exe_name, current_exe)
+        except OSError as e:
+            logger.warning(f"In-place swap failed ({e}); falling back to swap script.")
+            _schedule_swap_script(new_exe_name, current_exe)
+        else:
+            # The new exe is already in place; start it right away
+            subprocess.Popen([current_exe] + sys.argv[1:], creationflags=subprocess.CREATE_NO_WINDOW)
 
         sys.exit(0)
 
@@ -145,8 +255,9 @@ def check_and_update():
     
     if is_frozen():
         # Binary Update Logic
+        _remove_previous_binary()
         remote_ver = get_remote_version()
-        if remote_ver and remote_ver > VERSION:
+        if remote_ver and _version_tuple(remote_ver) > _CURRENT_VERSION:
             logger.info(f"Update available: {remote_ver}")
             update_binary(remote_ver)
         else:
@@ -0,0 +1,120 @@
+"""
+Clipboard watcher.
+
+Keeps the latest clipboard text in memory by listening for WM_CLIPBOARDUPDATE
+on a hidden message-only window, so readers never have to open the Win32
+clipboard themselves (OpenClipboard can block while another app holds it).
+"""
+
+import ctypes
+import logging
+import threading
+import time
+
+logger = logging.getLogger("ClipboardWatcher")
+
+WM_CLIPBOARDUPDATE = 0x031D
+HWND_MESSAGE = -3
+
+_latest = None
+_lock = threading.Lock()
+_thread = None
+_running = threading.Event()
+
+
+def _store_current(win32clipboard, retries=5):
+    """Cache the clipboard's text, retrying briefly if another app holds it open."""
+    global _latest
+    for attempt in range(retries):
+        try:
+            win32clipboard.OpenClipboard()
+        except Exception:
+            time.sleep(0.01 * (attempt + 1))
+            continue
+        try:
+            text = None
+            if win32clipboard.IsClipboardFormatAvailable(win32clipboard.CF_UNICODETEXT):
+                text = win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
+            elif win32clipboard.IsClipboardFormatAvailable(win32clipboard.CF_TEXT):
+                data = win32clipboard.GetClipboardData(win32clipboard.CF_TEXT)
+                text = data.decode("utf-8", errors="ignore")
+        except Exception as e:
+            logger.error(f"Failed to read clipboard: {e}")
+            return
+        finally:
+            win32clipboard.CloseClipboard()
+        with _lock:
+            _latest = text
+        return
+    logger.warning("Clipboard busy; keeping previous content.")
+
+
+def _run():
+    """Create the listener window and pump its messages (runs on a daemon thread)."""
+    try:
+        import win32api
+        import win32clipboard
+        import win32gui
+    except ImportError:
+        logger.debug("pywin32 not available; clipboard watcher disabled.")
+        return
+
+    def wnd_proc(hwnd, msg, wparam, lparam):
+        if msg == WM_CLIPBOARDUPDATE:
+            _store_current(win32clipboard)
+            return 0
+        return win32gui.DefWindowProc(hwnd, msg, wparam, lparam)
+
+    try:
+        wc = win32gui.WNDCLASS()
+        wc.lpfnWndProc = wnd_proc
+        wc.lpszClassName = "ScryClipboardWatcher"
+        wc.hInstance = win32api.GetModuleHandle(None)
+        class_atom = win32gui.RegisterClass(wc)
+        hwnd = win32gui.CreateWindowEx(
+            0, class_atom, "ScryClipboardWatcher", 0, 0, 0, 0, 0,
+            HWND_MESSAGE, 0, wc.hInstance, None
+        )
+        if not ctypes.windll.user32.AddClipboardFormatListener(hwnd):
+            raise OSError("AddClipboardFormatListener failed")
+    except Exception as e:
+        logger.error(f"Failed to start clipboard watcher: {e}")
+        return
+
+    # Seed with whatever is on the clipboard right now
+    _store_current(win32clipboard)
+    _running.set()
+    logger.debug("Clipboard watcher active.")
+
+    try:
+        win32gui.PumpMessages()
+    finally:
+        _running.clear()
+        ctypes.windll.user32.RemoveClipboardFormatListener(hwnd)
+
+
+def start():
+    """
+    Start the watcher thread once. Returns True when the listener is active,
+    False if pywin32 is missing or the window could not be created.
+    """
+    global _thread
+    if _thread is None:
+        _thread = threading.Thread(target=_run, name="ClipboardWatcher", daemon=True)
+        _thread.start()
+    # Wait briefly for the window to come up (or the thread to give up)
+    deadline = time.monotonic() + 1.0
+    while not _running.is_set() and _thread.is_alive() and time.monotonic() < deadline:
+        _running.wait(0.05)
+    return _running.is_set()
+
+
+def is_running():
+    """True while the listener window is receiving clipboard updates."""
+    return _running.is_set()
+
+
+def latest():
+    """Return the most recent clipboard text, or None if it is empty or not text."""
+    with _lock:
+        return _latest
@@ -1,6 +1,9 @@
 import ctypes
+import functools
 import logging
+import threading
 
+from ..runtime_config import register_config_callback
 from .typing_engine import HumanTypist
 
 # Windows API Constants
@@ -33,22 +36,70 @@ ACCESS_FLAGS = (
 
 logger = logging.getLogger("DesktopMgr")
 
-user32 = ctypes.windll.user32
-kernel32 = ctypes.windll.kernel32
+# use_last_error=True makes ctypes.get_last_error() report the error of
+# the last call made through these libraries
+user32 = ctypes.WinDLL("user32", use_last_error=True)
+kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+# Function prototypes, declared once so ctypes does not infer them per call
+HDESK = ctypes.c_void_p
+
+user32.OpenInputDesktop.argtypes = (ctypes.c_ulong, ctypes.c_bool, ctypes.c_ulong)
+user32.OpenInputDesktop.restype = HDESK
+user32.GetThreadDesktop.argtypes = (ctypes.c_ulong,)
+user32.GetThreadDesktop.restype = HDESK
+user32.SetThreadDesktop.argtypes = (HDESK,)
+user32.SetThreadDesktop.restype = ctypes.c_bool
+user32.CloseDesktop.argtypes = (HDESK,)
+user32.CloseDesktop.restype = ctypes.c_bool
+user32.GetUserObjectInformationW.argtypes = (
+    ctypes.c_void_p,
+    ctypes.c_int,
+    ctypes.c_void_p,
+    ctypes.c_ulong,
+    ctypes.POINTER(ctypes.c_ulong),
+)
+user32.GetUserObjectInformationW.restype = ctypes.c_bool
+kernel32.GetCurrentThreadId.argtypes = ()
+kernel32.GetCurrentThreadId.restype = ctypes.c_ulong
+
+
+UOI_NAME = 2
+
+# Per-thread memo of the thread desktop's name (keyed by its handle) plus a
+# reusable name buffer, so the steady-state check does no allocations.
+_local = threading.local()
+
+
+def _desktop_name(h_desktop):
+    buff = getattr(_local, "name_buf", None)
+    if buff is None:
+        buff = _local.name_buf = ctypes.create_unicode_buffer(256)
+        _local.name_len = ctypes.c_ulong()
+    length = _local.name_len
+    if user32.GetUserObjectInformationW(
+        h_desktop, UOI_NAME, buff, ctypes.sizeof(buff), ctypes.byref(length)
+    ):
+        return buff.value
+    # Name longer than the cached buffer: grow it to the size Windows reported
+    if length.value <= ctypes.sizeof(buff):
+        return ""
+    buff = _local.name_buf = ctypes.create_unicode_buffer(length.value)
+    user32.GetUserObjectInformationW(
+        h_desktop, UOI_NAME, buff, ctypes.sizeof(buff), ctypes.byref(length)
+    )
+    return buff.value
 
 
 def get_current_desktop_name():
     try:
         h_desktop = user32.GetThreadDesktop(kernel32.GetCurrentThreadId())
-        length = ctypes.c_ulong()
-        user32.GetUserObjectInformationW(
-            h_desktop, 2, None, 0, ctypes.byref(length)
-        )  # UOI_NAME = 2
-        buff = ctypes.create_unicode_buffer(length.value)
-        user32.GetUserObjectInformationW(
-            h_desktop, 2, buff, length, ctypes.byref(length)
-        )
-        return buff.value
+        if h_desktop and h_desktop == getattr(_local, "desktop_handle", None):
+            return _local.desktop_name
+        name = _desktop_name(h_desktop)
+        _local.desktop_handle = h_desktop
+        _local.desktop_name = name
+        return name
     except Exception:
         return "Unknown"
 
@@ -84,16 +135,7 @@ def switch_to_input_desktop():
                 logger.debug(f"OpenInputDesktop failed. Error: {err}")
             return False
 
-        # Get name of input desktop
-        length = ctypes.c_ulong()
-        user32.GetUserObjectInformationW(
-            h_input_desktop, 2, None, 0, ctypes.byref(length)
-        )
-        buff = ctypes.create_unicode_buffer(length.value)
-        user32.GetUserObjectInformationW(
-            h_input_desktop, 2, buff, length, ctypes.byref(length)
-        )
-        input_name = buff.value
+        input_name = _desktop_name(h_input_desktop)
 
         if current_name != input_name:
             logger.info(
@@ -110,6 +152,8 @@ def switch_to_input_desktop():
                 return False
             else:
                 logger.info(f"Successfully attached to desktop: '{input_name}'")
+                # Thread desktop changed; re-read its name next time
+                _local.desktop_handle = None
                 # We need to keep the handle open if we want to stay attached?
                 # Actually, SetThreadDesktop keeps it?
                 # "The SetThreadDesktop function replaces the desktop for the specified thread...
@@ -132,118 +176,19 @@ def switch_to_input_desktop():
 
 
 # =============================================================================
-# KEYBOARD SIMULATION
+# HUMAN-LIKE TYPING ENGINE
 # =============================================================================
 
-# Ctypes structures for SendInput
-PUL = ctypes.POINTER(ctypes.c_ulong)
-
-
-class KEYBDINPUT(ctypes.Structure):
-    _fields_ = [
-        ("wVk", ctypes.c_ushort),
-        ("wScan", ctypes.c_ushort),
-        ("dwFlags", ctypes.c_ulong),
-        ("time", ctypes.c_ulong),
-        ("dwExtraInfo", PUL),
-    ]
-
-
-class HARDWAREINPUT(ctypes.Structure):
-    _fields_ = [
-        ("uMsg", ctypes.c_ulong),
-        ("wParamL", ctypes.c_ushort),
-        ("wParamH", ctypes.c_ushort),
-    ]
-
-
-class MOUSEINPUT(ctypes.Structure):
-    _fields_ = [
-        ("dx", ctypes.c_long),
-        ("dy", ctypes.c_long),
-        ("mouseData", ctypes.c_ulong),
-        ("dwFlags", ctypes.c_ulong),
-        ("time", ctypes.c_ulong),
-        ("dwExtraInfo", PUL),
-    ]
 
+@functools.lru_cache(maxsize=8)
+def _get_typist(min_wpm, max_wpm, error_rate):
+    """One HumanTypist per parameter set; type_text() resets its per-run state."""
+    return HumanTypist(min_wpm=min_wpm, max_wpm=max_wpm, error_rate=error_rate)
 
-class INPUT_I(ctypes.Union):
-    _fields_ = [("ki", KEYBDINPUT), ("mi", MOUSEINPUT), ("hi", HARDWAREINPUT)]
 
-
-class INPUT(ctypes.Structure):
-    _fields_ = [("type", ctypes.c_ulong), ("ii", INPUT_I)]
-
-
-# Constants
-INPUT_KEYBOARD = 1
-KEYEVENTF_UNICODE = 0x0004
-KEYEVENTF_KEYUP = 0x0002
-VK_RETURN = 0x0D
-
-
-def _send_vk(vk_code):
-    """
-    Sends a virtual key code (non-unicode)
-    """
-    # Key Down
-    inp_down = INPUT()
-    inp_down.type = INPUT_KEYBOARD
-    inp_down.ii.ki.wVk = vk_code
-    inp_down.ii.ki.wScan = 0
-    inp_down.ii.ki.dwFlags = 0
-    inp_down.ii.ki.time = 0
-    inp_down.ii.ki.dwExtraInfo = None
-
-    # Key Up
-    inp_up = INPUT()
-    inp_up.type = INPUT_KEYBOARD
-    inp_up.ii.ki.wVk = vk_code
-    inp_up.ii.ki.wScan = 0
-    inp_up.ii.ki.dwFlags = KEYEVENTF_KEYUP
-    inp_up.ii.ki.time = 0
-    inp_up.ii.ki.dwExtraInfo = None
-
-    # Send
-    user32.SendInput(1, ctypes.byref(inp_down), ctypes.sizeof(inp_down))
-    user32.SendInput(1, ctypes.byref(inp_up), ctypes.sizeof(inp_up))
-
-
-def _send_char(char):
-    """
-    Sends a single unicode character using SendInput.
-    This works for most keyboard layouts and isolated desktops.
-    """
-    # Create inputs for KeyDown and KeyUp
-    # We use UNICODE mode to support all characters easily
-
-    # Key Down
-    inp_down = INPUT()
-    inp_down.type = INPUT_KEYBOARD
-    inp_down.ii.ki.wVk = 0
-    inp_down.ii.ki.wScan = ord(char)
-    inp_down.ii.ki.dwFlags = KEYEVENTF_UNICODE
-    inp_down.ii.ki.time = 0
-    inp_down.ii.ki.dwExtraInfo = None
-
-    # Key Up
-    inp_up = INPUT()
-    inp_up.type = INPUT_KEYBOARD
-    inp_up.ii.ki.wVk = 0
-    inp_up.ii.ki.wScan = ord(char)
-    inp_up.ii.ki.dwFlags = KEYEVENTF_UNICODE | KEYEVENTF_KEYUP
-    inp_up.ii.ki.time = 0
-    inp_up.ii.ki.dwExtraInfo = None
-
-    # Send
-    user32.SendInput(1, ctypes.byref(inp_down), ctypes.sizeof(inp_down))
-    user32.SendInput(1, ctypes.byref(inp_up), ctypes.sizeof(inp_up))
-
-
-# =============================================================================
-# HUMAN-LIKE TYPING ENGINE
-# =============================================================================
+# HumanTypist reads URGENT_MODE when constructed, so drop cached instances
+# when it changes (WPM values are part of the cache key already)
+register_config_callback("URGENT_MODE", lambda *_: _get_typist.cache_clear())
 
 
 def type_text_human_like(text, min_wpm=30, max_wpm=70, error_rate=0.03):
@@ -255,6 +200,8 @@ def type_text_human_like(text, min_wpm=30, max_wpm=70, error_rate=0.03):
         min_wpm (int): Minimum words per minute.
         max_wpm (int): Maximum words per minute.
         error_rate (float): Probability of errors.
+
+    URGENT_MODE is handled inside HumanTypist, which drops the delays but
+    keeps the typing lock, focus check and pause/stop hotkeys.
     """
-    typist = HumanTypist(min_wpm=min_wpm, max_wpm=max_wpm, error_rate=error_rate)
-    typist.type_text(text)
+    _get_typist(min_wpm, max_wpm, error_rate).type_text(text)
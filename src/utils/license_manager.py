@@ -26,29 +26,73 @@ USAGE:
 
 import os
 import sys
-import json
-import base64
+import functools
 import hashlib
+import importlib.util
 import secrets
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional, Tuple
 
-# Try to import cryptography
+# pybase64 (SIMD) is a drop-in for the stdlib functions used here
 try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+# cryptography is only probed here; loading its OpenSSL bindings is deferred
+# to _crypto() so it stays off the startup path
+CRYPTO_AVAILABLE = importlib.util.find_spec("cryptography") is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _crypto() -> SimpleNamespace:
+    """Import the cryptography primitives on first use."""
     from cryptography.hazmat.primitives import hashes, serialization
-    from cryptography.hazmat.primitives.asymmetric import rsa, padding
+    from cryptography.hazmat.primitives.asymmetric import ed25519, rsa, padding
     from cryptography.hazmat.backends import default_backend
     from cryptography.exceptions import InvalidSignature
-    CRYPTO_AVAILABLE = True
-except ImportError:
-    CRYPTO_AVAILABLE = False
+    return SimpleNamespace(
+        hashes=hashes,
+        serialization=serialization,
+        ed25519=ed25519,
+        rsa=rsa,
+        padding=padding,
+        default_backend=default_backend,
+        InvalidSignature=InvalidSignature,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_public_key(pem: str):
+    """Parse a PEM public key; cached so each key is decoded once per process."""
+    c = _crypto()
+    return c.serialization.load_pem_public_key(pem.encode(), backend=c.default_backend())
+
+
+def _sign(private_key, message: bytes) -> bytes:
+    """Sign with an Ed25519 key, or RSA PKCS#1 v1.5/SHA-256 for older keys."""
+    c = _crypto()
+    if isinstance(private_key, c.ed25519.Ed25519PrivateKey):
+        return private_key.sign(message)
+    return private_key.sign(message, c.padding.PKCS1v15(), c.hashes.SHA256())
+
+
+def _verify(public_key, signature: bytes, message: bytes):
+    """Verify a _sign() signature; raises InvalidSignature on mismatch."""
+    c = _crypto()
+    if isinstance(public_key, c.ed25519.Ed25519PublicKey):
+        public_key.verify(signature, message)
+    else:
+        public_key.verify(signature, message, c.padding.PKCS1v15(), c.hashes.SHA256())
 
 
 class LicenseManager:
     """
-    Manages ephemeral one-time license validation using RSA signatures.
+    Manages ephemeral one-time license validation using Ed25519 (or legacy
+    RSA) signatures.
     
     The challenge-response flow:
     1. Software generates a random challenge on each startup
@@ -60,6 +104,9 @@ class LicenseManager:
     # File to store the session challenge (deleted on exit)
     CHALLENGE_FILE = ".scry_session_challenge"
     
+    # Machine fingerprint cached across runs (hex SHA-256)
+    MACHINE_ID_FILE = ".scry_machine_id"
+    
     # The PUBLIC KEY is embedded here - safe to be in source code
     # Only the PRIVATE KEY must be kept secret
     EMBEDDED_PUBLIC_KEY = """-----BEGIN PUBLIC KEY-----
@@ -78,6 +125,9 @@ i1FxJbUZdvj6DhHcz+ISAuXV09S2TTQTcuEgwkYeIZk6ZURd2FeNusTr0dNETBJl
         self.challenge_path = self.base_dir / self.CHALLENGE_FILE
         self._current_challenge: Optional[str] = None
         self._session_validated = False
+        self._machine_id: Optional[str] = None
+        # (challenge, display code) for the last challenge shown
+        self._display_challenge: Optional[Tuple[str, str]] = None
         
         if not CRYPTO_AVAILABLE:
             raise ImportError(
@@ -88,10 +138,7 @@ i1FxJbUZdvj6DhHcz+ISAuXV09S2TTQTcuEgwkYeIZk6ZURd2FeNusTr0dNETBJl
     def _get_public_key(self):
         """Load the embedded public key."""
         try:
-            return serialization.load_pem_public_key(
-                self.EMBEDDED_PUBLIC_KEY.encode(),
-                backend=default_backend()
-            )
+            return _load_public_key(self.EMBEDDED_PUBLIC_KEY)
         except Exception as e:
             raise ValueError(f"Invalid embedded public key: {e}")
     
@@ -105,28 +152,16 @@ i1FxJbUZdvj6DhHcz+ISAuXV09S2TTQTcuEgwkYeIZk6ZURd2FeNusTr0dNETBJl
         - Machine fingerprint (to bind to this specific installation)
         
         Returns:
-            A base64-encoded challenge string
+            The URL-safe base64 encoding of the 48-byte challenge
         """
-        # Generate cryptographically secure random bytes
-        random_bytes = secrets.token_bytes(32)
-        
-        # Add timestamp
-        timestamp = int(time.time())
-        
-        # Create machine fingerprint
-        machine_id = self._get_machine_fingerprint()
-        
-        # Combine all components
-        challenge_data = {
-            "r": base64.b64encode(random_bytes).decode(),  # random
-            "t": timestamp,  # timestamp
-            "m": machine_id[:16],  # machine (truncated)
-            "v": "1"  # version
-        }
-        
-        # Encode as base64 JSON for compactness
-        challenge_json = json.dumps(challenge_data, separators=(',', ':'))
-        challenge_b64 = base64.urlsafe_b64encode(challenge_json.encode()).decode()
+        # Fixed 48-byte layout:
+        # 32 B random || 8 B big-endian timestamp || 8 B machine fingerprint
+        blob = (
+            secrets.token_bytes(32)
+            + int(time.time()).to_bytes(8, "big")
+            + bytes.fromhex(self._get_machine_fingerprint())[:8]
+        )
+        challenge_b64 = _b64.urlsafe_b64encode(blob).decode()
         
         # Store for this session
         self._current_challenge = challenge_b64
@@ -137,7 +172,46 @@ i1FxJbUZdvj6DhHcz+ISAuXV09S2TTQTcuEgwkYeIZk6ZURd2FeNusTr0dNETBJl
         return challenge_b64
     
     def _get_machine_fingerprint(self) -> str:
-        """Get a fingerprint of this machine."""
+        """
+        Get a fingerprint of this machine.
+        
+        Computed once per manager and persisted to MACHINE_ID_FILE, so later
+        runs skip the NIC/hostname probes.
+        """
+        if self._machine_id is None:
+            self._machine_id = self._load_machine_id()
+        if self._machine_id is None:
+            self._machine_id = self._compute_machine_fingerprint()
+            self._save_machine_id(self._machine_id)
+        return self._machine_id
+    
+    def _load_machine_id(self) -> Optional[str]:
+        """Read the cached fingerprint, ignoring missing or malformed files."""
+        try:
+            cached = (self.base_dir / self.MACHINE_ID_FILE).read_text().strip()
+        except OSError:
+            return None
+        if len(cached) != 64:
+            return None
+        try:
+            bytes.fromhex(cached)
+        except ValueError:
+            return None
+        return cached
+    
+    def _save_machine_id(self, machine_id: str):
+        """Persist the fingerprint atomically (write temp file, then rename)."""
+        target = self.base_dir / self.MACHINE_ID_FILE
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(machine_id)
+            os.replace(tmp, target)
+        except OSError:
+            tmp.unlink(missing_ok=True)  # Non-critical
+    
+    @staticmethod
+    def _compute_machine_fingerprint() -> str:
+        """Hash the MAC address, hostname and architecture."""
         import platform
         import uuid
         
@@ -151,31 +225,26 @@ i1FxJbUZdvj6DhHcz+ISAuXV09S2TTQTcuEgwkYeIZk6ZURd2FeNusTr0dNETBJl
         return hashlib.sha256(combined.encode()).hexdigest()
     
     def _save_challenge(self, challenge: str):
-        """Save the current challenge to a file."""
+        """Save the current challenge to a file as "<challenge>\n<expiry>\n"."""
         try:
-            data = {
-                "challenge": challenge,
-                "created": time.time(),
-                "expires": time.time() + 3600  # 1 hour validity window
-            }
-            with open(self.challenge_path, "w") as f:
-                json.dump(data, f)
+            expires = int(time.time()) + 3600  # 1 hour validity window
+            self.challenge_path.write_text(f"{challenge}\n{expires}\n")
         except Exception:
             pass  # Non-critical
     
     def _load_challenge(self) -> Optional[str]:
         """Load challenge from file if exists and not expired."""
         try:
-            if self.challenge_path.exists():
-                with open(self.challenge_path, "r") as f:
-                    data = json.load(f)
-                
-                # Check expiry
-                if time.time() < data.get("expires", 0):
-                    return data.get("challenge")
-                else:
-                    # Expired, clean up
-                    self.challenge_path.unlink(missing_ok=True)
+            challenge, expires = self.challenge_path.read_text().split("\n")[:2]
+        except (OSError, ValueError):
+            # Missing file or old/unknown format
+            return None
+        try:
+            # Check expiry
+            if challenge and time.time() < int(expires):
+                return challenge
+            # Expired, clean up
+            self.challenge_path.unlink(missing_ok=True)
         except Exception:
             pass
         return None
@@ -199,7 +268,7 @@ i1FxJbUZdvj6DhHcz+ISAuXV09S2TTQTcuEgwkYeIZk6ZURd2FeNusTr0dNETBJl
         Validate a license key (signature) against the current challenge.
         
         Args:
-            license_key: Base64-encoded RSA signature of the challenge
+            license_key: Base64-encoded signature of the challenge
             
         Returns:
             Tuple of (is_valid, message)
@@ -211,18 +280,13 @@ i1FxJbUZdvj6DhHcz+ISAuXV09S2TTQTcuEgwkYeIZk6ZURd2FeNusTr0dNETBJl
         
         try:
             # Decode the license key (signature)
-            signature = base64.urlsafe_b64decode(license_key)
+            signature = _b64.urlsafe_b64decode(license_key)
             
             # Get the public key
             public_key = self._get_public_key()
             
             # Verify the signature
-            public_key.verify(
-                signature,
-                challenge.encode(),
-                padding.PKCS1v15(),
-                hashes.SHA256()
-            )
+            _verify(public_key, signature, challenge.encode())
             
             # Valid!
             self._session_validated = True
@@ -230,7 +294,7 @@ i1FxJbUZdvj6DhHcz+ISAuXV09S2TTQTcuEgwkYeIZk6ZURd2FeNusTr0dNETBJl
             
             return True, "License validated successfully"
             
-        except InvalidSignature:
+        except _crypto().InvalidSignature:
             return False, "Invalid license key - signature does not match"
         except Exception as e:
             return False, f"License validation error: {str(e)}"
@@ -261,50 +325,65 @@ i1FxJbUZdvj6DhHcz+ISAuXV09S2TTQTcuEgwkYeIZk6ZURd2FeNusTr0dNETBJl
         """
         challenge = self.get_current_challenge()
         
-        # Create a shorter display version (first 32 chars with dashes)
-        short = hashlib.sha256(challenge.encode()).hexdigest()[:24].upper()
+        # The challenge is fixed for the session, so only derive its
+        # display code when it changes
+        cached = self._display_challenge
+        if cached is not None and cached[0] == challenge:
+            return cached[1]
+        
+        # Create a shorter display version (96-bit digest as 24 hex chars with dashes)
+        short = hashlib.blake2b(challenge.encode(), digest_size=12).hexdigest().upper()
         formatted = "-".join([short[i:i+6] for i in range(0, 24, 6)])
         
+        self._display_challenge = (challenge, formatted)
         return formatted
     
     @staticmethod
-    def generate_key_pair(output_dir: str = ".") -> Tuple[str, str]:
+    def generate_key_pair(output_dir: str = ".", algorithm: str = "ed25519") -> Tuple[str, str]:
         """
-        Generate a new RSA key pair for licensing.
+        Generate a new key pair for licensing.
         
         This should be run ONCE by the owner to create their keys.
         
         Args:
             output_dir: Directory to save the keys
+            algorithm: "ed25519" (default; 64-byte signatures, fast verify)
+                or "rsa" (RSA-2048, for compatibility with older signers)
             
         Returns:
             Tuple of (private_key_path, public_key_path)
         """
         if not CRYPTO_AVAILABLE:
             raise ImportError("cryptography package required")
+        c = _crypto()
         
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # Generate RSA key pair
-        private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048,
-            backend=default_backend()
-        )
+        # Generate key pair
+        if algorithm == "ed25519":
+            private_key = c.ed25519.Ed25519PrivateKey.generate()
+        elif algorithm == "rsa":
+            private_key = c.rsa.generate_private_key(
+                public_exponent=65537,
+                key_size=2048,
+                backend=c.default_backend()
+            )
+        else:
+            raise ValueError(f"Unsupported key algorithm: {algorithm}")
         
         # Serialize private key (with password protection)
         private_pem = private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption()
+            encoding=c.serialization.Encoding.PEM,
+            format=c.serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=c.serialization.NoEncryption()
         )
         
         # Serialize public key
         public_key = private_key.public_key()
         public_pem = public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo
+            encoding=c.serialization.Encoding.PEM,
+            format=c.serialization.PublicFormat.SubjectPublicKeyInfo
         )
         
         # Save keys
@@ -335,24 +414,21 @@ i1FxJbUZdvj6DhHcz+ISAuXV09S2TTQTcuEgwkYeIZk6ZURd2FeNusTr0dNETBJl
         """
         if not CRYPTO_AVAILABLE:
             raise ImportError("cryptography package required")
+        c = _crypto()
         
         # Load private key
         with open(private_key_path, "rb") as f:
-            private_key = serialization.load_pem_private_key(
+            private_key = c.serialization.load_pem_private_key(
                 f.read(),
                 password=None,
-                backend=default_backend()
+                backend=c.default_backend()
             )
         
         # Sign the challenge
-        signature = private_key.sign(
-            challenge.encode(),
-            padding.PKCS1v15(),
-            hashes.SHA256()
-        )
+        signature = _sign(private_key, challenge.encode())
         
         # Return base64-encoded signature
-        return base64.urlsafe_b64encode(signature).decode()
+        return _b64.urlsafe_b64encode(signature).decode()
 
 
 class LicensePrompt:
@@ -484,6 +560,12 @@ def main():
         default=".",
         help="Output directory for keys (default: current directory)"
     )
+    gen_parser.add_argument(
+        "--algorithm", "-a",
+        choices=("ed25519", "rsa"),
+        default="ed25519",
+        help="Key algorithm (default: ed25519)"
+    )
     
     # Sign challenge command
     sign_parser = subparsers.add_parser("sign", help="Sign a challenge to generate license key")
@@ -508,9 +590,9 @@ def main():
     args = parser.parse_args()
     
     if args.command == "generate-keys":
-        print("🔑 Generating RSA key pair for licensing...")
+        print(f"🔑 Generating {args.algorithm.upper()} key pair for licensing...")
         try:
-            private_path, public_path = LicenseManager.generate_key_pair(args.output)
+            private_path, public_path = LicenseManager.generate_key_pair(args.output, args.algorithm)
             print(f"\n✓ Keys generated successfully!\n")
             print(f"PRIVATE KEY (KEEP SECRET!): {private_path}")
             print(f"PUBLIC KEY (embed in code):  {public_path}")
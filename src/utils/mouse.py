@@ -5,16 +5,67 @@ SAFETY CONSTRAINT: This module ONLY performs LEFT CLICKS.
 Right-clicks are NEVER performed under any circumstance.
 All click operations explicitly specify button='left'.
 """
+import ctypes
+import functools
+import itertools
 import math
 import random
+import sys
 import time
 
+import numpy as np
 import pyautogui
 
 from ..logger import get_logger
 
 logger = get_logger("MouseUtils")
 
+# =============================================================================
+# DISPATCH BACKEND
+# =============================================================================
+
+if sys.platform == "win32":
+    # Call user32 directly for the per-step moves and the click itself; pyautogui
+    # re-validates arguments, checks the fail-safe corner and sleeps PAUSE on
+    # every call, which adds up over a 60-step path.
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _user32.SetCursorPos.argtypes = (ctypes.c_int, ctypes.c_int)
+    _user32.SetCursorPos.restype = ctypes.c_bool
+    _user32.mouse_event.argtypes = (
+        ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_size_t
+    )
+    _user32.mouse_event.restype = None
+
+    MOUSEEVENTF_LEFTDOWN = 0x0002
+    MOUSEEVENTF_LEFTUP = 0x0004
+
+    _backend = "user32"
+
+    # Path points are already whole pixels, so the loop can call this directly
+    _set_cursor_pos = _user32.SetCursorPos
+
+    def _move_to(x, y):
+        _user32.SetCursorPos(int(x), int(y))
+
+    def _left_down():
+        _user32.mouse_event(MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
+
+    def _left_up():
+        _user32.mouse_event(MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
+else:
+    _backend = "pyautogui"
+
+    def _move_to(x, y):
+        pyautogui.moveTo(x, y, _pause=False)
+
+    _set_cursor_pos = _move_to
+
+    def _left_down():
+        pyautogui.mouseDown(button='left', _pause=False)
+
+    def _left_up():
+        pyautogui.mouseUp(button='left', _pause=False)
+
 # =============================================================================
 # MOVEMENT STYLE WEIGHTS - Controls variety of movement types
 # =============================================================================
@@ -31,6 +82,10 @@ MOVEMENT_STYLES = {
     "two_phase": 10,          # Pause midway, then continue
 }
 
+# Precomputed so each pick is a single bisect instead of re-summing weights
+_STYLE_NAMES = tuple(MOVEMENT_STYLES)
+_STYLE_CUM_WEIGHTS = tuple(itertools.accumulate(MOVEMENT_STYLES.values()))
+
 # =============================================================================
 # CLICK BEHAVIOR CONSTANTS
 # =============================================================================
@@ -42,10 +97,20 @@ CLICK_HOLD_DURATION_RANGE = (0.04, 0.10)
 POST_CLICK_DRIFT_PROBABILITY = 0.35
 POST_CLICK_DRIFT_RANGE = (1, 5)
 
+# Moves shorter than this (px) skip style selection and take a short direct path
+SHORT_MOVE_DISTANCE = 30
+SHORT_MOVE_DURATION = 0.08
+
 # Fatigue tracking
 _interaction_count = 0
 
 
+@functools.lru_cache(maxsize=1)
+def _screen_size():
+    """Primary screen size; queried once, resolution changes mid-session are not tracked."""
+    return pyautogui.size()
+
+
 def _get_fatigue_factor():
     """Returns a subtle fatigue factor."""
     global _interaction_count
@@ -54,15 +119,12 @@ def _get_fatigue_factor():
 
 def _weighted_choice(choices_dict):
     """Select a key from dict based on weight values."""
-    items = list(choices_dict.items())
-    total = sum(w for _, w in items)
-    r = random.uniform(0, total)
-    cumulative = 0
-    for key, weight in items:
-        cumulative += weight
-        if r <= cumulative:
-            return key
-    return items[-1][0]
+    return random.choices(tuple(choices_dict), weights=choices_dict.values())[0]
+
+
+def _pick_style():
+    """Select a movement style according to MOVEMENT_STYLES weights."""
+    return random.choices(_STYLE_NAMES, cum_weights=_STYLE_CUM_WEIGHTS)[0]
 
 
 def _lerp(a, b, t):
@@ -82,7 +144,8 @@ def _smoother_step(t):
 
 def _ease_out_cubic(t):
     """Decelerating to zero velocity."""
-    return 1 - pow(1 - t, 3)
+    u = 1 - t
+    return 1 - u * u * u
 
 
 def _ease_in_cubic(t):
@@ -95,80 +158,100 @@ def _ease_in_out_cubic(t):
     if t < 0.5:
         return 4 * t * t * t
     else:
-        return 1 - pow(-2 * t + 2, 3) / 2
+        u = 2 - 2 * t
+        return 1 - u * u * u / 2
+
+
+def _hesitant_ease(t):
+    """Very slow start (cubic in), then a fast commit (cubic out)."""
+    if t < 0.4:
+        return _ease_in_cubic(t / 0.4) * 0.2
+    return 0.2 + _ease_out_cubic((t - 0.4) / 0.6) * 0.8
+
+
+def _arc_bump(t):
+    """Single hump, zero at both ends and 1 at the midpoint."""
+    return math.sin(t * math.pi)
+
+
+def _s_wave(t):
+    """Double wave (one period of sin) tapered to zero at the ends and middle."""
+    return math.sin(t * math.pi * 2) * (1 - abs(t - 0.5) * 2)
+
+
+@functools.lru_cache(maxsize=256)
+def _eased(easing, steps, include_end=True):
+    """
+    Table of easing(i / steps) for i in 0..steps (or 0..steps-1).
+
+    Paths only ever use a few dozen step counts, so each curve is evaluated
+    once per count and then shared; the returned array is read-only.
+    """
+    count = steps + 1 if include_end else steps
+    table = np.fromiter((easing(i / steps) for i in range(count)), dtype=float, count=count)
+    table.flags.writeable = False
+    return table
+
+
+def _segment(a, b, smooth_t):
+    """Interpolate from point a to point b at every value of smooth_t, as an (n, 2) array."""
+    a = np.asarray(a, dtype=float)
+    # One outer product fills both columns; no per-axis temporaries to stack
+    return a + np.multiply.outer(smooth_t, np.asarray(b, dtype=float) - a)
+
+
+def _perpendicular(dx, dy):
+    """Unit vector perpendicular to (dx, dy)."""
+    norm = math.hypot(dx, dy) or 1
+    return -dy / norm, dx / norm
 
 
 def _generate_smooth_path_direct(start, end, steps):
     """Generate smooth direct path (like touchpad swipe)."""
-    points = []
-    for i in range(steps + 1):
-        t = i / steps
-        # Use smoother_step for butter-smooth movement
-        smooth_t = _smoother_step(t)
-        x = _lerp(start[0], end[0], smooth_t)
-        y = _lerp(start[1], end[1], smooth_t)
-        points.append((x, y))
-    return points
+    # Use smoother_step for butter-smooth movement
+    return _segment(start, end, _eased(_smoother_step, steps))
 
 
 def _generate_gentle_arc_path(start, end, steps):
     """Generate gentle arc path with subtle curve."""
-    points = []
     dx = end[0] - start[0]
     dy = end[1] - start[1]
     dist = math.hypot(dx, dy)
     
     # Very subtle arc - perpendicular offset
-    perp_x, perp_y = -dy, dx
-    norm = math.hypot(perp_x, perp_y) or 1
-    perp_x, perp_y = perp_x / norm, perp_y / norm
+    perp_x, perp_y = _perpendicular(dx, dy)
     
     # Random arc direction and small magnitude
     arc_magnitude = dist * random.uniform(0.05, 0.15) * random.choice([-1, 1])
     
-    for i in range(steps + 1):
-        t = i / steps
-        smooth_t = _smooth_step(t)
-        
-        # Arc peaks at middle of movement
-        arc_factor = math.sin(t * math.pi) * arc_magnitude
-        
-        x = _lerp(start[0], end[0], smooth_t) + perp_x * arc_factor
-        y = _lerp(start[1], end[1], smooth_t) + perp_y * arc_factor
-        points.append((x, y))
+    points = _segment(start, end, _eased(_smooth_step, steps))
+    
+    # Arc peaks at middle of movement
+    arc_factor = _eased(_arc_bump, steps) * arc_magnitude
+    points += np.multiply.outer(arc_factor, (perp_x, perp_y))
     return points
 
 
 def _generate_s_curve_path(start, end, steps):
     """Generate S-curve path."""
-    points = []
     dx = end[0] - start[0]
     dy = end[1] - start[1]
     dist = math.hypot(dx, dy)
     
-    perp_x, perp_y = -dy, dx
-    norm = math.hypot(perp_x, perp_y) or 1
-    perp_x, perp_y = perp_x / norm, perp_y / norm
+    perp_x, perp_y = _perpendicular(dx, dy)
     
     s_magnitude = dist * random.uniform(0.08, 0.18)
     
-    for i in range(steps + 1):
-        t = i / steps
-        smooth_t = _smoother_step(t)
-        
-        # S-curve: sin(2*pi*t) creates the double-wave
-        s_factor = math.sin(t * math.pi * 2) * s_magnitude * (1 - abs(t - 0.5) * 2)
-        
-        x = _lerp(start[0], end[0], smooth_t) + perp_x * s_factor
-        y = _lerp(start[1], end[1], smooth_t) + perp_y * s_factor
-        points.append((x, y))
+    points = _segment(start, end, _eased(_smoother_step, steps))
+    
+    # S-curve: sin(2*pi*t) creates the double-wave
+    s_factor = _eased(_s_wave, steps) * s_magnitude
+    points += np.multiply.outer(s_factor, (perp_x, perp_y))
     return points
 
 
 def _generate_lazy_drift_path(start, end, steps):
     """Generate slow, wandering path."""
-    points = []
-    
     # Create 2-3 random waypoints
     num_waypoints = random.randint(2, 3)
     waypoints = [start]
@@ -185,60 +268,31 @@ def _generate_lazy_drift_path(start, end, steps):
     
     # Interpolate through waypoints smoothly
     points_per_segment = steps // len(waypoints)
-    for seg in range(len(waypoints) - 1):
-        seg_start = waypoints[seg]
-        seg_end = waypoints[seg + 1]
-        for i in range(points_per_segment):
-            t = i / points_per_segment
-            smooth_t = _smooth_step(t)
-            x = _lerp(seg_start[0], seg_end[0], smooth_t)
-            y = _lerp(seg_start[1], seg_end[1], smooth_t)
-            points.append((x, y))
-    
-    points.append(end)
-    return points
+    smooth_t = _eased(_smooth_step, points_per_segment, include_end=False)
+    segments = [
+        _segment(waypoints[seg], waypoints[seg + 1], smooth_t)
+        for seg in range(len(waypoints) - 1)
+    ]
+    segments.append(np.array([end], dtype=float))
+    return np.concatenate(segments)
 
 
 def _generate_quick_snap_path(start, end, steps):
     """Generate fast snap movement - few points, quick timing."""
     # Use fewer effective points for snappier feel
     actual_steps = max(5, steps // 4)
-    points = []
-    
-    for i in range(actual_steps + 1):
-        t = i / actual_steps
-        # Ease out - fast start, slow end
-        smooth_t = _ease_out_cubic(t)
-        x = _lerp(start[0], end[0], smooth_t)
-        y = _lerp(start[1], end[1], smooth_t)
-        points.append((x, y))
-    return points
+    # Ease out - fast start, slow end
+    return _segment(start, end, _eased(_ease_out_cubic, actual_steps))
 
 
 def _generate_hesitant_path(start, end, steps):
     """Generate hesitant movement - slow then fast."""
-    points = []
-    
-    for i in range(steps + 1):
-        t = i / steps
-        # Custom easing: very slow start (cubic in), fast finish
-        if t < 0.4:
-            # Slow initial phase
-            smooth_t = _ease_in_cubic(t / 0.4) * 0.2
-        else:
-            # Fast commit phase
-            remaining = (t - 0.4) / 0.6
-            smooth_t = 0.2 + _ease_out_cubic(remaining) * 0.8
-        
-        x = _lerp(start[0], end[0], smooth_t)
-        y = _lerp(start[1], end[1], smooth_t)
-        points.append((x, y))
-    return points
+    # Custom easing: very slow start (cubic in), fast finish
+    return _segment(start, end, _eased(_hesitant_ease, steps))
 
 
 def _generate_overshoot_path(start, end, steps):
     """Generate path that overshoots then corrects."""
-    points = []
     dx = end[0] - start[0]
     dy = end[1] - start[1]
     
@@ -248,29 +302,19 @@ def _generate_overshoot_path(start, end, steps):
     
     # First phase: go past target (70% of steps)
     phase1_steps = int(steps * 0.7)
-    for i in range(phase1_steps):
-        t = i / phase1_steps
-        smooth_t = _ease_out_cubic(t)
-        x = _lerp(start[0], overshoot_point[0], smooth_t)
-        y = _lerp(start[1], overshoot_point[1], smooth_t)
-        points.append((x, y))
-    
-    # Second phase: correct back (30% of steps)
+    phase1 = _segment(start, overshoot_point, _eased(_ease_out_cubic, phase1_steps, False))
+    
+    # Second phase: correct back (30% of steps). Quintic rather than the
+    # piecewise in-out cubic, so acceleration stays continuous through the
+    # midpoint of the correction instead of jumping there.
     phase2_steps = steps - phase1_steps
-    for i in range(phase2_steps + 1):
-        t = i / phase2_steps
-        smooth_t = _ease_in_out_cubic(t)
-        x = _lerp(overshoot_point[0], end[0], smooth_t)
-        y = _lerp(overshoot_point[1], end[1], smooth_t)
-        points.append((x, y))
+    phase2 = _segment(overshoot_point, end, _eased(_smoother_step, phase2_steps))
     
-    return points
+    return np.concatenate((phase1, phase2))
 
 
 def _generate_two_phase_path(start, end, steps):
     """Generate path with pause in middle."""
-    points = []
-    
     # Midpoint with slight random offset
     mid = (
         _lerp(start[0], end[0], 0.5) + random.uniform(-15, 15),
@@ -280,27 +324,28 @@ def _generate_two_phase_path(start, end, steps):
     half_steps = steps // 2
     
     # First half
-    for i in range(half_steps):
-        t = i / half_steps
-        smooth_t = _smoother_step(t)
-        x = _lerp(start[0], mid[0], smooth_t)
-        y = _lerp(start[1], mid[1], smooth_t)
-        points.append((x, y))
+    first = _segment(start, mid, _eased(_smoother_step, half_steps, False))
     
     # Add "pause" points at midpoint
-    pause_points = random.randint(3, 8)
-    for _ in range(pause_points):
-        points.append(mid)
+    pause = np.tile(mid, (random.randint(3, 8), 1))
     
     # Second half
-    for i in range(half_steps + 1):
-        t = i / half_steps
-        smooth_t = _smoother_step(t)
-        x = _lerp(mid[0], end[0], smooth_t)
-        y = _lerp(mid[1], end[1], smooth_t)
-        points.append((x, y))
+    second = _segment(mid, end, _eased(_smoother_step, half_steps))
     
-    return points
+    return np.concatenate((first, pause, second))
+
+
+# Path generator for each MOVEMENT_STYLES key
+_PATH_GENERATORS = {
+    "smooth_direct": _generate_smooth_path_direct,
+    "gentle_arc": _generate_gentle_arc_path,
+    "s_curve": _generate_s_curve_path,
+    "lazy_drift": _generate_lazy_drift_path,
+    "quick_snap": _generate_quick_snap_path,
+    "hesitant": _generate_hesitant_path,
+    "overshoot_correct": _generate_overshoot_path,
+    "two_phase": _generate_two_phase_path,
+}
 
 
 def human_like_move(target_x, target_y, duration=None, allow_overshoot=True):
@@ -317,70 +362,80 @@ def human_like_move(target_x, target_y, duration=None, allow_overshoot=True):
     
     # Early exit for tiny movements
     if dist < 3:
-        pyautogui.moveTo(target_x, target_y)
+        _move_to(target_x, target_y)
         return
     
-    # Randomly select movement style
-    style = _weighted_choice(MOVEMENT_STYLES)
-    
-    # Dynamic duration based on style and distance
-    if duration is None:
-        base_duration = 0.15 + (dist / 1500)  # Base: faster for short, slower for long
+    if dist < SHORT_MOVE_DISTANCE:
+        # A twitch: any curvature would be imperceptible, so go straight there
+        style = "smooth_direct"
+        if duration is None:
+            duration = SHORT_MOVE_DURATION
+        steps = max(4, int(dist * 0.3))
+    else:
+        # Randomly select movement style
+        style = _pick_style()
         
-        if style == "quick_snap":
-            duration = base_duration * random.uniform(0.3, 0.5)
-        elif style == "lazy_drift":
-            duration = base_duration * random.uniform(1.8, 2.5)
-        elif style == "hesitant":
-            duration = base_duration * random.uniform(1.2, 1.6)
-        else:
-            duration = base_duration * random.uniform(0.7, 1.3)
+        # Dynamic duration based on style and distance
+        if duration is None:
+            base_duration = 0.15 + (dist / 1500)  # Base: faster for short, slower for long
+            
+            if style == "quick_snap":
+                duration = base_duration * random.uniform(0.3, 0.5)
+            elif style == "lazy_drift":
+                duration = base_duration * random.uniform(1.8, 2.5)
+            elif style == "hesitant":
+                duration = base_duration * random.uniform(1.2, 1.6)
+            else:
+                duration = base_duration * random.uniform(0.7, 1.3)
+            
+            # Cap duration
+            duration = max(0.08, min(duration, 1.5))
         
-        # Cap duration
-        duration = max(0.08, min(duration, 1.5))
-    
-    # Calculate steps based on duration (smooth ~60fps feel)
-    steps = max(8, int(duration * 60))
+        # Calculate steps based on duration (smooth ~60fps feel)
+        steps = max(8, int(duration * 60))
     
     start = (start_x, start_y)
     end = (target_x, target_y)
     
     # Generate path based on selected style
-    if style == "smooth_direct":
-        points = _generate_smooth_path_direct(start, end, steps)
-    elif style == "gentle_arc":
-        points = _generate_gentle_arc_path(start, end, steps)
-    elif style == "s_curve":
-        points = _generate_s_curve_path(start, end, steps)
-    elif style == "lazy_drift":
-        points = _generate_lazy_drift_path(start, end, steps)
-    elif style == "quick_snap":
-        points = _generate_quick_snap_path(start, end, steps)
-    elif style == "hesitant":
-        points = _generate_hesitant_path(start, end, steps)
-    elif style == "overshoot_correct":
-        points = _generate_overshoot_path(start, end, steps)
-    elif style == "two_phase":
-        points = _generate_two_phase_path(start, end, steps)
-    else:
-        points = _generate_smooth_path_direct(start, end, steps)
+    points = _PATH_GENERATORS.get(style, _generate_smooth_path_direct)(start, end, steps)
     
     # Calculate timing per point
-    step_delay = duration / len(points) if points else 0.01
-    
-    # Execute movement - smooth, no jitter
-    original_pause = pyautogui.PAUSE
-    pyautogui.PAUSE = 0
-    
-    try:
-        for x, y in points:
-            pyautogui.moveTo(x, y)
-            time.sleep(step_delay)
-    finally:
-        pyautogui.PAUSE = original_pause
+    step_delay = duration / len(points) if len(points) else 0.01
+    
+    # Snap to whole pixels once and keep only the points where the pixel
+    # actually changes (the two-phase pause and the slow ends of an ease
+    # produce runs of identical points). Each kept point remembers its index
+    # in the full path, so timing is the same as if every point were sent.
+    pixels = np.rint(points).astype(np.int64)
+    changed = np.ones(len(pixels), dtype=bool)
+    changed[1:] = np.any(pixels[1:] != pixels[:-1], axis=1)
+    kept = np.flatnonzero(changed)
+    # Sweep parallel x / y columns rather than materialising a row per point
+    xs, ys = pixels[kept].T.tolist()
+    
+    # Execute movement - smooth, no jitter. Each point has an absolute due
+    # time, so sleep overshoot does not accumulate over the path; a point we
+    # are more than a step late for is skipped and the next one catches up.
+    move = _set_cursor_pos
+    sleep = time.sleep
+    clock = time.perf_counter
+    start_time = clock()
+    for i, x, y in zip(kept.tolist(), xs, ys):
+        due = start_time + i * step_delay
+        remaining = due - clock()
+        if remaining > 0.0005:
+            sleep(remaining)
+        if clock() - due < step_delay:
+            move(x, y)
+    
+    # Hold the last point for its share of the duration
+    remaining = start_time + len(pixels) * step_delay - clock()
+    if remaining > 0.0005:
+        sleep(remaining)
     
     # Ensure we end exactly at target
-    pyautogui.moveTo(target_x, target_y)
+    _move_to(target_x, target_y)
     logger.debug(f"Mouse moved ({style}) to ({target_x}, {target_y})")
 
 
@@ -408,29 +463,24 @@ def click_at(x, y):
         time.sleep(random.uniform(0.03, 0.12))
     
     # Perform LEFT click only
-    original_pause = pyautogui.PAUSE
-    pyautogui.PAUSE = 0
-    try:
-        pyautogui.mouseDown(button='left')
-        time.sleep(random.uniform(*CLICK_HOLD_DURATION_RANGE))
-        pyautogui.mouseUp(button='left')
-        
-        # Rare accidental double-click
-        if random.random() < DOUBLE_CLICK_MISTAKE_PROBABILITY:
-            time.sleep(random.uniform(0.04, 0.10))
-            pyautogui.mouseDown(button='left')
-            time.sleep(random.uniform(0.02, 0.06))
-            pyautogui.mouseUp(button='left')
-            logger.debug("Accidental double-click")
-    finally:
-        pyautogui.PAUSE = original_pause
+    _left_down()
+    time.sleep(random.uniform(*CLICK_HOLD_DURATION_RANGE))
+    _left_up()
+    
+    # Rare accidental double-click
+    if random.random() < DOUBLE_CLICK_MISTAKE_PROBABILITY:
+        time.sleep(random.uniform(0.04, 0.10))
+        _left_down()
+        time.sleep(random.uniform(0.02, 0.06))
+        _left_up()
+        logger.debug("Accidental double-click")
     
     # Post-click drift
     if random.random() < POST_CLICK_DRIFT_PROBABILITY:
         drift_x = offset_x + random.uniform(-POST_CLICK_DRIFT_RANGE[1], POST_CLICK_DRIFT_RANGE[1])
         drift_y = offset_y + random.uniform(-POST_CLICK_DRIFT_RANGE[1], POST_CLICK_DRIFT_RANGE[1])
         time.sleep(random.uniform(0.01, 0.04))
-        pyautogui.moveTo(drift_x, drift_y)
+        _move_to(drift_x, drift_y)
     
     logger.info(f"Clicked at ({offset_x}, {offset_y})")
 
@@ -440,7 +490,7 @@ def move_away_from_options():
     Move mouse to random safe screen position after selecting answer.
     Uses varied movement styles for unpredictability.
     """
-    screen_width, screen_height = pyautogui.size()
+    screen_width, screen_height = _screen_size()
     
     # Safe zone: 20% margin from edges
     margin_x = int(screen_width * 0.2)
@@ -460,8 +510,9 @@ def move_away_from_options():
     
     # Sometimes move in stages
     if random.random() < 0.2:
-        mid_x = (pyautogui.position()[0] + target_x) // 2 + random.randint(-40, 40)
-        mid_y = (pyautogui.position()[1] + target_y) // 2 + random.randint(-40, 40)
+        cur_x, cur_y = pyautogui.position()
+        mid_x = (cur_x + target_x) // 2 + random.randint(-40, 40)
+        mid_y = (cur_y + target_y) // 2 + random.randint(-40, 40)
         mid_x = max(margin_x, min(screen_width - margin_x, mid_x))
         mid_y = max(margin_y, min(screen_height - margin_y, mid_y))
         
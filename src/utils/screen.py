@@ -1,6 +1,7 @@
 import difflib
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 import cv2
 import numpy as np
@@ -51,127 +52,236 @@ def capture_screen(filename=None):
     return screenshot
 
 
-def preprocess_image_for_ocr(pil_image):
+# Longest side handed to Tesseract. Its run time grows with image area, and
+# UI text stays legible at this size on typical 1080p-4K captures.
+OCR_MAX_DIMENSION = 1600
+
+
+def _downscale_for_ocr(pil_image):
     """
-    Advanced preprocessing pipeline to maximize OCR accuracy.
-    Returns a list of processed images to try: [Original, Grayscale, Thresholded, Inverted]
+    Shrinks the image so its longest side is at most OCR_MAX_DIMENSION.
+    Returns (image, scale); multiply OCR coordinates by 1 / scale to map
+    them back onto the original image.
+    """
+    width, height = pil_image.size
+    scale = min(1.0, OCR_MAX_DIMENSION / max(width, height))
+    if scale == 1.0:
+        return pil_image, 1.0
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    # BOX averages the covered source pixels (area resampling)
+    return pil_image.resize(size, Image.BOX), scale
+
+
+def _iter_ocr_variants(pil_image):
+    """
+    Yields the OCR variants in the order they are tried:
+    Original, Grayscale, Thresholded, Inverted.
+    Each one is only computed when the caller asks for it, so a match on
+    the raw image skips the OpenCV work entirely.
     """
-    # Convert PIL to OpenCV format
-    img_cv = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
+    # Try raw first (sometimes it's best)
+    yield pil_image
 
-    # 1. Grayscale
-    gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+    # 1. Grayscale - straight from PIL, no colour copy for OpenCV
+    gray_pil = pil_image.convert("L")
+    yield gray_pil
+    gray = np.asarray(gray_pil)
 
     # 2. Binary Thresholding (Standard) - Good for black text on white
     # Uses Otsu's binarization automatically
     _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    yield Image.fromarray(thresh)
+
+    # 3. Inverted Threshold - Good for white text on dark background.
+    # Needs its own buffer: Image.fromarray shares memory with thresh.
+    yield Image.fromarray(np.subtract(255, thresh, out=np.empty_like(thresh)))
+
+
+def preprocess_image_for_ocr(pil_image):
+    """
+    Advanced preprocessing pipeline to maximize OCR accuracy.
+    Returns a list of processed images to try: [Original, Grayscale, Thresholded, Inverted]
+    """
+    return list(_iter_ocr_variants(pil_image))
 
-    # 3. Inverted Threshold - Good for white text on dark background
-    thresh_inv = cv2.bitwise_not(thresh)
 
-    # Convert back to PIL images for Tesseract
-    return [
-        pil_image,  # Try raw first (sometimes it's best)
-        Image.fromarray(gray),
-        Image.fromarray(thresh),
-        Image.fromarray(thresh_inv),
-    ]
+_VARIANT_NAMES = ["Raw", "Grayscale", "Threshold", "Inverted"]
 
+# Tesseract runs as a subprocess, so the preprocessed variants can be OCR'd
+# side by side; worker threads are only started on first use.
+_OCR_POOL = ThreadPoolExecutor(max_workers=len(_VARIANT_NAMES) - 1, thread_name_prefix="OCR")
 
-def find_text_coordinates(image, target_text):
+
+def _ocr_words(img_variant):
     """
-    Finds the center coordinates of the target_text in the image using OCR.
-    Uses 'Advanced Multi-Stage Detection' to ensure 100% certainty.
+    Runs Tesseract once on an image variant and returns the recognised words
+    with their bounding boxes.
+    """
+    # PSM 11 = Sparse text (good for UI labels)
+    data = pytesseract.image_to_data(
+        img_variant, output_type=Output.DICT, config="--psm 11"
+    )
+
+    # Filter on confidence in one pass (truncated like int(), so "0.5" is out)
+    confs = np.asarray(data["conf"], dtype=float).astype(np.int64)
+    texts = data["text"]
+
+    found_words = []
+    for i in np.flatnonzero(confs > 0).tolist():
+        text = texts[i].strip()
+        if text:
+            found_words.append(
+                {
+                    "text": text,
+                    "left": data["left"][i],
+                    "top": data["top"][i],
+                    "width": data["width"][i],
+                    "height": data["height"][i],
+                }
+            )
+    return found_words
+
+
+def _ocr_stage(idx, img_variant):
+    """OCR one variant, returning its words or None if Tesseract failed."""
+    variant_name = _VARIANT_NAMES[idx]
+    logger.debug(f"Stage {idx + 1}: Running OCR on {variant_name} image...")
+    try:
+        return _ocr_words(img_variant)
+    except Exception as e:
+        logger.error(f"OCR Error in stage {variant_name}: {e}")
+        return None
+
+
+def _iter_ocr_results(image):
+    """
+    Yields the OCR words of each variant in _VARIANT_NAMES order (None for a
+    failed stage). The raw image is read on its own first; only if the caller
+    asks for more are the remaining variants built and OCR'd concurrently.
+    """
+    variants = _iter_ocr_variants(image)
+    yield _ocr_stage(0, next(variants))
+
+    try:
+        rest = list(variants)
+    except Exception as e:
+        logger.error(f"OCR preprocessing failed: {e}")
+        return
+
+    futures = [_OCR_POOL.submit(_ocr_stage, idx, img) for idx, img in enumerate(rest, start=1)]
+    try:
+        for future in futures:
+            yield future.result()
+    finally:
+        # Caller stopped early (perfect match): drop stages not yet started
+        for future in futures:
+            future.cancel()
+
+
+def _best_window(found_words, normalized_target, variant_name, best_ratio):
+    """
+    Slides a window of len(target) words over found_words and returns the
+    (ratio, window) that beats best_ratio, or (best_ratio, None).
+    """
+    best_match = None
+    size = len(normalized_target)
+    lowered = [w["text"].lower() for w in found_words]
+
+    # SequenceMatcher caches its second sequence, so the target goes there
+    # once and only the window is swapped in per step
+    matcher = difflib.SequenceMatcher(None, b=normalized_target)
+    for i in range(len(found_words) - size + 1):
+        window_text = lowered[i : i + size]
+        matcher.set_seq1(window_text)
+        ratio = matcher.ratio()
+
+        if ratio > best_ratio:
+            best_ratio = ratio
+            best_match = found_words[i : i + size]
+            logger.debug(
+                f"  > New Best Match in {variant_name}: {window_text} (Conf: {ratio:.2f})"
+            )
+
+            # 100% Match Short-circuit
+            if ratio == 1.0:
+                break
+    return best_ratio, best_match
+
+
+def find_text_coordinates_many(image, targets):
     """
+    Finds the center coordinates of each text in targets using a single OCR
+    pass per image variant. Returns a list aligned with targets, holding
+    (x, y) or None for each entry.
+    """
+    results = [None] * len(targets)
     if not HAS_TESSERACT:
         logger.debug("Skipping local OCR (Tesseract not available).")
-        return None
+        return results
 
-    if not target_text:
-        return None
+    if not any(targets):
+        return results
 
-    target_words = target_text.split()
-    normalized_target = [w.lower() for w in target_words]
-    logger.debug(f"Targeting logic initiated for: '{target_text}'")
+    # Generate processed variants and OCR them lazily; each variant is built
+    # and read at most once and shared between every target.
+    image, scale = _downscale_for_ocr(image)
+    ocr_results = _iter_ocr_results(image)
+    ocr_cache = []
 
-    # Generate processed variants
-    processed_images = preprocess_image_for_ocr(image)
+    for t_idx, target_text in enumerate(targets):
+        if not target_text:
+            continue
 
-    best_overall_match = None
-    best_overall_ratio = 0.0
+        normalized_target = [w.lower() for w in target_text.split()]
+        logger.debug(f"Targeting logic initiated for: '{target_text}'")
 
-    # Try parallel-ish execution (sequential here for simplicity) on all image variants
-    for idx, img_variant in enumerate(processed_images):
-        variant_name = ["Raw", "Grayscale", "Threshold", "Inverted"][idx]
-        logger.debug(f"Stage {idx + 1}: Running OCR on {variant_name} image...")
+        best_overall_match = None
+        best_overall_ratio = 0.0
 
-        try:
-            # PSM 11 = Sparse text (good for UI labels)
-            data = pytesseract.image_to_data(
-                img_variant, output_type=Output.DICT, config="--psm 11"
-            )
+        for idx, variant_name in enumerate(_VARIANT_NAMES):
+            if idx == len(ocr_cache):
+                ocr_cache.append(next(ocr_results, None))
 
-            n_boxes = len(data["text"])
-            found_words = []
-
-            for i in range(n_boxes):
-                if int(data["conf"][i]) > 0:
-                    text = data["text"][i].strip()
-                    if text:
-                        found_words.append(
-                            {
-                                "text": text,
-                                "left": data["left"][i],
-                                "top": data["top"][i],
-                                "width": data["width"][i],
-                                "height": data["height"][i],
-                            }
-                        )
-
-            # Search for best match in this variant
-            for i in range(len(found_words) - len(target_words) + 1):
-                window = found_words[i : i + len(target_words)]
-                window_text = [w["text"].lower() for w in window]
-
-                matcher = difflib.SequenceMatcher(None, normalized_target, window_text)
-                ratio = matcher.ratio()
-
-                if ratio > best_overall_ratio:
-                    best_overall_ratio = ratio
-                    best_overall_match = window
-                    logger.debug(
-                        f"  > New Best Match in {variant_name}: {window_text} (Conf: {ratio:.2f})"
-                    )
-
-                    # 100% Match Short-circuit
-                    if ratio == 1.0:
-                        break
+            found_words = ocr_cache[idx]
+            if found_words is None:
+                continue
+
+            ratio, window = _best_window(
+                found_words, normalized_target, variant_name, best_overall_ratio
+            )
+            if window is not None:
+                best_overall_ratio, best_overall_match = ratio, window
 
             if best_overall_ratio == 1.0:
                 logger.info("  > Perfect match found. Stopping OCR pipeline.")
                 break
 
-        except Exception as e:
-            logger.error(f"OCR Error in stage {variant_name}: {e}")
-            continue
+        # Result processing
+        if best_overall_match and best_overall_ratio > 0.8:
+            x1 = best_overall_match[0]["left"]
+            y1 = best_overall_match[0]["top"]
+            x2 = best_overall_match[-1]["left"] + best_overall_match[-1]["width"]
+            y2 = best_overall_match[-1]["top"] + best_overall_match[-1]["height"]
+
+            # Calculate EXACT center, back in full-resolution pixels
+            center_x = int((x1 + (x2 - x1) / 2) / scale)
+            center_y = int((y1 + (y2 - y1) / 2) / scale)
 
-    # Result processing
-    if best_overall_match and best_overall_ratio > 0.8:
-        x1 = best_overall_match[0]["left"]
-        y1 = best_overall_match[0]["top"]
-        x2 = best_overall_match[-1]["left"] + best_overall_match[-1]["width"]
-        y2 = best_overall_match[-1]["top"] + best_overall_match[-1]["height"]
+            logger.info(
+                f"Target Acquired: '{target_text}' at ({center_x}, {center_y}) | Confidence: {best_overall_ratio:.2f}"
+            )
+            results[t_idx] = (center_x, center_y)
+        else:
+            logger.warning(
+                f"Target Acquisition Failed. Best Confidence: {best_overall_ratio:.2f}"
+            )
 
-        # Calculate EXACT center
-        center_x = x1 + (x2 - x1) // 2
-        center_y = y1 + (y2 - y1) // 2
+    return results
 
-        logger.info(
-            f"Target Acquired: '{target_text}' at ({center_x}, {center_y}) | Confidence: {best_overall_ratio:.2f}"
-        )
-        return (center_x, center_y)
 
-    logger.warning(
-        f"Target Acquisition Failed. Best Confidence: {best_overall_ratio:.2f}"
-    )
-    return None
+def find_text_coordinates(image, target_text):
+    """
+    Finds the center coordinates of the target_text in the image using OCR.
+    Uses 'Advanced Multi-Stage Detection' to ensure 100% certainty.
+    """
+    return find_text_coordinates_many(image, [target_text])[0]
@@ -13,17 +13,58 @@ Security Model:
 """
 
 import base64
+import contextlib
+import ctypes
+import functools
 import hashlib
-import json
 import os
 import platform
+import re
+import secrets
 import subprocess
+import sys
+import threading
 import time
 import uuid
 from pathlib import Path
 from typing import Optional, Tuple
 
 
+# Prefix to identify encrypted keys (V2 = AES-GCM, V1 = legacy Fernet)
+_ENCRYPTED_PREFIX = "SCRY_ENC_V2:"
+_LEGACY_PREFIX = "SCRY_ENC_V1:"
+_ENCRYPTED_PREFIXES = (_ENCRYPTED_PREFIX, _LEGACY_PREFIX)
+_ENCRYPTED_PREFIX_LEN = len(_ENCRYPTED_PREFIX)
+_ENCRYPTED_PREFIX_B = _ENCRYPTED_PREFIX.encode()
+_GCM_NONCE_SIZE = 12
+
+FILE_ATTRIBUTE_HIDDEN = 0x02
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    # Declared once so saving the installation file does a single typed call
+    _SetFileAttributesW = ctypes.WinDLL("kernel32", use_last_error=True).SetFileAttributesW
+    _SetFileAttributesW.argtypes = (wintypes.LPCWSTR, wintypes.DWORD)
+    _SetFileAttributesW.restype = wintypes.BOOL
+else:
+    _SetFileAttributesW = None
+
+
+@functools.lru_cache(maxsize=None)
+def _platform_system() -> str:
+    """platform.system(), looked up once per process."""
+    return platform.system()
+
+
+@functools.lru_cache(maxsize=8)
+def _env_assignment_pattern(key_name: str) -> "re.Pattern[str]":
+    """Regex matching a `KEY=value` line in a .env file (spaces around '=' allowed)."""
+    return re.compile(
+        rf"^[ \t]*{re.escape(key_name)}[ \t]*=(?P<value>[^\r\n]*)$", re.MULTILINE
+    )
+
+
 class SecureKeyManager:
     """
     Manages secure, machine-bound API key encryption and storage.
@@ -42,8 +83,8 @@ class SecureKeyManager:
     
     # File to store the installation-specific salt
     INSTALLATION_ID_FILE = ".scry_installation"
-    # Prefix to identify encrypted keys
-    ENCRYPTED_PREFIX = "SCRY_ENC_V1:"
+    # Prefix to identify encrypted keys (public alias of the module constant)
+    ENCRYPTED_PREFIX = _ENCRYPTED_PREFIX
     
     def __init__(self, base_dir: str):
         """
@@ -54,14 +95,42 @@ class SecureKeyManager:
         """
         self.base_dir = os.path.abspath(base_dir)
         # Normalize path on Windows to ensure consistent drive letter casing
-        if platform.system() == "Windows" and len(self.base_dir) >= 2 and self.base_dir[1] == ':':
+        if _platform_system() == "Windows" and len(self.base_dir) >= 2 and self.base_dir[1] == ':':
             self.base_dir = self.base_dir[0].upper() + self.base_dir[1:]
         self.installation_id_path = os.path.join(self.base_dir, self.INSTALLATION_ID_FILE)
+        self._base_dir_b = self.base_dir.encode()
+        self._raw_key: Optional[bytes] = None
+        self._cipher = None
         self._fernet = None
         self._key_valid = False
+        # Derivation inputs, kept so re-deriving (e.g. after a reset) is one hash
+        self._machine_id_cache: Optional[str] = None
+        self._installation_id_cache: Optional[str] = None
+        self._installation_record: Optional[dict] = None
+        self._machine_id_lock = threading.Lock()
     
     def _get_machine_id(self) -> str:
-        """Get a unique identifier for this machine."""
+        """
+        Get a unique identifier for this machine (probed once per instance).
+        
+        If a prefetch is still running, this waits for it rather than
+        probing a second time.
+        """
+        if self._machine_id_cache is None:
+            with self._machine_id_lock:
+                if self._machine_id_cache is None:
+                    self._machine_id_cache = self._probe_machine_id()
+        return self._machine_id_cache
+    
+    def prefetch_machine_id(self) -> None:
+        """Start probing the machine ID on a background thread (e.g. during UI startup)."""
+        if self._machine_id_cache is None:
+            threading.Thread(
+                target=self._get_machine_id, name="MachineIdPrefetch", daemon=True
+            ).start()
+    
+    def _probe_machine_id(self) -> str:
+        """Collect the hardware and OS identifiers that make up the machine ID."""
         machine_id_parts = []
         
         # 1. Use uuid.getnode() for MAC address (partial hardware ID)
@@ -76,7 +145,8 @@ class SecureKeyManager:
         machine_id_parts.append(f"arch:{platform.machine()}")
         
         # 4. Windows-specific: Get MachineGuid from registry (most stable identifier)
-        if platform.system() == "Windows":
+        system = _platform_system()
+        if system == "Windows":
             try:
                 import winreg
                 with winreg.OpenKey(
@@ -92,14 +162,14 @@ class SecureKeyManager:
             # as wmic can return serials in different orders or formats
         
         # 5. Linux/Mac: Try to read machine-id
-        elif platform.system() == "Linux":
+        elif system == "Linux":
             try:
                 with open("/etc/machine-id", "r") as f:
                     machine_id_parts.append(f"mid:{f.read().strip()}")
             except Exception:
                 pass
         
-        elif platform.system() == "Darwin":  # macOS
+        elif system == "Darwin":  # macOS
             try:
                 result = subprocess.run(
                     ["ioreg", "-rd1", "-c", "IOPlatformExpertDevice"],
@@ -126,71 +196,105 @@ class SecureKeyManager:
         and stored in a hidden file. If the file is missing, a new
         ID is generated, which will invalidate any existing encrypted keys.
         """
-        if os.path.exists(self.installation_id_path):
-            try:
-                with open(self.installation_id_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    return data.get("id", "")
-            except Exception:
-                pass
+        if self._installation_id_cache is not None:
+            return self._installation_id_cache
         
-        # Generate new installation ID
-        new_id = hashlib.sha256(
-            f"{uuid.uuid4()}-{time.time_ns()}".encode()
-        ).hexdigest()
+        # Open directly rather than exists()+open(): one syscall, no race
+        try:
+            self._installation_id_cache = self._load_installation_record().get("id", "")
+            return self._installation_id_cache
+        except Exception:
+            # Missing or unreadable; start a fresh installation
+            pass
+        
+        # Generate new installation ID (64 hex chars, same shape as before)
+        new_id = secrets.token_hex(32)
         
         self._save_installation_id(new_id)
+        self._installation_id_cache = new_id
         return new_id
     
+    def _read_installation_record(self) -> dict:
+        """
+        Read the installation file as a dict with id, created and path.
+        
+        The file is a single `id<TAB>created<TAB>path` line; files written
+        by older versions hold a JSON object instead and are still accepted.
+        """
+        with open(self.installation_id_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        
+        if content.startswith("{"):
+            import json
+            return json.loads(content)
+        
+        installation_id, created, path = content.rstrip("\n").split("\t", 2)
+        return {"id": installation_id, "created": float(created), "path": path}
+    
+    def _load_installation_record(self) -> dict:
+        """Return the installation record, reading the file at most once."""
+        if self._installation_record is None:
+            self._installation_record = self._read_installation_record()
+        return self._installation_record
+    
     def _save_installation_id(self, installation_id: str) -> bool:
         """Save the installation ID to the hidden file."""
         try:
-            data = {
-                "id": installation_id,
-                "created": time.time(),
-                "path": self.base_dir
-            }
+            created = time.time()
             with open(self.installation_id_path, "w", encoding="utf-8") as f:
-                json.dump(data, f)
+                f.write(f"{installation_id}\t{created}\t{self.base_dir}\n")
+            self._installation_record = {
+                "id": installation_id, "created": created, "path": self.base_dir
+            }
             
-            # On Windows, make the file hidden
-            if platform.system() == "Windows":
-                try:
-                    import ctypes
-                    ctypes.windll.kernel32.SetFileAttributesW(
-                        self.installation_id_path, 0x02  # FILE_ATTRIBUTE_HIDDEN
-                    )
-                except Exception:
-                    pass
+            # On Windows, make the file hidden (failure just leaves it visible)
+            if _SetFileAttributesW is not None:
+                _SetFileAttributesW(self.installation_id_path, FILE_ATTRIBUTE_HIDDEN)
             
             return True
         except Exception as e:
             print(f"[SecureKeyManager] Warning: Could not save installation ID: {e}")
             return False
     
-    def _derive_key(self) -> bytes:
+    def _derive_raw_key(self) -> bytes:
         """
-        Derive the encryption key from machine-specific data.
+        Derive the 32-byte encryption key from machine-specific data.
         
         The key is derived from:
         1. Machine ID (hardware fingerprint)
         2. Installation path (prevents copy-paste attacks)
         3. Installation ID (unique salt per installation)
         """
-        machine_id = self._get_machine_id()
-        installation_id = self._get_installation_id()
-        
-        # Combine all components
-        key_material = f"{machine_id}|{self.base_dir}|{installation_id}"
-        
-        # Derive a 32-byte key using SHA-256
-        key_hash = hashlib.sha256(key_material.encode()).digest()
-        
-        # Fernet requires a URL-safe base64-encoded 32-byte key
-        return base64.urlsafe_b64encode(key_hash)
+        if self._raw_key is None:
+            # SHA-256 of "machine_id|base_dir|installation_id", fed piecewise
+            # so the combined string is never built
+            h = hashlib.sha256(self._get_machine_id().encode())
+            h.update(b"|")
+            h.update(self._base_dir_b)
+            h.update(b"|")
+            h.update(self._get_installation_id().encode())
+            self._raw_key = h.digest()
+        return self._raw_key
+    
+    def _derive_key(self) -> bytes:
+        """Derive the key in the URL-safe base64 form Fernet expects."""
+        return base64.urlsafe_b64encode(self._derive_raw_key())
+    
+    def _get_cipher(self):
+        """Get or create the AES-256-GCM instance used for V2 keys."""
+        if self._cipher is None:
+            try:
+                from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+                self._cipher = AESGCM(self._derive_raw_key())
+                self._key_valid = True
+            except ImportError:
+                raise ImportError(
+                    "cryptography package is required. Install with: pip install cryptography"
+                )
+        return self._cipher
     
     def _get_fernet(self):
-        """Get or create the Fernet encryption instance."""
+        """Get or create the Fernet instance used to read legacy V1 keys."""
         if self._fernet is None:
             try:
                 from cryptography.fernet import Fernet
@@ -216,9 +320,10 @@ class SecureKeyManager:
         if not plain_key:
             return ""
         
-        fernet = self._get_fernet()
-        encrypted = fernet.encrypt(plain_key.encode())
-        return f"{self.ENCRYPTED_PREFIX}{encrypted.decode()}"
+        cipher = self._get_cipher()
+        nonce = os.urandom(_GCM_NONCE_SIZE)
+        encrypted = base64.urlsafe_b64encode(nonce + cipher.encrypt(nonce, plain_key.encode(), None))
+        return (_ENCRYPTED_PREFIX_B + encrypted).decode("ascii")
     
     def decrypt_key(self, encrypted_key: str) -> Optional[str]:
         """
@@ -234,24 +339,31 @@ class SecureKeyManager:
             return None
         
         # Check if key is encrypted
-        if not encrypted_key.startswith(self.ENCRYPTED_PREFIX):
+        if not encrypted_key.startswith(_ENCRYPTED_PREFIXES):
             # Not encrypted, return as-is (for backward compatibility)
             return encrypted_key
         
-        # Remove prefix
-        encrypted_data = encrypted_key[len(self.ENCRYPTED_PREFIX):]
+        # Both prefixes have the same length
+        token = encrypted_key[_ENCRYPTED_PREFIX_LEN:]
         
         try:
-            fernet = self._get_fernet()
-            decrypted = fernet.decrypt(encrypted_data.encode())
+            if encrypted_key.startswith(_LEGACY_PREFIX):
+                # Fernet base64-decodes str tokens itself; no need to encode first
+                decrypted = self._get_fernet().decrypt(token)
+            else:
+                data = base64.urlsafe_b64decode(token)
+                decrypted = self._get_cipher().decrypt(
+                    data[:_GCM_NONCE_SIZE], data[_GCM_NONCE_SIZE:], None
+                )
             return decrypted.decode()
         except Exception as e:
             # Decryption failed - key is invalid for this machine/path
             return None
     
-    def is_encrypted(self, key_value: str) -> bool:
+    @staticmethod
+    def is_encrypted(key_value: str) -> bool:
         """Check if a key value is in encrypted format."""
-        return key_value.startswith(self.ENCRYPTED_PREFIX) if key_value else False
+        return key_value.startswith(_ENCRYPTED_PREFIXES) if key_value else False
     
     def get_decrypted_api_key(self, env_value: str) -> Tuple[Optional[str], bool]:
         """
@@ -288,35 +400,25 @@ class SecureKeyManager:
         if not os.path.exists(env_path):
             return False
         
+        def encrypt_match(match: "re.Match[str]") -> str:
+            value = match.group("value").strip()
+            # Skip if already encrypted or placeholder
+            if self.is_encrypted(value) or not value or value == "YOUR_GEMINI_API_KEY_HERE":
+                return match.group(0)
+            return f"{key_name}={self.encrypt_key(value)}"
+        
         try:
             # Read current content
             with open(env_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-            
-            modified = False
-            new_lines = []
+                content = f.read()
             
-            for line in lines:
-                stripped = line.strip()
-                if stripped.startswith(f"{key_name}="):
-                    # Extract the current value
-                    value = stripped.split("=", 1)[1].strip()
-                    
-                    # Skip if already encrypted or placeholder
-                    if self.is_encrypted(value) or not value or value == "YOUR_GEMINI_API_KEY_HERE":
-                        new_lines.append(line)
-                        continue
-                    
-                    # Encrypt the key
-                    encrypted = self.encrypt_key(value)
-                    new_lines.append(f"{key_name}={encrypted}\n")
-                    modified = True
-                else:
-                    new_lines.append(line)
+            # Ciphertext is never equal to its input, so any change means
+            # at least one value was encrypted
+            new_content = _env_assignment_pattern(key_name).sub(encrypt_match, content)
             
-            if modified:
+            if new_content != content:
                 with open(env_path, "w", encoding="utf-8") as f:
-                    f.writelines(new_lines)
+                    f.write(new_content)
                 return True
             
             return False
@@ -333,25 +435,21 @@ class SecureKeyManager:
             Tuple of (is_valid, message)
         """
         # Check if installation ID exists and path matches
-        if not os.path.exists(self.installation_id_path):
-            return False, "Installation not initialized. Keys need to be re-entered."
-        
         try:
-            with open(self.installation_id_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
-            stored_path = data.get("path", "")
-            if stored_path and stored_path != self.base_dir:
-                return False, (
-                    f"Installation path mismatch. "
-                    f"Expected: {stored_path}, Got: {self.base_dir}. "
-                    f"API keys need to be re-entered."
-                )
-            
-            return True, "Installation valid."
-            
+            stored_path = self._load_installation_record().get("path", "")
+        except FileNotFoundError:
+            return False, "Installation not initialized. Keys need to be re-entered."
         except Exception as e:
             return False, f"Installation validation error: {e}"
+        
+        if stored_path and stored_path != self.base_dir:
+            return False, (
+                f"Installation path mismatch. "
+                f"Expected: {stored_path}, Got: {self.base_dir}. "
+                f"API keys need to be re-entered."
+            )
+        
+        return True, "Installation valid."
     
     def reset_installation(self) -> bool:
         """
@@ -361,10 +459,15 @@ class SecureKeyManager:
         or when migrating the installation.
         """
         try:
-            if os.path.exists(self.installation_id_path):
+            with contextlib.suppress(FileNotFoundError):
                 os.remove(self.installation_id_path)
+            self._raw_key = None
+            self._cipher = None
             self._fernet = None
             self._key_valid = False
+            # The machine ID is unchanged; only the installation salt is new
+            self._installation_id_cache = None
+            self._installation_record = None
             return True
         except Exception as e:
             print(f"[SecureKeyManager] Error resetting installation: {e}")
@@ -384,6 +487,8 @@ def get_manager(base_dir: Optional[str] = None) -> SecureKeyManager:
             # Default to project root
             base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         _manager_instance = SecureKeyManager(base_dir)
+        # Hide the probe (an ioreg subprocess on macOS) behind startup work
+        _manager_instance.prefetch_machine_id()
     
     return _manager_instance
 
@@ -405,4 +510,4 @@ def migrate_env_keys(env_path: str, base_dir: Optional[str] = None) -> bool:
 
 def is_key_encrypted(key_value: str) -> bool:
     """Check if a key value is encrypted."""
-    return key_value.startswith(SecureKeyManager.ENCRYPTED_PREFIX) if key_value else False
+    return key_value.startswith(_ENCRYPTED_PREFIXES) if key_value else False
@@ -1,6 +1,7 @@
 import ctypes
 import logging
 import random
+import threading
 import time
 import os
 
@@ -31,33 +32,72 @@ class KEYBDINPUT(ctypes.Structure):
     ]
 
 
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", ctypes.c_ulong),
+        ("wParamL", ctypes.c_ushort),
+        ("wParamH", ctypes.c_ushort),
+    ]
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.POINTER(ctypes.c_ulong)),
+    ]
+
+
+# MOUSEINPUT is the largest member; without it sizeof(INPUT) is smaller than
+# Win32's and SendInput rejects the whole batch
 class INPUT_I(ctypes.Union):
-    _fields_ = [("ki", KEYBDINPUT)]
+    _fields_ = [("ki", KEYBDINPUT), ("mi", MOUSEINPUT), ("hi", HARDWAREINPUT)]
 
 
 class INPUT(ctypes.Structure):
     _fields_ = [("type", ctypes.c_ulong), ("ii", INPUT_I)]
 
 
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+
+
 def _send_vk(vk_code):
-    """Sends a virtual key code using keyboard library."""
-    try:
-        if vk_code == VK_RETURN:
-            keyboard.send("enter")
-        elif vk_code == VK_BACK:
-            keyboard.send("backspace")
-        else:
-            pass
-    except Exception as e:
-        logger.error(f"Keyboard lib error: {e}")
+    """Sends a virtual key code (key down + key up) with one SendInput call."""
+    arr = (INPUT * 2)()
+    arr[0].type = arr[1].type = INPUT_KEYBOARD
+    arr[0].ii.ki.wVk = arr[1].ii.ki.wVk = vk_code
+    arr[1].ii.ki.dwFlags = KEYEVENTF_KEYUP
+    if user32.SendInput(2, arr, _INPUT_SIZE) != 2:
+        logger.error(f"SendInput failed for virtual key {vk_code:#x}")
 
 
-def _send_char(char):
-    """Sends a unicode character using keyboard library."""
-    try:
-        keyboard.write(char)
-    except Exception as e:
-        logger.error(f"Keyboard lib write error: {e}")
+def _send_char(text):
+    """
+    Sends a character (or a whole run of characters) in UNICODE mode.
+    All key-down/key-up pairs go out in a single SendInput call; characters
+    outside the BMP are sent as their UTF-16 surrogate pair.
+    """
+    encoded = text.encode("utf-16-le")
+    units = memoryview(encoded).cast("H")
+    count = 2 * len(units)
+    if not count:
+        return
+
+    arr = (INPUT * count)()
+    for i, code in enumerate(units):
+        down = arr[2 * i]
+        up = arr[2 * i + 1]
+        down.type = up.type = INPUT_KEYBOARD
+        down.ii.ki.wScan = up.ii.ki.wScan = code
+        down.ii.ki.dwFlags = KEYEVENTF_UNICODE
+        up.ii.ki.dwFlags = KEYEVENTF_UNICODE | KEYEVENTF_KEYUP
+
+    sent = user32.SendInput(count, arr, _INPUT_SIZE)
+    if sent != count:
+        logger.error(f"SendInput injected {sent}/{count} events for {len(text)} chars")
 
 
 # =============================================================================
@@ -197,14 +237,42 @@ class HumanTypist:
         else:
             self.error_rate = error_rate
 
-        self.paused = False
-        self.stopped = False
+        # Control signals are Events so the keyboard hook thread can wake
+        # the typing thread directly instead of waiting for it to poll.
+        self._stop_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._session_lock = threading.Lock()
         self.speed_multiplier = 1.0
         self.hooks = []
 
+    @property
+    def stopped(self):
+        return self._stop_event.is_set()
+
+    @stopped.setter
+    def stopped(self, value):
+        if value:
+            self._stop_event.set()
+        else:
+            self._stop_event.clear()
+
+    @property
+    def paused(self):
+        return not self._resume_event.is_set()
+
+    @paused.setter
+    def paused(self, value):
+        if value:
+            self._resume_event.clear()
+        else:
+            self._resume_event.set()
+
     def _emergency_stop(self, e):
         """Stops typing immediately."""
         self.stopped = True
+        # Release a pending pause so the typing thread sees the stop at once
+        self._resume_event.set()
         logger.warning("HumanTypist: Emergency STOP triggered by user (9).")
 
     def _increase_speed_multiplier(self, e):
@@ -218,8 +286,8 @@ class HumanTypist:
         logger.info(f"Typing {state} by user (Backspace).")
 
     def _wait_if_paused(self):
-        while self.paused and not self.stopped:
-            time.sleep(0.1)
+        # Wakes as soon as the user resumes or stops
+        self._resume_event.wait()
 
     def _get_base_delay(self, wpm):
         """
@@ -247,17 +315,21 @@ class HumanTypist:
 
     def type_text(self, text: str):
         """Types the given text with simulated human strategies."""
-        self.stopped = False
-        self.paused = False
-        
-        # Always reset speed multiplier to default at the start of each session
-        # This ensures that previous acceleration (via right arrow) doesn't persist
-        self.speed_multiplier = 1.0
-        logger.info(f"HumanTypist: Starting new session (WPM: {self.base_min_wpm}-{self.base_max_wpm}, Speed: 1.0x)")
-
         if not text:
             return
 
+        # One session per typist: a caller on another thread that shares this
+        # instance must not reset the running session's stop/pause state
+        if not self._session_lock.acquire(blocking=False):
+            logger.warning("Another typing instance is running. Aborting this request.")
+            return
+        try:
+            self._type_text_locked(text)
+        finally:
+            self._session_lock.release()
+
+    def _type_text_locked(self, text):
+        """type_text body; runs with _session_lock held."""
         # --- INSTANCE LOCKING ---
         lock_file = os.path.join(os.path.dirname(__file__), "typing.lock")
         if os.path.exists(lock_file):
@@ -279,6 +351,15 @@ class HumanTypist:
             logger.error(f"Could not create lock file: {e}")
             return
 
+        # Reset per-session state only once this session owns the lock
+        self.stopped = False
+        self.paused = False
+        
+        # Always reset speed multiplier to default at the start of each session
+        # This ensures that previous acceleration (via right arrow) doesn't persist
+        self.speed_multiplier = 1.0
+        logger.info(f"HumanTypist: Starting new session (WPM: {self.base_min_wpm}-{self.base_max_wpm}, Speed: 1.0x)")
+
         # Monitor Screen Thread
         # We need to detect if screen changes. Since we can't easily multithread MSS inside this synchronous function without care,
         # we will use a simple check in the typing loop, utilizing a helper.
@@ -415,6 +496,13 @@ class HumanTypist:
         if make_mistake and len(word) > 1:
             mistake_index = random.randint(0, len(word) - 1)
 
+        # Urgent mode has no per-key delays or typos, so the word goes out in one batch
+        if self.urgent_mode:
+            if word and not self.stopped:
+                self._wait_if_paused()
+                _send_char(word)
+            return
+
         i_char = 0
         while i_char < len(word):
             if self.stopped:
@@ -423,25 +511,21 @@ class HumanTypist:
 
             char = word[i_char]
 
-            # In urgent mode, skip all delay calculations
-            if self.urgent_mode:
-                delay = 0
-            else:
-                # Base Delay
-                delay = self._get_base_delay(wpm)
-
-                # --- KEY FREQUENCY HEATMAP APPLICATION ---
-                lower_char = char.lower()
-                if lower_char in KEY_DELAY_FACTOR:
-                    delay *= KEY_DELAY_FACTOR[lower_char]
-
-                # --- JITTER/VARIANCE ---
-                # Fingers aren't robots; add noise (Gaussian)
-                delay = random.gauss(delay, delay * 0.2)
-                delay = max(0.005, delay)  # Minimum physical limit
-
-            # Execute Mistake? (skip in urgent mode)
-            if not self.urgent_mode and i_char == mistake_index:
+            # Base Delay
+            delay = self._get_base_delay(wpm)
+
+            # --- KEY FREQUENCY HEATMAP APPLICATION ---
+            lower_char = char.lower()
+            if lower_char in KEY_DELAY_FACTOR:
+                delay *= KEY_DELAY_FACTOR[lower_char]
+
+            # --- JITTER/VARIANCE ---
+            # Fingers aren't robots; add noise (Gaussian)
+            delay = random.gauss(delay, delay * 0.2)
+            delay = max(0.005, delay)  # Minimum physical limit
+
+            # Execute Mistake?
+            if i_char == mistake_index:
                 self._perform_typo(char)
                 # After fixing typo, maybe slight delay getting back on track
                 time.sleep(random.uniform(0.1, 0.2))
@@ -450,13 +534,12 @@ class HumanTypist:
                 # So we just continue to type the correct char now.
 
             # Type the (correct) character
-            # Shift key simulation for uppercase (skip delay in urgent mode)
-            if not self.urgent_mode and char.isupper():
+            # Shift key simulation for uppercase
+            if char.isupper():
                 delay += 0.08  # Shift key press time
 
             _send_char(char)
-            if delay > 0:
-                time.sleep(delay)
+            time.sleep(delay)
 
             i_char += 1
 
@@ -49,6 +49,7 @@ OPTIONAL_KEYS = [
     "POST_ACTION_WAIT",
     "SWITCH_QUESTION_WAIT",
     "POLL_INTERVAL",
+    "POLL_INTERVAL_MAX",
     "MAX_RETRIES",
     "MOUSE_MOVE_DURATION",
     "HANDLE_DESCRIPTIVE_ANSWERS",
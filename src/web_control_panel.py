@@ -69,6 +69,10 @@ except ImportError:
     except ImportError:
         pass
 
+if _secure_key_manager is not None:
+    # Probe the machine ID while the server starts, not on the first key save
+    _secure_key_manager.prefetch_machine_id()
+
 # Keys that should be encrypted when saved
 ENCRYPTED_KEYS = {"GEMINI_API_KEY"}
 
@@ -127,6 +131,15 @@ CONFIG_SCHEMA = {
                 "desc": "Poll Interval",
                 "tooltip": "Seconds between screen checks in Auto Mode",
             },
+            {
+                "key": "POLL_INTERVAL_MAX",
+                "type": "int",
+                "default": 30,
+                "min": 1,
+                "max": 300,
+                "desc": "Max Poll Interval",
+                "tooltip": "Idle polling backs off up to this many seconds",
+            },
         ]
     },
     "API & Retry": {
@@ -92,8 +92,8 @@ class MockScreenData:
     height: int = 1080
     
     @property
-    def bgra(self) -> bytes:
-        return b"\x00" * (self.width * self.height * 4)
+    def raw(self) -> bytearray:
+        return bytearray(self.width * self.height * 4)
     
     @property
     def size(self) -> tuple:
@@ -265,7 +265,7 @@ def mock_mss(mocker, mock_screen_data):
     # Mock screen grab
     mock_sct_img = MagicMock()
     mock_sct_img.size = mock_screen_data.size
-    mock_sct_img.bgra = mock_screen_data.bgra
+    mock_sct_img.raw = mock_screen_data.raw
     mock_enter.grab.return_value = mock_sct_img
     mock_enter.monitors = [
         {},  # All monitors combined
@@ -281,6 +281,19 @@ def mock_screen_capture(mock_mss):
     return mock_mss
 
 
+@pytest.fixture(autouse=True)
+def reset_screen_capture_cache():
+    """
+    Drop main's cached mss instance and last frame hash so each test sees
+    its own mss mock and is not skipped as an unchanged screen.
+    """
+    main_module = sys.modules.get("src.main")
+    if main_module is not None:
+        main_module._close_sct()
+        main_module._last_frame_hash = None
+    yield
+
+
 # ============================================================================
 # MOUSE AND KEYBOARD FIXTURES
 # ============================================================================
@@ -470,6 +483,29 @@ def mock_pil_image(mocker):
     return img
 
 
+@pytest.fixture
+def question_frame():
+    """
+    Build a raw 1920x1080 BGRA screen buffer (as mss returns it) showing an
+    exam page with the given question text on a fixed template, so frames
+    for different questions differ only in the question text.
+    """
+    from PIL import Image, ImageDraw
+
+    def build(question, options=("Option A", "Option B", "Option C", "Option D")):
+        img = Image.new("RGB", (1920, 1080), "white")
+        draw = ImageDraw.Draw(img)
+        draw.rectangle([0, 0, 1919, 80], fill=(30, 60, 120))
+        draw.rectangle([200, 150, 1720, 950], outline=(180, 180, 180), width=2)
+        draw.text((240, 200), question, fill="black")
+        for i, option in enumerate(options):
+            draw.ellipse([260, 320 + i * 80, 280, 340 + i * 80], outline="black")
+            draw.text((300, 322 + i * 80), option, fill="black")
+        return bytearray(img.convert("RGBA").tobytes("raw", "BGRA"))
+
+    return build
+
+
 @pytest.fixture
 def mock_screenshot(mock_pil_image):
     """Mock a screenshot capture."""
@@ -224,7 +224,7 @@ class TestSecureKeyManagerContract:
         """Test encrypt_key returns prefixed string."""
         result = manager.encrypt_key("test_key")
         
-        assert result.startswith("SCRY_ENC_V1:")
+        assert result.startswith("SCRY_ENC_V2:")
 
     def test_decrypt_returns_string_or_none(self, manager):
         """Test decrypt_key returns string or None."""
@@ -349,7 +349,7 @@ class TestMainModuleContract:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -80,7 +80,7 @@ class TestFullMCQWorkflow:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -167,7 +167,7 @@ class TestFullDescriptiveWorkflow:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -225,7 +225,7 @@ class TestMultiMCQWorkflow:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -307,7 +307,7 @@ class TestErrorRecoveryWorkflow:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -431,7 +431,7 @@ class TestIdempotencyWorkflow:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -474,7 +474,7 @@ class TestIdempotencyWorkflow:
         # Should only click once
         assert mocks["click"].call_count == 1
 
-    def test_different_questions_all_processed(self, mock_environment):
+    def test_different_questions_all_processed(self, mock_environment, question_frame):
         """Test that different questions are all processed."""
         mocks = mock_environment
         
@@ -485,8 +485,11 @@ class TestIdempotencyWorkflow:
         mocks["find_text"].return_value = (100, 100)
         
         questions = ["Question 1", "Question 2", "Question 3"]
+        sct_img = mocks["mss"].return_value.__enter__.return_value.grab.return_value
         
-        for i, q in enumerate(questions):
+        for q in questions:
+            # Same page template; only the question text changes
+            sct_img.raw = question_frame(q)
             mocks["gemini"].return_value = {
                 "type": "MCQ",
                 "question": q,
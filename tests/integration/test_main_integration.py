@@ -35,7 +35,7 @@ class TestProcessScreenCycleMCQ:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -154,7 +154,7 @@ class TestProcessScreenCycleDescriptive:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -215,7 +215,7 @@ class TestProcessScreenCycleSafe:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -269,7 +269,7 @@ class TestManualTrigger:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -346,7 +346,7 @@ class TestErrorHandling:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -371,7 +371,7 @@ class TestErrorHandling:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -412,7 +412,7 @@ class TestMultiMCQ:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -35,7 +35,7 @@ class TestResponseTimeBenchmarks:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -88,7 +88,7 @@ class TestMemoryUtilization:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -389,7 +389,7 @@ class TestStressTests:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
@@ -64,7 +64,7 @@ class TestChallengeGeneration:
         challenge = manager.generate_session_challenge()
         
         # Decode and check length
-        raw = base64.b64decode(challenge)
+        raw = base64.urlsafe_b64decode(challenge)
         
         # Should contain at least 32 bytes of random data
         assert len(raw) >= 32
@@ -227,11 +227,13 @@ class TestTamperDetection:
         
         # Tamper with the ciphertext
         # Remove prefix and modify base64 content
-        prefix = "SCRY_ENC_V1:"
+        prefix = "SCRY_ENC_V2:"
         if encrypted.startswith(prefix):
             ciphertext = encrypted[len(prefix):]
-            # Flip some bits
-            tampered = prefix + "X" + ciphertext[1:]
+            # Flip some bits (V2 tokens start with a random nonce, so
+            # make sure the first character actually changes)
+            replacement = "Y" if ciphertext.startswith("X") else "X"
+            tampered = prefix + replacement + ciphertext[1:]
         else:
             tampered = "X" + encrypted[1:]
         
@@ -262,6 +264,7 @@ class TestTamperDetection:
             "not_valid_base64!!!",
             "SCRY_ENC_V1:garbage",
             "SCRY_ENC_V1:" + base64.b64encode(b"random").decode(),
+            "SCRY_ENC_V2:garbage",
             "\x00\x01\x02\x03",
         ]
         
@@ -291,7 +294,7 @@ class TestEncryptionFormat:
         """Test that encrypted keys have the correct prefix."""
         encrypted = manager.encrypt_key("TestKey")
         
-        assert encrypted.startswith("SCRY_ENC_V1:")
+        assert encrypted.startswith("SCRY_ENC_V2:")
 
     def test_is_encrypted_detection(self, manager):
         """Test is_encrypted detection."""
@@ -408,7 +411,7 @@ class TestMigration:
         with open(env_path, "r") as f:
             content = f.read()
         
-        assert "SCRY_ENC_V1:" in content
+        assert "SCRY_ENC_V2:" in content
         assert "plain_text_key" not in content
         assert "OTHER_VAR=value" in content
 
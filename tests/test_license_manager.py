@@ -8,6 +8,7 @@ These tests verify that:
 4. Session validation is properly tracked
 """
 
+import base64
 import os
 import sys
 import tempfile
@@ -80,6 +81,17 @@ class TestLicenseManager:
             assert len(part) == 6
             assert part.isupper() or part.isdigit()
 
+    def test_display_challenge_follows_new_challenge(self, temp_dir):
+        """Test that the cached display code is refreshed for a new challenge."""
+        manager = LicenseManager(temp_dir)
+        manager.generate_session_challenge()
+        first = manager.get_display_challenge()
+        
+        assert manager.get_display_challenge() == first
+        
+        manager.generate_session_challenge()
+        assert manager.get_display_challenge() != first
+
     def test_sign_and_verify_roundtrip(self, manager_with_keys):
         """Test that signing and verification work correctly."""
         manager, private_path = manager_with_keys
@@ -96,6 +108,27 @@ class TestLicenseManager:
         assert is_valid
         assert "success" in message.lower()
 
+    def test_legacy_rsa_keys_still_verify(self, temp_dir):
+        """Test that RSA key pairs issued before Ed25519 keep working."""
+        private_path, public_path = LicenseManager.generate_key_pair(temp_dir, algorithm="rsa")
+        manager = LicenseManager(temp_dir)
+        with open(public_path, "r") as f:
+            manager.EMBEDDED_PUBLIC_KEY = f.read()
+        
+        challenge = manager.generate_session_challenge()
+        license_key = LicenseManager.sign_challenge(private_path, challenge)
+        
+        is_valid, _ = manager.validate_license_key(license_key)
+        assert is_valid
+
+    def test_ed25519_license_key_is_short(self, manager_with_keys):
+        """Test that default keys produce 64-byte signatures."""
+        manager, private_path = manager_with_keys
+        
+        license_key = LicenseManager.sign_challenge(private_path, manager.get_current_challenge())
+        
+        assert len(base64.urlsafe_b64decode(license_key)) == 64
+
     def test_invalid_signature_rejected(self, manager_with_keys, temp_dir):
         """Test that invalid signatures are rejected."""
         manager, private_path = manager_with_keys
@@ -191,6 +224,19 @@ class TestLicenseManager:
         assert "-----BEGIN PUBLIC KEY-----" in public_content
         assert "-----END PUBLIC KEY-----" in public_content
 
+    def test_challenge_reloaded_from_file(self, temp_dir):
+        """Test that a restarted manager picks up the saved challenge."""
+        challenge = LicenseManager(temp_dir).generate_session_challenge()
+        
+        assert LicenseManager(temp_dir).get_current_challenge() == challenge
+
+    def test_expired_challenge_file_discarded(self, temp_dir):
+        """Test that an expired challenge file is removed and replaced."""
+        manager = LicenseManager(temp_dir)
+        manager.challenge_path.write_text("stale\n0\n")
+        
+        assert manager.get_current_challenge() != "stale"
+
     def test_challenge_file_cleanup(self, manager_with_keys):
         """Test that challenge file is cleaned up after validation."""
         manager, private_path = manager_with_keys
@@ -225,6 +271,46 @@ class TestLicenseManager:
                 is_valid, _ = manager.validate_license_key(garbage)
                 assert not is_valid
 
+    def test_machine_fingerprint_persisted_across_runs(self, temp_dir, monkeypatch):
+        """Test that a later run reads the fingerprint from disk."""
+        first = LicenseManager(temp_dir)._get_machine_fingerprint()
+        monkeypatch.setattr(
+            LicenseManager, "_compute_machine_fingerprint",
+            staticmethod(lambda: pytest.fail("fingerprint recomputed")),
+        )
+        
+        assert LicenseManager(temp_dir)._get_machine_fingerprint() == first
+
+    def test_corrupt_machine_id_file_recomputed(self, temp_dir):
+        """Test that a malformed cache file is replaced with a fresh fingerprint."""
+        manager = LicenseManager(temp_dir)
+        (manager.base_dir / LicenseManager.MACHINE_ID_FILE).write_text("not-hex")
+        
+        machine_id = manager._get_machine_fingerprint()
+        
+        assert len(machine_id) == 64
+        assert (manager.base_dir / LicenseManager.MACHINE_ID_FILE).read_text() == machine_id
+
+    def test_public_key_parsed_once(self, manager_with_keys):
+        """Test that repeated lookups reuse the parsed public key object."""
+        manager, _ = manager_with_keys
+        
+        assert manager._get_public_key() is manager._get_public_key()
+
+    def test_machine_fingerprint_computed_once(self, temp_dir, monkeypatch):
+        """Test that the fingerprint is hashed once and reused across challenges."""
+        manager = LicenseManager(temp_dir)
+        calls = []
+        monkeypatch.setattr(
+            LicenseManager, "_compute_machine_fingerprint",
+            staticmethod(lambda: calls.append(1) or "f" * 64),
+        )
+        
+        manager.generate_session_challenge()
+        manager.generate_session_challenge()
+        
+        assert len(calls) == 1
+
 
 class TestKeyPairIntegrity:
     """Test key pair generation and integrity."""
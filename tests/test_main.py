@@ -1,3 +1,4 @@
+import collections
 from unittest.mock import MagicMock
 
 import pytest
@@ -18,7 +19,7 @@ class TestMainProcessCycle:
         # Mock screen grab return
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)  # dummy data
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)  # dummy data
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [{}, {"left": 0, "top": 0, "width": 1920, "height": 1080}]
 
@@ -141,6 +142,54 @@ class TestMainProcessCycle:
         process_screen_cycle(bypass_idempotency=True)
         assert mock_click.call_count == 2  # Should increase
 
+    def test_unchanged_screen_skips_gemini(
+        self, mock_screen_capture, mock_gemini, mock_find_text, mock_click, mock_desktop
+    ):
+        """An unchanged frame is skipped before any Gemini call."""
+        main.last_processed_question = None
+        mock_gemini.return_value = {
+            "type": "MCQ",
+            "question": "Frame Q",
+            "answer_text": "A",
+            "bbox": [0, 0, 10, 10],
+        }
+        mock_find_text.return_value = (100, 100)
+
+        process_screen_cycle()
+        process_screen_cycle()
+        assert mock_gemini.call_count == 1
+
+        # A visibly different frame goes back to Gemini
+        sct = mock_screen_capture.return_value.__enter__.return_value
+        frame = bytearray(1920 * 1080 * 4)
+        for row in range(1080):
+            start = row * 1920 * 4 + 960 * 4
+            frame[start:start + 960 * 4] = b"\xff" * (960 * 4)
+        sct.grab.return_value.raw = frame
+        process_screen_cycle()
+        assert mock_gemini.call_count == 2
+
+    def test_new_question_on_same_template_reaches_gemini(
+        self, mock_screen_capture, mock_gemini, mock_find_text, mock_click, mock_desktop,
+        question_frame,
+    ):
+        """Frames that differ only in question text are both analyzed."""
+        main.last_processed_question = None
+        mock_find_text.return_value = (100, 100)
+        sct = mock_screen_capture.return_value.__enter__.return_value
+
+        for question in ("What is 2 + 2?", "What is 3 + 5?"):
+            sct.grab.return_value.raw = question_frame(question)
+            mock_gemini.return_value = {
+                "type": "MCQ",
+                "question": question,
+                "answer_text": "A",
+                "bbox": [0, 0, 10, 10],
+            }
+            process_screen_cycle()
+
+        assert mock_gemini.call_count == 2
+
     def test_empty_gemini_response(self, mock_screen_capture, mock_gemini):
         """Test handling of None/empty response from Gemini."""
         mock_gemini.return_value = None
@@ -172,6 +221,19 @@ class TestMainProcessCycle:
         # (Though we can verify the outcome: click happened)
         mock_click.assert_called_once()
 
+    def test_screen_capture_instance_reused(
+        self, mock_screen_capture, mock_gemini, mock_desktop
+    ):
+        """The mss instance is opened once and reused across cycles."""
+        mock_gemini.return_value = None
+
+        process_screen_cycle()
+        process_screen_cycle()
+
+        assert mock_screen_capture.call_count == 1
+        sct = mock_screen_capture.return_value.__enter__.return_value
+        assert sct.grab.call_count == 2
+
     def test_monitor_access_error(self, mocker, mock_gemini):
         """Strict fail check: MSS fails to grab screen."""
         mock_mss_fail = MagicMock()
@@ -181,3 +243,169 @@ class TestMainProcessCycle:
         with pytest.raises(Exception) as excinfo:
             process_screen_cycle()
         assert "Screen access denied" in str(excinfo.value)
+
+
+class TestTriplePressTracker:
+
+    @staticmethod
+    def _event(name, event_type="down"):
+        event = MagicMock()
+        event.name = name
+        event.event_type = event_type
+        return event
+
+    def test_drain_triggers_on_third_press(self):
+        tracker = main.TriplePressTracker()
+        action = MagicMock()
+        tracker.register_hotkey("q", action)
+
+        events = collections.deque(self._event("q") for _ in range(3))
+        tracker.drain(events)
+
+        action.assert_called_once()
+        assert not events
+
+    def test_drain_resets_on_other_key(self):
+        tracker = main.TriplePressTracker()
+        action = MagicMock()
+        tracker.register_hotkey("q", action)
+
+        events = collections.deque(
+            self._event(name) for name in ("q", "q", "x", "q", "Q")
+        )
+        tracker.drain(events)
+
+        action.assert_not_called()
+        assert tracker.press_count == 2
+
+    def test_unnamed_key_resets_count(self):
+        tracker = main.TriplePressTracker()
+        action = MagicMock()
+        tracker.register_hotkey("q", action)
+
+        tracker.drain(collections.deque(
+            self._event(name) for name in ("q", "q", None, "q")
+        ))
+
+        action.assert_not_called()
+        assert tracker.press_count == 1
+
+    def test_unregistered_key_no_longer_tracked(self):
+        tracker = main.TriplePressTracker()
+        action = MagicMock()
+        tracker.register_hotkey("q", action)
+        tracker.unregister_hotkey("q")
+
+        tracker.drain(collections.deque(self._event("q") for _ in range(3)))
+
+        action.assert_not_called()
+        assert "q" not in tracker.registered_keys
+
+    def test_enqueue_ignores_key_up(self, mocker):
+        mocker.patch.object(main.keyboard, "KEY_DOWN", "down")
+        mocker.patch.object(main, "_key_events", collections.deque())
+
+        main._enqueue_key_event(self._event("q", "up"))
+        main._enqueue_key_event(self._event("q", "down"))
+
+        assert [e.event_type for e in main._key_events] == ["down"]
+
+    def test_hotkey_config_change_reregisters_on_worker(self, mocker):
+        """A HOTKEY_* change from the .env watcher re-registers before the next drain."""
+        register = mocker.patch.object(main, "register_all_hotkeys")
+        mocker.patch.object(main, "_key_events", collections.deque())
+        main._hotkeys_stale.clear()
+
+        main._mark_hotkeys_stale("HOTKEY_MCQ", "q", "x")
+        register.assert_not_called()
+        assert main._key_events_ready.is_set()
+
+        main._drain_key_events()
+        main._drain_key_events()
+
+        register.assert_called_once()
+        main._key_events_ready.clear()
+
+
+class TestBboxCenters:
+
+    def test_centers_scaled_to_monitor(self):
+        monitor = {"left": 100, "top": 50, "width": 2000, "height": 1000}
+
+        centers = main._bbox_centers(
+            [[100, 200, 300, 400], None, [1, 2, 3], [0, 0, 1000, 1000]], monitor
+        )
+
+        assert centers == [
+            (600 + 100, 200 + 50),
+            None,
+            None,
+            (1000 + 100, 500 + 50),
+        ]
+
+    def test_geometry_memoized_per_monitor(self):
+        monitor = {"left": 0, "top": 0, "width": 1920, "height": 1080}
+
+        first = main._monitor_geometry(monitor)
+
+        assert main._monitor_geometry(monitor) == first == (0.96, 0.54, 0, 0)
+        assert main._monitor_geometry(dict(monitor, left=1920))[2] == 1920
+
+    def test_no_valid_boxes(self):
+        monitor = {"left": 0, "top": 0, "width": 100, "height": 100}
+
+        assert main._bbox_centers([[], None], monitor) == [None, None]
+
+
+class TestScreenshotWriter:
+
+    def test_dump_written_in_background(self, tmp_path):
+        from PIL import Image
+
+        path = tmp_path / "frame.png"
+        main._save_screenshot_async(Image.new("RGB", (8, 8)), str(path))
+        main._stop_screenshot_writer()
+
+        assert path.exists()
+
+    def test_full_queue_drops_frame(self, mocker):
+        mocker.patch.object(main, "_screenshot_queue", main.queue.Queue(maxsize=1))
+        mocker.patch.object(main, "_screenshot_writer_thread", MagicMock())
+        image = MagicMock()
+
+        main._save_screenshot_async(image, "a.png")
+        main._save_screenshot_async(image, "b.png")
+
+        assert main._screenshot_queue.qsize() == 1
+
+
+class TestPidFile:
+
+    def test_create_and_remove(self, mocker, tmp_path):
+        mocker.patch.object(main, "RUNTIME_DIR", str(tmp_path))
+
+        main.create_pid_file()
+        assert (tmp_path / "app.pid").read_text() == str(main.os.getpid())
+
+        main.remove_pid_file()
+        assert not (tmp_path / "app.pid").exists()
+        main.remove_pid_file()  # Missing file is not an error
+
+
+class TestClipboardContent:
+
+    def test_served_from_watcher_when_running(self, mocker):
+        mocker.patch.object(main.clipboard_watcher, "is_running", return_value=True)
+        mocker.patch.object(main.clipboard_watcher, "latest", return_value="cached")
+        backend = mocker.patch.object(main, "_clipboard_backend")
+
+        assert main.get_clipboard_content() == "cached"
+        backend.assert_not_called()
+
+    def test_falls_back_without_watcher(self, mocker):
+        mocker.patch.object(main.clipboard_watcher, "is_running", return_value=False)
+        pyperclip = MagicMock()
+        pyperclip.paste.return_value = "pasted"
+        mocker.patch.object(main, "_clipboard_backend", return_value=("pyperclip", pyperclip))
+
+        assert main.get_clipboard_content() == "pasted"
@@ -50,9 +50,31 @@ class TestSecureKeyManager:
         """Test that encrypted keys have the correct prefix."""
         encrypted = manager.encrypt_key("test_key")
         
-        assert encrypted.startswith("SCRY_ENC_V1:")
+        assert encrypted.startswith("SCRY_ENC_V2:")
         assert is_key_encrypted(encrypted)
 
+    def test_derived_key_matches_joined_material(self, manager):
+        """Test that the key is SHA-256 of 'machine|path|installation'."""
+        import hashlib
+
+        material = (
+            f"{manager._get_machine_id()}|{manager.base_dir}|{manager._get_installation_id()}"
+        )
+
+        assert manager._derive_raw_key() == hashlib.sha256(material.encode()).digest()
+
+    def test_legacy_fernet_key_still_decrypts(self, manager):
+        """Test that V1 (Fernet) values written by older versions still read."""
+        from cryptography.fernet import Fernet
+
+        token = Fernet(manager._derive_key()).encrypt(b"AIzaSyLegacyKey").decode()
+
+        assert manager.decrypt_key("SCRY_ENC_V1:" + token) == "AIzaSyLegacyKey"
+
+    def test_non_ascii_ciphertext_rejected(self, manager):
+        """Test that a non-ASCII token after the prefix fails cleanly."""
+        assert manager.decrypt_key("SCRY_ENC_V1:gAAAAé") is None
+
     def test_plain_text_not_detected_as_encrypted(self):
         """Test that plain text keys are not detected as encrypted."""
         plain_key = "AIzaSyTestKey123456789"
@@ -125,6 +147,47 @@ class TestSecureKeyManager:
         
         installation_file = os.path.join(temp_dir, ".scry_installation")
         assert os.path.exists(installation_file)
+        installation_id = manager._get_installation_id()
+        assert len(installation_id) == 64
+        int(installation_id, 16)
+
+    def test_legacy_json_installation_file(self, temp_dir):
+        """Test that an installation file written as JSON is still read."""
+        import json
+
+        with open(os.path.join(temp_dir, ".scry_installation"), "w") as f:
+            json.dump({"id": "abc123", "created": 1.0, "path": os.path.abspath(temp_dir)}, f)
+
+        manager = SecureKeyManager(temp_dir)
+
+        assert manager._get_installation_id() == "abc123"
+        assert manager.validate_installation()[0]
+
+    def test_installation_file_roundtrip(self, manager, temp_dir):
+        """Test that a saved installation record reads back in a fresh manager."""
+        manager.encrypt_key("test")
+
+        reloaded = SecureKeyManager(temp_dir)
+
+        assert reloaded._get_installation_id() == manager._get_installation_id()
+        assert reloaded._read_installation_record()["path"] == manager.base_dir
+
+    def test_installation_file_read_once(self, manager, temp_dir, monkeypatch):
+        """Test that decrypting and validating share one read of the file."""
+        encrypted = manager.encrypt_key("test")
+        fresh = SecureKeyManager(temp_dir)
+        reads = []
+        original_read = fresh._read_installation_record
+
+        def counting_read():
+            reads.append(1)
+            return original_read()
+
+        monkeypatch.setattr(fresh, "_read_installation_record", counting_read)
+
+        assert fresh.validate_installation()[0]
+        assert fresh.decrypt_key(encrypted) == "test"
+        assert len(reads) == 1
 
     def test_validate_installation(self, manager, temp_dir):
         """Test installation validation."""
@@ -137,6 +200,14 @@ class TestSecureKeyManager:
         assert is_valid
         assert "valid" in message.lower()
 
+    def test_validate_missing_installation(self, manager):
+        """Test that a missing installation file is reported, not raised."""
+        is_valid, message = manager.validate_installation()
+
+        assert not is_valid
+        assert "not initialized" in message
+        assert manager.reset_installation()
+
     def test_reset_installation(self, manager, temp_dir):
         """Test resetting the installation."""
         # Create installation
@@ -175,10 +246,29 @@ class TestSecureKeyManager:
         with open(env_path, "r") as f:
             content = f.read()
         
-        assert "SCRY_ENC_V1:" in content
+        assert "SCRY_ENC_V2:" in content
         assert "plain_text_key" not in content
         assert "OTHER_VAR=value" in content
 
+    def test_migrate_key_with_spaces_around_equals(self, manager, temp_dir):
+        """Test that 'KEY = value' lines are migrated and other lines kept verbatim."""
+        env_path = os.path.join(temp_dir, ".env")
+        with open(env_path, "w") as f:
+            f.write("# GEMINI_API_KEY=commented\n")
+            f.write("GEMINI_API_KEY = spaced_key \n")
+            f.write("OTHER_VAR=value\n")
+
+        assert manager.migrate_plain_key_to_encrypted(env_path) is True
+
+        with open(env_path, "r") as f:
+            lines = f.read().splitlines()
+
+        assert lines[0] == "# GEMINI_API_KEY=commented"
+        assert manager.decrypt_key(lines[1].split("=", 1)[1]) == "spaced_key"
+        assert lines[2] == "OTHER_VAR=value"
+        # Already encrypted: nothing left to do
+        assert manager.migrate_plain_key_to_encrypted(env_path) is False
+
     def test_special_characters_in_key(self, manager):
         """Test handling of keys with special characters."""
         special_key = "AIzaSy+Test/Key=With+Special==Chars/"
@@ -206,6 +296,40 @@ class TestSecureKeyManager:
         
         assert decrypted == long_key
 
+    def test_machine_probed_once_across_reset(self, manager, monkeypatch):
+        """Test that re-deriving after a reset reuses the machine ID but not the salt."""
+        calls = []
+        original_probe = manager._probe_machine_id
+        monkeypatch.setattr(manager, "_probe_machine_id", lambda: calls.append(1) or original_probe())
+
+        manager.encrypt_key("test_key")
+        first_id = manager._get_installation_id()
+        manager.reset_installation()
+        manager.encrypt_key("test_key")
+
+        assert len(calls) == 1
+        assert manager._get_installation_id() != first_id
+
+    def test_prefetch_shares_probe_with_first_use(self, manager, monkeypatch):
+        """Test that a prefetch in flight is waited on instead of probing twice."""
+        import threading
+
+        calls = []
+        release = threading.Event()
+        original_probe = manager._probe_machine_id
+
+        def slow_probe():
+            calls.append(1)
+            release.wait(5)
+            return original_probe()
+
+        monkeypatch.setattr(manager, "_probe_machine_id", slow_probe)
+        manager.prefetch_machine_id()
+        threading.Timer(0.05, release.set).start()
+
+        assert manager.decrypt_key(manager.encrypt_key("test_key")) == "test_key"
+        assert len(calls) == 1
+
 
 class TestIsKeyEncrypted:
     """Test the is_key_encrypted utility function."""
@@ -214,6 +338,7 @@ class TestIsKeyEncrypted:
         """Test detection of encrypted format."""
         assert is_key_encrypted("SCRY_ENC_V1:abc123")
         assert is_key_encrypted("SCRY_ENC_V1:")
+        assert is_key_encrypted("SCRY_ENC_V2:abc123")
 
     def test_plain_format(self):
         """Test detection of plain format."""
@@ -48,7 +48,7 @@ class TestStrictSimulation(unittest.TestCase):
 
         mock_grab = MagicMock()
         mock_grab.size = (1920, 1080)
-        mock_grab.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_grab.raw = bytearray(1920 * 1080 * 4)
         mock_sct_instance.grab.return_value = mock_grab
 
         # 2. Mock Gemini Response (Strict Schema)
@@ -100,7 +100,7 @@ class TestStrictSimulation(unittest.TestCase):
         mock_sct_instance.monitors = [None, monitor]
         mock_grab = MagicMock()
         mock_grab.size = (1000, 1000)
-        mock_grab.bgra = b"\x00" * (1000 * 1000 * 4)
+        mock_grab.raw = bytearray(1000 * 1000 * 4)
         mock_sct_instance.grab.return_value = mock_grab
 
         # Mock Gemini
@@ -147,7 +147,7 @@ class TestStrictSimulation(unittest.TestCase):
         ]
         mock_grab = MagicMock()
         mock_grab.size = (100, 100)
-        mock_grab.bgra = b"\x00" * 40000
+        mock_grab.raw = bytearray(40000)
         mock_sct_instance.grab.return_value = mock_grab
 
         # Mock Gemini
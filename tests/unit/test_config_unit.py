@@ -265,6 +265,12 @@ class TestTimingConfiguration:
         config = self.reload_config()
         assert config.POLL_INTERVAL == 3
 
+    def test_poll_interval_max_default(self, mocker):
+        """Test POLL_INTERVAL_MAX default value."""
+        mocker.patch.dict(os.environ, {"GEMINI_API_KEY": "dummy"}, clear=True)
+        config = self.reload_config()
+        assert config.POLL_INTERVAL_MAX == 30
+
     def test_post_action_wait_default(self, mocker):
         """Test POST_ACTION_WAIT default value."""
         mocker.patch.dict(os.environ, {"GEMINI_API_KEY": "dummy"}, clear=True)
@@ -0,0 +1,80 @@
+"""
+Unit Tests for Desktop Manager Module
+======================================
+
+Tests for src/utils/desktop_manager.py including:
+- HumanTypist dispatch in type_text_human_like
+- HumanTypist reuse and URGENT_MODE invalidation
+
+Test Coverage:
+- type_text_human_like
+- _get_typist
+"""
+
+
+class TestTypeTextHumanLike:
+    """Tests for type_text_human_like dispatch."""
+
+    def test_urgent_mode_keeps_stop_hooks(self, mocker):
+        """Test that URGENT_MODE typing still goes through HumanTypist's hooks."""
+        mocker.patch("src.utils.typing_engine.get_config", return_value=True)
+        on_press = mocker.patch("keyboard.on_press_key")
+        mocker.patch("keyboard.unhook")
+        send_char = mocker.patch("src.utils.typing_engine._send_char")
+        mocker.patch("src.utils.typing_engine._send_vk")
+
+        from src.utils.desktop_manager import _get_typist, type_text_human_like
+
+        _get_typist.cache_clear()
+        type_text_human_like("hello urgent world")
+
+        hooked = [c.args[0] for c in on_press.call_args_list]
+        assert "9" in hooked and "backspace" in hooked
+        assert [c.args[0] for c in send_char.call_args_list] == [
+            "hello", " ", "urgent", " ", "world"
+        ]
+        _get_typist.cache_clear()
+
+    def test_normal_mode_uses_human_typist(self, mocker):
+        """Test that the human simulation runs with the requested settings."""
+        typist = mocker.patch("src.utils.desktop_manager.HumanTypist")
+
+        from src.utils.desktop_manager import _get_typist, type_text_human_like
+
+        _get_typist.cache_clear()
+        type_text_human_like("hello", min_wpm=40, max_wpm=60, error_rate=0.0)
+
+        typist.assert_called_once_with(min_wpm=40, max_wpm=60, error_rate=0.0)
+        typist.return_value.type_text.assert_called_once_with("hello")
+        _get_typist.cache_clear()
+
+    def test_typist_reused_for_same_settings(self, mocker):
+        """Test that repeated calls with the same settings share one HumanTypist."""
+        typist = mocker.patch("src.utils.desktop_manager.HumanTypist")
+
+        from src.utils.desktop_manager import _get_typist, type_text_human_like
+
+        _get_typist.cache_clear()
+        type_text_human_like("one", min_wpm=40, max_wpm=60)
+        type_text_human_like("two", min_wpm=40, max_wpm=60)
+        type_text_human_like("three", min_wpm=50, max_wpm=60)
+
+        assert typist.call_count == 2
+        _get_typist.cache_clear()
+
+    def test_urgent_mode_change_rebuilds_typist(self, mocker):
+        """Test that toggling URGENT_MODE drops the cached HumanTypist."""
+        typist = mocker.patch("src.utils.desktop_manager.HumanTypist")
+
+        from src.runtime_config import runtime_config
+        from src.utils.desktop_manager import _get_typist, type_text_human_like
+
+        _get_typist.cache_clear()
+        type_text_human_like("one", min_wpm=40, max_wpm=60)
+        for callback in runtime_config._callbacks["URGENT_MODE"]:
+            if callback.__module__ == "src.utils.desktop_manager":
+                callback("URGENT_MODE", False, True)
+        type_text_human_like("two", min_wpm=40, max_wpm=60)
+
+        assert typist.call_count == 2
+        _get_typist.cache_clear()
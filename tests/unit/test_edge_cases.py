@@ -404,7 +404,7 @@ class TestMainWorkflowEdgeCases:
 
         mock_sct_img = MagicMock()
         mock_sct_img.size = (1920, 1080)
-        mock_sct_img.bgra = b"\x00" * (1920 * 1080 * 4)
+        mock_sct_img.raw = bytearray(1920 * 1080 * 4)
         mock_enter.grab.return_value = mock_sct_img
         mock_enter.monitors = [
             {},
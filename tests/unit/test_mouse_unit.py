@@ -79,6 +79,64 @@ class TestHumanLikeMove:
         
         assert mock_pyautogui.moveTo.called
 
+    def test_short_move_skips_style_selection(self, mock_pyautogui, mocker):
+        """Test that a move under SHORT_MOVE_DISTANCE goes straight to the target."""
+        mocker.patch("time.sleep")
+        pick = mocker.patch("src.utils.mouse._pick_style")
+
+        from src.utils.mouse import human_like_move
+
+        human_like_move(510, 510)
+
+        pick.assert_not_called()
+        assert mock_pyautogui.moveTo.call_args.args == (510, 510)
+
+    def test_repeated_pixels_dispatch_once(self, mock_pyautogui, mocker):
+        """Test that points rounding to the same pixel only move the cursor once."""
+        import numpy as np
+
+        now = [0.0]
+        mocker.patch("time.perf_counter", side_effect=lambda: now[0])
+        mocker.patch("time.sleep", side_effect=lambda s: now.__setitem__(0, now[0] + s))
+        mocker.patch("src.utils.mouse._pick_style", return_value="smooth_direct")
+        mocker.patch.dict("src.utils.mouse._PATH_GENERATORS", {
+            "smooth_direct": MagicMock(
+                return_value=np.array([[0, 0], [0.2, 0.1], [5, 5], [5, 5]], dtype=float)
+            ),
+        })
+
+        from src.utils.mouse import human_like_move
+
+        human_like_move(100, 100, duration=0.1)
+
+        moves = [c.args for c in mock_pyautogui.moveTo.call_args_list]
+        assert moves == [(0, 0), (5, 5), (100, 100)]
+        # Skipped points still count towards the requested duration
+        assert now[0] == pytest.approx(0.1)
+
+    def test_late_points_are_coalesced(self, mock_pyautogui, mocker):
+        """Test that points the loop is already a full step late for are skipped."""
+        import numpy as np
+
+        now = [0.0]
+        mocker.patch("time.perf_counter", side_effect=lambda: now[0])
+        mocker.patch("time.sleep", side_effect=lambda s: now.__setitem__(0, now[0] + s))
+        # Every dispatch takes 3.5 steps' worth of time
+        mock_pyautogui.moveTo.side_effect = lambda *a, **k: now.__setitem__(0, now[0] + 0.035)
+        mocker.patch("src.utils.mouse._pick_style", return_value="smooth_direct")
+        mocker.patch.dict("src.utils.mouse._PATH_GENERATORS", {
+            "smooth_direct": MagicMock(
+                return_value=np.array([[i, i] for i in range(6)], dtype=float)
+            ),
+        })
+
+        from src.utils.mouse import human_like_move
+
+        human_like_move(100, 100, duration=0.06)
+
+        moves = [c.args for c in mock_pyautogui.moveTo.call_args_list]
+        assert moves == [(0, 0), (3, 3), (100, 100)]
+
 
 class TestClickAt:
     """Tests for click_at function."""
@@ -120,6 +178,19 @@ class TestClickAt:
                 button = call_kwargs.kwargs.get("button", "left")
                 assert button == "left"
 
+    def test_click_presses_and_releases_left(self, mock_pyautogui, mocker):
+        """Test that the fallback backend sends a left down/up pair."""
+        mocker.patch("time.sleep")
+        mocker.patch("src.utils.mouse.human_like_move")
+        mocker.patch("random.random", return_value=0.99)
+
+        from src.utils.mouse import click_at
+
+        click_at(800, 600)
+
+        mock_pyautogui.mouseDown.assert_called_once_with(button='left', _pause=False)
+        mock_pyautogui.mouseUp.assert_called_once_with(button='left', _pause=False)
+
 
 class TestMoveAwayFromOptions:
     """Tests for move_away_from_options function."""
@@ -131,7 +202,10 @@ class TestMoveAwayFromOptions:
         mock.position.return_value = (500, 500)
         mock.size.return_value = (1920, 1080)
         mocker.patch("src.utils.mouse.pyautogui", mock)
-        return mock
+        from src.utils.mouse import _screen_size
+        _screen_size.cache_clear()
+        yield mock
+        _screen_size.cache_clear()
 
     def test_moves_to_safe_position(self, mock_pyautogui, mocker):
         """Test that mouse moves to a safe position."""
@@ -143,6 +217,17 @@ class TestMoveAwayFromOptions:
         
         assert mock_pyautogui.moveTo.called
 
+    def test_screen_size_queried_once(self, mock_pyautogui, mocker):
+        """Test that repeated moves reuse the cached screen size."""
+        mocker.patch("time.sleep")
+
+        from src.utils.mouse import move_away_from_options
+
+        move_away_from_options()
+        move_away_from_options()
+
+        mock_pyautogui.size.assert_called_once()
+
 
 class TestPathGenerationFunctions:
     """Tests for path generation helper functions."""
@@ -200,6 +285,17 @@ class TestPathGenerationFunctions:
         assert mouse_module._ease_in_out_cubic(0) == 0
         assert mouse_module._ease_in_out_cubic(1) == 1
 
+    def test_eased_table_is_shared_and_read_only(self):
+        """Test that easing tables are built once per step count and cannot be mutated."""
+        import src.utils.mouse as mouse_module
+
+        table = mouse_module._eased(mouse_module._smoother_step, 40)
+
+        assert table is mouse_module._eased(mouse_module._smoother_step, 40)
+        assert table[0] == 0 and table[-1] == 1 and len(table) == 41
+        with pytest.raises(ValueError):
+            table[0] = 0.5
+
 
 class TestPathGeneration:
     """Tests for path generation algorithms."""
@@ -271,6 +367,25 @@ class TestPathGeneration:
         
         assert len(path) == steps
 
+    @pytest.mark.parametrize("generator", [
+        "_generate_smooth_path_direct",
+        "_generate_gentle_arc_path",
+        "_generate_s_curve_path",
+        "_generate_lazy_drift_path",
+        "_generate_quick_snap_path",
+        "_generate_hesitant_path",
+        "_generate_overshoot_path",
+        "_generate_two_phase_path",
+    ])
+    def test_path_is_point_array_ending_at_target(self, generator):
+        """Test that every generator returns an (n, 2) array ending on the target."""
+        import src.utils.mouse as mouse_module
+
+        path = getattr(mouse_module, generator)((0, 0), (300, 200), 60)
+
+        assert path.ndim == 2 and path.shape[1] == 2
+        assert path[-1].tolist() == pytest.approx([300, 200])
+
 
 class TestFatigueFactor:
     """Tests for fatigue simulation."""
@@ -351,6 +466,21 @@ class TestWeightedChoice:
         c_count = results.count("c")
         assert c_count > 50  # Should be at least half
 
+    def test_every_style_has_a_generator(self):
+        """Test that each MOVEMENT_STYLES key dispatches to its own path generator."""
+        import src.utils.mouse as mouse_module
+
+        assert set(mouse_module._PATH_GENERATORS) == set(mouse_module.MOVEMENT_STYLES)
+
+    def test_pick_style_returns_known_style(self):
+        """Test that the precomputed style picker yields MOVEMENT_STYLES keys."""
+        import src.utils.mouse as mouse_module
+        
+        styles = {mouse_module._pick_style() for _ in range(200)}
+        
+        assert styles <= set(mouse_module.MOVEMENT_STYLES)
+        assert mouse_module._STYLE_CUM_WEIGHTS[-1] == sum(mouse_module.MOVEMENT_STYLES.values())
+
 
 class TestMovementBehaviorConstants:
     """Tests for movement behavior constants."""
@@ -263,14 +263,17 @@ class TestConfigValues:
 class TestGetAll:
     """Tests for get_all configuration function."""
 
-    def test_get_all_returns_dict(self, mocker):
-        """Test that get_all returns a dictionary."""
+    def test_get_all_returns_mapping(self, mocker):
+        """Test that get_all returns a read-only mapping."""
+        from collections.abc import Mapping
         from src.runtime_config import RuntimeConfig
         
         instance = RuntimeConfig()
         result = instance.get_all()
         
-        assert isinstance(result, dict)
+        assert isinstance(result, Mapping)
+        with pytest.raises(TypeError):
+            result["URGENT_MODE"] = True
 
     def test_get_all_contains_expected_keys(self, mocker):
         """Test that get_all contains expected configuration keys."""
@@ -283,4 +286,104 @@ class TestGetAll:
         expected_keys = ["HOTKEY_DELAY", "URGENT_MODE", "MANUAL_MODE"]
         for key in expected_keys:
             # Just verify the method works, exact keys depend on environment
-            assert isinstance(result, dict)
+            assert key in result
+
+
+class TestFastPathAccessors:
+    """Tests for the dict-bound get/get_all fast path."""
+
+    def test_get_reflects_reload(self):
+        """Test that the bound accessor sees values written by later loads."""
+        from src.runtime_config import runtime_config
+
+        runtime_config._config["_FAST_PATH_PROBE"] = 1
+        try:
+            assert runtime_config.get("_FAST_PATH_PROBE") == 1
+            runtime_config._config["_FAST_PATH_PROBE"] = 2
+            assert runtime_config.get("_FAST_PATH_PROBE") == 2
+            assert runtime_config.get_all()["_FAST_PATH_PROBE"] == 2
+        finally:
+            del runtime_config._config["_FAST_PATH_PROBE"]
+
+
+class TestChangeWatcher:
+    """Tests for the .env change watcher fallback."""
+
+    def test_watcher_unavailable_off_windows(self, mocker):
+        """Test that start_watching declines off Windows and polling stays active."""
+        from src.runtime_config import runtime_config
+
+        mocker.patch("src.runtime_config.os.name", "posix")
+        poll = mocker.patch.object(runtime_config, "_reload_if_modified", return_value=True)
+
+        assert runtime_config.start_watching() is False
+        assert runtime_config.check_and_reload_if_changed() is True
+        poll.assert_called_once()
+
+    def test_polling_skipped_while_watching(self, mocker):
+        """Test that check_and_reload_if_changed is a no-op while the watcher runs."""
+        from src.runtime_config import runtime_config
+
+        mocker.patch.object(runtime_config, "_watch_thread", MagicMock())
+        poll = mocker.patch.object(runtime_config, "_reload_if_modified")
+
+        assert runtime_config.check_and_reload_if_changed() is False
+        poll.assert_not_called()
+
+
+class TestReloadDiff:
+    """Tests for change detection on reload."""
+
+    def test_callback_fires_only_on_change(self, mocker, monkeypatch):
+        """Test that reload reports and dispatches only real changes."""
+        from src.runtime_config import runtime_config
+
+        mocker.patch.object(runtime_config, "_env_path", None)
+        callback = MagicMock()
+        runtime_config.register_callback("POLL_INTERVAL_MAX", callback)
+        try:
+            monkeypatch.setenv("POLL_INTERVAL_MAX", "77")
+            old_value = runtime_config.get("POLL_INTERVAL_MAX")
+
+            assert runtime_config.reload() is True
+            callback.assert_called_once_with("POLL_INTERVAL_MAX", old_value, 77)
+            assert runtime_config.get("POLL_INTERVAL_MAX") == 77
+
+            assert runtime_config.reload() is False
+            callback.assert_called_once()
+        finally:
+            runtime_config.unregister_callback("POLL_INTERVAL_MAX", callback)
+            monkeypatch.undo()
+            runtime_config.reload()
+
+    def test_concurrent_reloads_are_serialized(self, mocker):
+        """Test that a second reload waits for an in-flight one to finish."""
+        from src.runtime_config import runtime_config
+
+        entered = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def blocking_mod_time():
+            calls.append(1)
+            if len(calls) == 1:
+                entered.set()
+                release.wait(5)
+            return None
+
+        mocker.patch.object(runtime_config, "_env_mod_time", side_effect=blocking_mod_time)
+
+        first = threading.Thread(target=runtime_config.reload)
+        second = threading.Thread(target=runtime_config.reload)
+        first.start()
+        assert entered.wait(5)
+        second.start()
+        second.join(0.2)
+        try:
+            assert second.is_alive()
+            assert len(calls) == 1
+        finally:
+            release.set()
+            first.join(5)
+            second.join(5)
+        assert len(calls) == 2
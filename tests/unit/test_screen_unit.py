@@ -100,6 +100,16 @@ class TestPreprocessImageForOCR:
         grayscale = result[1]
         assert grayscale.mode == 'L' or len(np.array(grayscale).shape) == 2
 
+    def test_inverted_is_complement_of_threshold(self, test_image):
+        """Test that building the inverted variant leaves the threshold variant intact."""
+        from src.utils.screen import preprocess_image_for_ocr
+
+        result = preprocess_image_for_ocr(test_image)
+
+        thresh = np.array(result[2])
+        assert thresh[50, 50] == 255 and thresh[0, 0] == 0
+        assert np.array_equal(np.array(result[3]), 255 - thresh)
+
 
 class TestFindTextCoordinates:
     """Tests for find_text_coordinates function."""
@@ -150,9 +160,65 @@ class TestFindTextCoordinates:
         from src.utils.screen import find_text_coordinates
         
         result = find_text_coordinates(test_image, "Test")
-        
+
         assert result is None
 
+    def test_find_many_shares_ocr_pass(self, mock_tesseract, test_image):
+        """Test that several targets are matched against one OCR pass."""
+        from src.utils.screen import find_text_coordinates_many
+
+        result = find_text_coordinates_many(test_image, ["Hello", "World", ""])
+
+        assert result == [(25, 20), (70, 20), None]
+        assert mock_tesseract.image_to_data.call_count == 1
+
+    def test_perfect_raw_match_skips_preprocessing(self, mock_tesseract, test_image, mocker):
+        """Test that the OpenCV variants are never built when the raw image matches."""
+        cv2_mock = mocker.patch("src.utils.screen.cv2")
+
+        from src.utils.screen import find_text_coordinates
+
+        assert find_text_coordinates(test_image, "Hello") == (25, 20)
+        cv2_mock.cvtColor.assert_not_called()
+        cv2_mock.threshold.assert_not_called()
+
+    def test_fallback_variants_are_all_read(self, mock_tesseract, test_image):
+        """Test that an imperfect raw match sends the other three variants to OCR."""
+        from src.utils.screen import find_text_coordinates
+
+        find_text_coordinates(test_image, "Hello there")
+
+        assert mock_tesseract.image_to_data.call_count == 4
+
+    def test_large_image_is_downscaled_and_mapped_back(self, mock_tesseract, mocker):
+        """Test that OCR runs on a shrunk copy and coordinates return in full-size pixels."""
+        mocker.patch("src.utils.screen.OCR_MAX_DIMENSION", 50)
+
+        from src.utils.screen import find_text_coordinates
+
+        big_image = Image.fromarray(np.zeros((100, 200, 3), dtype=np.uint8))
+        result = find_text_coordinates(big_image, "Hello")
+
+        assert mock_tesseract.image_to_data.call_args.args[0].size == (50, 25)
+        assert result == (100, 80)
+
+    def test_ocr_words_filters_confidence_and_blanks(self, mock_tesseract):
+        """Test that non-positive confidences and blank tokens are dropped."""
+        mock_tesseract.image_to_data.return_value = {
+            "text": ["", "Keep", "Drop", "  ", "Also"],
+            "conf": ["-1", "91.5", 0, 50, 12],
+            "left": [0, 1, 2, 3, 4],
+            "top": [0, 0, 0, 0, 0],
+            "width": [5, 5, 5, 5, 5],
+            "height": [5, 5, 5, 5, 5],
+        }
+
+        from src.utils.screen import _ocr_words
+
+        words = _ocr_words(MagicMock())
+
+        assert [(w["text"], w["left"]) for w in words] == [("Keep", 1), ("Also", 4)]
+
 
 class TestTesseractDetection:
     """Tests for Tesseract OCR detection."""
@@ -247,6 +313,18 @@ class TestSequenceMatching:
         # Fuzzy matching should work (depends on threshold)
         assert result is None or isinstance(result, tuple)
 
+    def test_window_ratio_scores_typo_below_exact(self):
+        """Test that a one-word typo scores below a perfect window match."""
+        from src.utils.screen import _best_window
+
+        words = [{"text": t} for t in ["The", "quick", "brown", "fox"]]
+
+        ratio, window = _best_window(words, ["quick", "brown"], "Raw", 0.0)
+        assert ratio == 1.0 and [w["text"] for w in window] == ["quick", "brown"]
+
+        ratio, _ = _best_window(words, ["quik", "brown"], "Raw", 0.0)
+        assert ratio == 0.5
+
 
 class TestConfidenceThreshold:
     """Tests for OCR confidence threshold handling."""
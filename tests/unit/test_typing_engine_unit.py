@@ -18,6 +18,7 @@ Test Coverage:
 - Emergency stop functionality
 """
 
+import sys
 import time
 from unittest.mock import MagicMock, patch, call
 
@@ -217,6 +218,20 @@ class TestPause:
         
         assert typist._paused is False
 
+    def test_emergency_stop_releases_pause(self, typist):
+        """Test that a stop wakes a typing thread blocked on pause."""
+        import threading
+
+        typist._toggle_pause(MagicMock())
+        waiter = threading.Thread(target=typist._wait_if_paused)
+        waiter.start()
+
+        typist._emergency_stop(MagicMock())
+        waiter.join(timeout=1)
+
+        assert not waiter.is_alive()
+        assert typist.stopped is True
+
 
 class TestTypeText:
     """Tests for type_text method."""
@@ -261,6 +276,40 @@ class TestTypeText:
         # Should stop immediately or after first check
         assert mock_send_char.call_count <= 1
 
+    def test_overlapping_call_keeps_running_session_state(self, typist, mocker):
+        """Test that a second type_text on a shared typist cannot undo an emergency stop."""
+        import threading
+
+        mocker.patch("time.sleep")
+        mocker.patch("keyboard.unhook")
+        mocker.patch("src.utils.typing_engine._send_vk")
+        typist.error_rate = 0.0
+        started = threading.Event()
+        release = threading.Event()
+        typed = []
+
+        def send_char(text):
+            typed.append(text)
+            if not started.is_set():
+                started.set()
+                release.wait(5)
+
+        mocker.patch("src.utils.typing_engine._send_char", side_effect=send_char)
+
+        first = threading.Thread(target=typist.type_text, args=("first session text",))
+        first.start()
+        assert started.wait(5)
+
+        typist._emergency_stop(None)
+        typist.type_text("second")
+        assert typist.stopped
+
+        release.set()
+        first.join(5)
+        assert not first.is_alive()
+        # Nothing past the first key (the word separator may still go out)
+        assert "".join(typed).strip() == "f"
+
 
 class TestSendChar:
     """Tests for character sending functions."""
@@ -279,6 +328,36 @@ class TestSendChar:
         
         assert callable(_send_vk)
 
+    def test_send_char_batches_string(self, mocker):
+        """Test that a run of characters goes out in one SendInput call."""
+        from src.utils import typing_engine
+
+        send_input = mocker.patch.object(typing_engine.user32, "SendInput", return_value=6)
+        typing_engine._send_char("a\U0001F600")
+
+        send_input.assert_called_once()
+        count, arr, _size = send_input.call_args.args
+        assert count == 6
+        assert [e.ii.ki.wScan for e in arr] == [97, 97, 0xD83D, 0xD83D, 0xDE00, 0xDE00]
+        assert [e.ii.ki.dwFlags for e in arr[:2]] == [
+            typing_engine.KEYEVENTF_UNICODE,
+            typing_engine.KEYEVENTF_UNICODE | typing_engine.KEYEVENTF_KEYUP,
+        ]
+
+    def test_urgent_mode_sends_word_at_once(self, mocker):
+        """Test that URGENT_MODE types each word with a single send."""
+        mocker.patch("keyboard.on_press_key")
+        mocker.patch("src.utils.typing_engine.get_config", return_value=True)
+        mock_send_char = mocker.patch("src.utils.typing_engine._send_char")
+        sleep = mocker.patch("time.sleep")
+
+        from src.utils.typing_engine import HumanTypist
+
+        HumanTypist()._type_word("hello", 100)
+
+        mock_send_char.assert_called_once_with("hello")
+        sleep.assert_not_called()
+
 
 class TestTypoSimulation:
     """Tests for typo simulation."""
@@ -344,6 +423,22 @@ class TestTypingConstants:
         
         assert KEYEVENTF_UNICODE == 0x0004
 
+    def test_input_union_sized_for_mouseinput(self):
+        """Test that INPUT_I is as large as MOUSEINPUT, its largest Win32 member."""
+        import ctypes
+        from src.utils.typing_engine import INPUT_I, MOUSEINPUT
+
+        assert ctypes.sizeof(INPUT_I) == ctypes.sizeof(MOUSEINPUT)
+
+    @pytest.mark.skipif(sys.platform != "win32", reason="Win32 type widths")
+    def test_input_matches_win32_size(self):
+        """Test that sizeof(INPUT) is what SendInput expects as cbSize."""
+        import ctypes
+        from src.utils.typing_engine import INPUT
+
+        expected = 40 if ctypes.sizeof(ctypes.c_void_p) == 8 else 28
+        assert ctypes.sizeof(INPUT) == expected
+
     def test_keyeventf_keyup_constant(self):
         """Test KEYEVENTF_KEYUP constant exists."""
         from src.utils.typing_engine import KEYEVENTF_KEYUP
@@ -0,0 +1,223 @@
+"""
+Unit Tests for Updater Module
+==============================
+
+Tests for src/updater.py including:
+- Remote version parsing
+- Release checksum lookup
+- Binary download verification
+- Git source update check
+
+Test Coverage:
+- get_remote_version
+- _version_tuple
+- get_expected_sha256
+- update_binary
+- update_source_code
+"""
+
+import hashlib
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+
+PAYLOAD = b"fake exe bytes" * 1000
+
+
+def _release_response(payload=PAYLOAD):
+    response = MagicMock()
+    response.status_code = 200
+    response.raw = io.BytesIO(payload)
+    return response
+
+
+def _checksum_response(text, status_code=200, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = text
+    response.headers = headers or {}
+    return response
+
+
+class TestRemoteVersion:
+    """Tests for get_remote_version."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ('VERSION = "1.2.3"\n', "1.2.3"),
+        ("# header\n  VERSION='2.0.0'\n", "2.0.0"),
+        ("NOT_VERSION = 1\n", None),
+    ])
+    def test_parses_version_file(self, mocker, text, expected):
+        """Test that the VERSION assignment is extracted."""
+        from src import updater
+
+        mocker.patch("src.updater._SESSION.get", return_value=_checksum_response(text))
+
+        assert updater.get_remote_version() == expected
+
+    def test_unchanged_file_served_from_etag_cache(self, mocker):
+        """Test that a 304 reuses the last parsed version."""
+        from src import updater
+
+        mocker.patch.object(updater, "_version_etag", None)
+        mocker.patch.object(updater, "_cached_remote_version", None)
+        get = mocker.patch("src.updater._SESSION.get", side_effect=[
+            _checksum_response('VERSION = "3.1.4"\n', headers={"ETag": '"abc"'}),
+            _checksum_response("", 304),
+        ])
+
+        assert updater.get_remote_version() == "3.1.4"
+        assert updater.get_remote_version() == "3.1.4"
+        assert get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+
+
+class TestVersionCompare:
+    """Tests for numeric version comparison."""
+
+    @pytest.mark.parametrize("newer,older", [
+        ("1.10.0", "1.9.0"),
+        ("2.0", "1.99.99"),
+        ("v1.0.1", "1.0.0"),
+    ])
+    def test_numeric_ordering(self, newer, older):
+        """Test that components compare as integers, not strings."""
+        from src.updater import _version_tuple
+
+        assert _version_tuple(newer) > _version_tuple(older)
+
+    def test_unparseable_version_sorts_lowest(self):
+        """Test that a garbled remote version never counts as newer."""
+        from src.updater import _version_tuple
+
+        assert _version_tuple("garbage") < _version_tuple("0.0.1")
+
+
+class TestExpectedChecksum:
+    """Tests for get_expected_sha256."""
+
+    def test_parses_sha256sum_format(self, mocker):
+        """Test that '<digest>  <name>' yields the digest."""
+        from src import updater
+
+        digest = "A" * 64
+        mocker.patch("src.updater._SESSION.get", return_value=_checksum_response(f"{digest}  Scry.exe\n"))
+
+        assert updater.get_expected_sha256() == digest.lower()
+
+    def test_missing_asset_returns_none(self, mocker):
+        """Test that a 404 means no checksum."""
+        from src import updater
+
+        mocker.patch("src.updater._SESSION.get", return_value=_checksum_response("Not Found", 404))
+
+        assert updater.get_expected_sha256() is None
+
+
+class TestUpdateBinary:
+    """Tests for update_binary download verification."""
+
+    @pytest.fixture
+    def workdir(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    def test_checksum_mismatch_aborts(self, mocker, workdir):
+        """Test that a corrupted download is discarded before the swap."""
+        from src import updater
+
+        mocker.patch("src.updater._SESSION.get", return_value=_release_response())
+        mocker.patch("src.updater.get_expected_sha256", return_value="0" * 64)
+        popen = mocker.patch("src.updater.subprocess.Popen")
+
+        assert updater.update_binary("9.9.9") is False
+        assert not (workdir / "Scry_new.exe").exists()
+        popen.assert_not_called()
+
+    def test_matching_checksum_swaps_in_place(self, mocker, workdir):
+        """Test that a verified download replaces the exe and relaunches it."""
+        from src import updater
+
+        current_exe = workdir / "Scry.exe"
+        current_exe.write_bytes(b"old exe")
+        mocker.patch("src.updater.sys.executable", str(current_exe))
+        mocker.patch("src.updater._SESSION.get", return_value=_release_response())
+        mocker.patch(
+            "src.updater.get_expected_sha256",
+            return_value=hashlib.sha256(PAYLOAD).hexdigest(),
+        )
+        popen = mocker.patch("src.updater.subprocess.Popen")
+        mocker.patch("src.updater.subprocess.CREATE_NO_WINDOW", 0, create=True)
+        exit_mock = mocker.patch("src.updater.sys.exit")
+
+        updater.update_binary("9.9.9")
+
+        assert current_exe.read_bytes() == PAYLOAD
+        assert (workdir / "Scry.exe.old").read_bytes() == b"old exe"
+        assert not (workdir / "Scry_new.exe").exists()
+        assert popen.call_args.args[0][0] == str(current_exe)
+        exit_mock.assert_called_once_with(0)
+
+    def test_failed_swap_falls_back_to_script(self, mocker, workdir):
+        """Test that the batch script is used when the exe cannot be renamed."""
+        from src import updater
+
+        mocker.patch("src.updater.sys.executable", str(workdir / "missing.exe"))
+        mocker.patch("src.updater._SESSION.get", return_value=_release_response())
+        mocker.patch("src.updater.get_expected_sha256", return_value=None)
+        popen = mocker.patch("src.updater.subprocess.Popen")
+        mocker.patch("src.updater.subprocess.CREATE_NO_WINDOW", 0, create=True)
+        mocker.patch("src.updater.sys.exit")
+
+        updater.update_binary("9.9.9")
+
+        assert (workdir / "Scry_new.exe").read_bytes() == PAYLOAD
+        assert (workdir / "update_swap.bat").exists()
+        assert popen.call_args.args[0] == "update_swap.bat"
+
+
+class TestUpdateSourceCode:
+    """Tests for the git-based source update check."""
+
+    @pytest.fixture
+    def git(self, mocker):
+        mocker.patch("src.updater.subprocess.check_call")
+        mocker.patch("src.updater._fetched_recently", return_value=False)
+        return mocker.patch("src.updater.subprocess.check_output")
+
+    def test_up_to_date_skips_pull(self, mocker, git):
+        """Test that zero upstream commits means no pull."""
+        from src import updater
+
+        git.return_value = b"0\n"
+        restart = mocker.patch("src.updater.restart_application")
+
+        assert updater.update_source_code() is False
+        git.assert_called_once_with(["git", "rev-list", "--count", "HEAD..@{u}"])
+        assert ["git", "pull"] not in [c.args[0] for c in updater.subprocess.check_call.call_args_list]
+        restart.assert_not_called()
+
+    def test_behind_pulls_and_restarts(self, mocker, git, tmp_path, monkeypatch):
+        """Test that upstream commits trigger a pull and restart."""
+        from src import updater
+
+        monkeypatch.chdir(tmp_path)
+        git.return_value = b"3\n"
+        restart = mocker.patch("src.updater.restart_application")
+
+        assert updater.update_source_code() is True
+        assert ["git", "pull"] in [c.args[0] for c in updater.subprocess.check_call.call_args_list]
+        restart.assert_called_once()
+
+    def test_recent_fetch_is_skipped(self, mocker, git):
+        """Test that a fetch made within the window is not repeated."""
+        from src import updater
+
+        mocker.patch("src.updater._fetched_recently", return_value=True)
+        git.return_value = b"0\n"
+
+        updater.update_source_code()
+
+        calls = [c.args[0] for c in updater.subprocess.check_call.call_args_list]
+        assert ["git", "fetch", "origin"] not in calls
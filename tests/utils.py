@@ -116,7 +116,7 @@ class ScreenCaptureFactory:
         """Create a mock screenshot image."""
         mock_img = MagicMock()
         mock_img.size = (self.width, self.height)
-        mock_img.bgra = b"\x00" * (self.width * self.height * 4)
+        mock_img.raw = bytearray(self.width * self.height * 4)
         return mock_img
     
     def create_mock_mss_context(self) -> MagicMock: